@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Optional
 
 from flask import Flask
 from flask_cors import CORS
@@ -8,6 +9,7 @@ from loguru import logger
 from apps.server.routes.api import create_api_blueprint
 from apps.server.routes.web import create_web_blueprint
 from apps.server.services.game_data_receiver import GameDataReceiver
+from apps.server.services.range_equity_service import RangeEquityService
 from apps.server.services.server_game_state import ServerGameStateService
 
 
@@ -18,6 +20,7 @@ def create_app(
     show_solver_link=True,
     require_password=False,
     password="_test_password_",
+    range_equity_service: Optional[RangeEquityService] = None,
 ):
     current_path = Path(__file__).resolve().parent
     template_dir = current_path / "web" / "templates"
@@ -40,7 +43,7 @@ def create_app(
     app.secret_key = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
     CORS(app, origins="*")
 
-    game_state_service = ServerGameStateService()
+    game_state_service = ServerGameStateService(range_equity_service)
     game_data_receiver = GameDataReceiver(game_state_service)
 
     app.extensions["game_state_service"] = game_state_service
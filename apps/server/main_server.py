@@ -6,6 +6,7 @@ from loguru import logger
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from apps.server import create_app
+from apps.server.services.range_equity_service import RangeEquityService
 
 load_dotenv()
 
@@ -32,13 +33,19 @@ def main():
     logger.info(f"👥 Maximum concurrent clients: {MAX_CLIENTS}")
 
     try:
+        # Postflop equity against a range, computed off the request threads (RANGE_EQUITY_* settings)
+        range_equity_service = RangeEquityService.from_env()
+        if range_equity_service:
+            atexit.register(range_equity_service.shutdown)
+
         app = create_app(
             show_table_cards=SHOW_TABLE_CARDS,
             show_positions=SHOW_POSITIONS,
             show_moves=SHOW_MOVES,
             show_solver_link=SHOW_SOLVER_LINK,
             require_password=REQUIRE_PASSWORD,
-            password=PASSWORD
+            password=PASSWORD,
+            range_equity_service=range_equity_service
         )
 
         # Setup periodic cleanup of stale tables
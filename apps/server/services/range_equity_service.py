@@ -0,0 +1,348 @@
+import json
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from itertools import chain, combinations, permutations
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from apps.shared.domain.hand_evaluator import DECK_SIZE, best_omaha_scores, encode_cards
+from apps.shared.domain.starting_hands import load_hand_equities
+
+ANY_HAND_RANGE = 'any'
+TOP_RANGE_PREFIX = 'top'
+
+# (sorted board, sorted hero hand, range id) after the suit renaming that makes it smallest
+RangeEquityKey = Tuple[Tuple[int, ...], Tuple[int, ...], str]
+
+SUIT_PERMUTATIONS = list(permutations(range(4)))
+
+
+@dataclass
+class RangeEquityResult:
+    equity: float  # Share of the pot won on average, ties split
+    win: float
+    tie: float
+    range_id: str
+    samples: int
+    exact: bool  # Every hand of the range was evaluated (river), not a sample
+    elapsed_ms: float
+
+    def to_dict(self) -> Dict:
+        result = {key: round(value, 4) if isinstance(value, float) else value for key, value in asdict(self).items()}
+        result['status'] = 'done'
+        return result
+
+
+@dataclass
+class RangeEquityStats:
+    submitted: int
+    cache_hits: int
+    completed: int
+    cancelled: int
+    running: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.submitted if self.submitted else 0.0
+
+
+def canonical_key(hero: Sequence[int], board: Sequence[int], range_id: str) -> RangeEquityKey:
+    """
+    Cache key of a spot, equal for spots that differ only by renaming suits
+    (ranges are built from suit-isomorphic starting hand classes, so they
+    are unchanged by the renaming).
+    """
+    return min(
+        (tuple(sorted((card >> 2) * 4 + permutation[card & 3] for card in board)),
+         tuple(sorted((card >> 2) * 4 + permutation[card & 3] for card in hero)),
+         range_id)
+        for permutation in SUIT_PERMUTATIONS
+    )
+
+
+@lru_cache(maxsize=8)
+def range_hands(range_id: str) -> np.ndarray:
+    """
+    Opponent hands (N, 4) of a range: 'any' for every starting hand, or
+    'top<N>' for the strongest N% by the starting hand table's heads-up equity.
+    """
+    hands = np.fromiter(chain.from_iterable(combinations(range(DECK_SIZE), 4)), dtype=np.int8,
+                        count=4 * math.comb(DECK_SIZE, 4)).reshape(-1, 4)
+    if range_id == ANY_HAND_RANGE:
+        return hands
+    if not range_id.startswith(TOP_RANGE_PREFIX):
+        raise ValueError(f"Unknown range: {range_id}")
+    percent = float(range_id[len(TOP_RANGE_PREFIX):])
+    if not 0 < percent <= 100:
+        raise ValueError(f"Unknown range: {range_id}")
+
+    # The table is indexed by colex index, the hands above are in lexicographic order
+    binomials = np.array([[math.comb(card, k + 1) for card in range(DECK_SIZE)] for k in range(4)])
+    indices = sum(binomials[k][hands[:, k]] for k in range(4))
+    equities = load_hand_equities()[indices]
+
+    strongest_first = np.argsort(-equities.astype(np.int64), kind='stable')
+    return hands[strongest_first[:max(1, round(len(hands) * percent / 100))]]
+
+
+def _live_hands(range_id: str, dead_cards: Sequence[int]) -> np.ndarray:
+    dead = np.zeros(DECK_SIZE, dtype=bool)
+    dead[list(dead_cards)] = True
+    hands = range_hands(range_id)
+    return hands[~dead[hands].any(axis=1)]
+
+
+def simulate_chunk(hero: Tuple[int, ...], board: Tuple[int, ...], range_id: str, samples: int, seed: int,
+                   start: int = 0, stop: int = 0) -> Tuple[int, int, float, int]:
+    """
+    (wins, ties, pot share, hands) of the hero against one part of the range.
+
+    On the river the hands ``start:stop`` of the live range are evaluated
+    exactly; earlier, ``samples`` opponent hands are drawn from the range
+    and each gets its own random runout.
+    """
+    hands = _live_hands(range_id, hero + board)
+    missing = 5 - len(board)
+    if missing == 0:
+        opponents = hands[start:stop].astype(np.intp)
+        boards = np.broadcast_to(np.array(board), (len(opponents), 5))
+    else:
+        rng = np.random.default_rng(seed)
+        opponents = hands[rng.integers(len(hands), size=samples)].astype(np.intp)
+        # Runout cards come from what the hero, the board and this opponent don't hold
+        keys = rng.random((samples, DECK_SIZE))
+        keys[:, list(hero + board)] = 2
+        keys[np.arange(samples)[:, None], opponents] = 2
+        runouts = keys.argsort(axis=1)[:, :missing]
+        boards = np.concatenate((np.broadcast_to(np.array(board, dtype=np.intp), (samples, len(board))), runouts),
+                                axis=1)
+
+    hero_scores = best_omaha_scores(np.array(hero), boards)
+    opponent_scores = best_omaha_scores(opponents, boards)
+    wins = int((hero_scores > opponent_scores).sum())
+    ties = int((hero_scores == opponent_scores).sum())
+    return wins, ties, wins + ties / 2, len(opponents)
+
+
+@dataclass
+class _Job:
+    key: RangeEquityKey
+    on_result: Callable[[Dict], None]
+    futures: List[Future]
+    started: float
+    pending: int = 0
+    wins: int = 0
+    ties: int = 0
+    shares: float = 0.0
+    hands: int = 0
+    cancelled: bool = False
+
+
+class RangeEquityService:
+    """
+    Hero equity against an opponent range, computed in a process pool.
+
+    A spot is split into chunks of ``chunk_samples`` hands that the pool's
+    workers simulate in parallel; results are cached in a bounded LRU under
+    a suit-isomorphic key, optionally persisted to ``cache_path`` as JSON.
+    Jobs are asynchronous: ``submit`` returns a cached result or a running
+    marker at once, and ``on_result`` gets the result when the chunks are
+    done. Each table has at most one job: a new spot cancels the old job's
+    chunks that have not started and drops the results of running ones.
+    """
+
+    def __init__(self, workers: int, range_id: str = 'top30', samples: int = 20000, chunk_samples: int = 2500,
+                 cache_size: int = 1024, cache_path: Optional[Path] = None):
+        range_hands(range_id)  # Fail on a bad range id here rather than in every worker
+        self.workers = workers
+        self.range_id = range_id
+        self.samples = samples
+        self.chunk_samples = chunk_samples
+        self.cache_size = cache_size
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        # spawn: the server process runs Flask and scheduler threads, which fork does not copy safely
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        self._lock = threading.Lock()
+        self._cache: 'OrderedDict[RangeEquityKey, Dict]' = OrderedDict()
+        self._jobs: Dict[Hashable, _Job] = {}
+
+        self._submitted = 0
+        self._cache_hits = 0
+        self._completed = 0
+        self._cancelled = 0
+
+        self._load_cache()
+
+    @classmethod
+    def from_env(cls) -> Optional['RangeEquityService']:
+        workers = int(os.getenv('RANGE_EQUITY_WORKERS', '0'))
+        if workers <= 0:
+            return None
+        service = cls(
+            workers,
+            range_id=os.getenv('RANGE_EQUITY_RANGE', 'top30'),
+            samples=int(os.getenv('RANGE_EQUITY_SAMPLES', '20000')),
+            cache_size=int(os.getenv('RANGE_EQUITY_CACHE_SIZE', '1024')),
+            cache_path=os.getenv('RANGE_EQUITY_CACHE_PATH') or None
+        )
+        logger.info(f"📐 Range equity service started with {workers} workers against {service.range_id}")
+        return service
+
+    def submit(self, table: Hashable, hero_cards: Sequence[str], board_cards: Sequence[str],
+               on_result: Callable[[Dict], None]) -> Dict:
+        """
+        Equity of ``table``'s spot: the cached result, or a running marker
+        while a job computes it and passes the result to ``on_result``.
+        """
+        hero = tuple(encode_cards(hero_cards))
+        board = tuple(encode_cards(board_cards))
+        if len(hero) != 4 or len(board) not in (3, 4, 5) or len(set(hero + board)) != len(hero) + len(board):
+            raise ValueError(f"Not a postflop spot: {list(hero_cards)} {list(board_cards)}")
+        key = canonical_key(hero, board, self.range_id)
+        running = {'status': 'running', 'range_id': self.range_id}
+
+        with self._lock:
+            self._submitted += 1
+            current = self._jobs.get(table)
+            if current is not None and current.key == key:
+                current.on_result = on_result  # The result belongs to the caller's latest state
+                return running
+
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                self._cancel_locked(table)
+                return cached
+
+            self._cancel_locked(table)
+            job = _Job(key, on_result, [], time.perf_counter())
+            self._jobs[table] = job
+            chunks = self._chunks(hero, board)
+            job.pending = len(chunks)
+
+        for chunk in chunks:
+            future = self._executor.submit(simulate_chunk, hero, board, self.range_id, *chunk)
+            job.futures.append(future)
+            future.add_done_callback(lambda done, table=table, job=job: self._on_chunk_done(table, job, done))
+        return running
+
+    def cancel(self, table: Hashable):
+        with self._lock:
+            self._cancel_locked(table)
+
+    def get_stats(self) -> RangeEquityStats:
+        with self._lock:
+            return RangeEquityStats(
+                submitted=self._submitted,
+                cache_hits=self._cache_hits,
+                completed=self._completed,
+                cancelled=self._cancelled,
+                running=len(self._jobs),
+                entries=len(self._cache),
+                max_entries=self.cache_size
+            )
+
+    def shutdown(self):
+        with self._lock:
+            for table in list(self._jobs):
+                self._cancel_locked(table)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"📐 Range equity service stopped: {self.get_stats()}")
+
+    def _chunks(self, hero: Tuple[int, ...], board: Tuple[int, ...]) -> List[Tuple[int, int, int, int]]:
+        """(samples, seed, start, stop) of every chunk of a spot."""
+        if len(board) == 5:
+            live = len(_live_hands(self.range_id, hero + board))
+            return [(0, 0, start, min(start + self.chunk_samples, live))
+                    for start in range(0, live, self.chunk_samples)]
+        seed = int.from_bytes(os.urandom(4), 'little')
+        return [(min(self.chunk_samples, self.samples - start), seed + start, 0, 0)
+                for start in range(0, self.samples, self.chunk_samples)]
+
+    def _cancel_locked(self, table: Hashable):
+        job = self._jobs.pop(table, None)
+        if job is None:
+            return
+        job.cancelled = True
+        self._cancelled += 1
+        for future in job.futures:
+            future.cancel()
+
+    def _on_chunk_done(self, table: Hashable, job: _Job, future: Future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        with self._lock:
+            if job.cancelled:
+                return
+            if error is not None:
+                logger.error(f"❌ Range equity job for {table} failed: {error}")
+                self._cancel_locked(table)
+                return
+
+            wins, ties, shares, hands = future.result()
+            job.wins += wins
+            job.ties += ties
+            job.shares += shares
+            job.hands += hands
+            job.pending -= 1
+            if job.pending:
+                return
+
+            self._jobs.pop(table, None)
+            self._completed += 1
+            result = RangeEquityResult(
+                equity=job.shares / job.hands if job.hands else 0.0,
+                win=job.wins / job.hands if job.hands else 0.0,
+                tie=job.ties / job.hands if job.hands else 0.0,
+                range_id=job.key[2],
+                samples=job.hands,
+                exact=len(job.key[0]) == 5,
+                elapsed_ms=(time.perf_counter() - job.started) * 1000
+            ).to_dict()
+            self._cache[job.key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        logger.info(f"📐 Range equity {result['equity']:.1%} vs {result['range_id']} for {table} "
+                    f"({result['samples']} hands, {result['elapsed_ms']:.0f}ms)")
+        self._save_cache()
+        job.on_result(result)
+
+    def _load_cache(self):
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            entries = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable range equity cache {self.cache_path}: {e}")
+            return
+        for (board, hero, range_id), result in entries[-self.cache_size:]:
+            self._cache[(tuple(board), tuple(hero), range_id)] = result
+        logger.info(f"📐 Loaded {len(self._cache)} range equity results from {self.cache_path}")
+
+    def _save_cache(self):
+        if self.cache_path is None:
+            return
+        with self._lock:
+            entries = [[[list(key[0]), list(key[1]), key[2]], result] for key, result in self._cache.items()]
+        temporary_path = self.cache_path.with_suffix('.tmp')
+        try:
+            temporary_path.write_text(json.dumps(entries))
+            temporary_path.replace(self.cache_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save range equity cache to {self.cache_path}: {e}")
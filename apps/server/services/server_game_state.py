@@ -1,15 +1,17 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 from loguru import logger
+from apps.server.services.range_equity_service import RangeEquityService
 from apps.shared.protocol.message_protocol import GameUpdateMessage
 
 
 class ServerGameStateService:
-    def __init__(self):
+    def __init__(self, range_equity_service: Optional[RangeEquityService] = None):
         # client_id -> window_name -> game_data_with_metadata
         self.client_states: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self.connected_clients: Dict[str, datetime] = {}
+        self.range_equity_service = range_equity_service
 
     def register_client(self, client_id: str) -> None:
         logger.info(f"Registering client {client_id}")
@@ -22,6 +24,9 @@ class ServerGameStateService:
         if client_id in self.connected_clients:
             del self.connected_clients[client_id]
         if client_id in self.client_states:
+            if self.range_equity_service:
+                for window_name in self.client_states[client_id]:
+                    self.range_equity_service.cancel((client_id, window_name))
             del self.client_states[client_id]
 
     def update_game_state(self, message: GameUpdateMessage) -> None:
@@ -39,6 +44,30 @@ class ServerGameStateService:
             'detection_interval': message.detection_interval,  # Include detection interval from message
             **message.game_data  # Include all game data fields
         }
+        if self.range_equity_service:
+            self._update_range_equity(client_id, window_name)
+
+    def _update_range_equity(self, client_id: str, window_name: str) -> None:
+        """Start the range equity job of a postflop table, or cancel the job once the table left postflop."""
+        table = (client_id, window_name)
+        state = self.client_states[client_id][window_name]
+        hero_cards = [card.get('name') for card in state.get('player_cards') or []]
+        board_cards = [card.get('name') for card in state.get('table_cards') or []]
+        if len(hero_cards) != 4 or len(board_cards) not in (3, 4, 5):
+            self.range_equity_service.cancel(table)
+            return
+
+        def store_result(result: Dict[str, Any]) -> None:
+            # Only the spot the job was for: a newer update cancels the job before replacing the state
+            current = self.client_states.get(client_id, {}).get(window_name)
+            if current is state:
+                state['range_equity'] = result
+
+        try:
+            state['range_equity'] = self.range_equity_service.submit(table, hero_cards, board_cards, store_result)
+        except ValueError as e:
+            logger.warning(f"⚠️ No range equity for {client_id}/{window_name}: {e}")
+            self.range_equity_service.cancel(table)
 
     def get_all_game_states(self) -> Dict[str, Any]:
         all_detections = []
@@ -67,6 +96,8 @@ class ServerGameStateService:
 
     def remove_client_window(self, client_id: str, window_name: str) -> bool:
         if client_id in self.client_states and window_name in self.client_states[client_id]:
+            if self.range_equity_service:
+                self.range_equity_service.cancel((client_id, window_name))
             del self.client_states[client_id][window_name]
             return True
         return False
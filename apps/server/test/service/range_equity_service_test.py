@@ -0,0 +1,129 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from apps.server.services.range_equity_service import RangeEquityService, _live_hands, canonical_key
+from apps.shared.domain.hand_evaluator import best_omaha_scores, encode_cards
+
+HERO = ['AS', 'AH', 'KD', 'QD']
+RIVER = ['2C', '7D', 'KH', 'JS', '9C']
+# HERO and RIVER with hearts and spades swapped, clubs and diamonds swapped
+RENAMED_HERO = ['AH', 'AS', 'KC', 'QC']
+RENAMED_RIVER = ['2D', '7C', 'KS', 'JH', '9D']
+
+
+class ResultCollector:
+
+    def __init__(self):
+        self.results = []
+        self.done = threading.Event()
+
+    def __call__(self, result):
+        self.results.append(result)
+        self.done.set()
+
+
+class TestCanonicalKey(unittest.TestCase):
+
+    def test_suit_renaming_gives_same_key(self):
+        key = canonical_key(encode_cards(HERO), encode_cards(RIVER), 'top30')
+
+        self.assertEqual(canonical_key(encode_cards(RENAMED_HERO), encode_cards(RENAMED_RIVER), 'top30'), key)
+        # Card order does not matter either
+        self.assertEqual(canonical_key(encode_cards(HERO[::-1]), encode_cards(RIVER[::-1]), 'top30'), key)
+
+    def test_different_spots_give_different_keys(self):
+        key = canonical_key(encode_cards(HERO), encode_cards(RIVER), 'top30')
+
+        # Suited kings on a board with a diamond are not the same as offsuit kings
+        self.assertNotEqual(canonical_key(encode_cards(['AS', 'AH', 'KD', 'QC']), encode_cards(RIVER), 'top30'), key)
+        self.assertNotEqual(canonical_key(encode_cards(HERO), encode_cards(RIVER[:3]), 'top30'), key)
+        self.assertNotEqual(canonical_key(encode_cards(HERO), encode_cards(RIVER), 'any'), key)
+
+
+class TestRangeEquityService(unittest.TestCase):
+
+    def setUp(self):
+        self.services = []
+
+    def tearDown(self):
+        for service in self.services:
+            service.shutdown()
+
+    def create_service(self, **kwargs) -> RangeEquityService:
+        service = RangeEquityService(workers=2, range_id='top1', **kwargs)
+        self.services.append(service)
+        return service
+
+    def test_river_enumerates_the_live_range_exactly(self):
+        service = self.create_service(chunk_samples=500)
+        collector = ResultCollector()
+
+        self.assertEqual(service.submit('table_1', HERO, RIVER, collector)['status'], 'running')
+        self.assertTrue(collector.done.wait(120))
+
+        hero, board = encode_cards(HERO), encode_cards(RIVER)
+        opponents = _live_hands('top1', hero + board).astype(np.intp)
+        boards = np.broadcast_to(np.array(board), (len(opponents), 5))
+        hero_scores = best_omaha_scores(np.array(hero), boards)
+        opponent_scores = best_omaha_scores(opponents, boards)
+        wins = (hero_scores > opponent_scores).sum()
+        ties = (hero_scores == opponent_scores).sum()
+
+        result = collector.results[0]
+        self.assertTrue(result['exact'])
+        self.assertEqual(result['samples'], len(opponents))
+        self.assertAlmostEqual(result['win'], wins / len(opponents), places=4)
+        self.assertAlmostEqual(result['equity'], (wins + ties / 2) / len(opponents), places=4)
+
+    def test_cancelled_jobs_never_deliver_results(self):
+        service = self.create_service(samples=100000, chunk_samples=2500)
+        replaced = ResultCollector()
+        cancelled = ResultCollector()
+        latest = ResultCollector()
+
+        service.submit('table_1', HERO, RIVER[:3], replaced)
+        service.submit('table_2', HERO, RIVER[:4], cancelled)
+        service.cancel('table_2')
+        # A new spot on the same table cancels the job of the old one
+        service.submit('table_1', HERO, RIVER, latest)
+        self.assertTrue(latest.done.wait(120))
+        # Let chunks that were already running when their job was cancelled finish
+        service._executor.shutdown(wait=True)
+
+        self.assertEqual(replaced.results, [])
+        self.assertEqual(cancelled.results, [])
+        self.assertEqual(len(latest.results), 1)
+        stats = service.get_stats()
+        self.assertEqual((stats.completed, stats.cancelled, stats.running), (1, 2, 0))
+
+    def test_results_persist_across_restarts(self):
+        cache_path = Path(tempfile.mkdtemp()) / "range_equity.json"
+        service = self.create_service(cache_path=cache_path)
+        collector = ResultCollector()
+
+        service.submit('table_1', HERO, RIVER, collector)
+        self.assertTrue(collector.done.wait(120))
+        self.assertEqual(len(json.loads(cache_path.read_text())), 1)
+
+        restarted = self.create_service(cache_path=cache_path)
+        cached = restarted.submit('table_1', RENAMED_HERO, RENAMED_RIVER, ResultCollector())
+
+        self.assertEqual(cached, collector.results[0])
+        self.assertEqual(restarted.get_stats().cache_hits, 1)
+
+    def test_unreadable_cache_is_ignored(self):
+        cache_path = Path(tempfile.mkdtemp()) / "range_equity.json"
+        cache_path.write_text("not json")
+
+        service = self.create_service(cache_path=cache_path)
+
+        self.assertEqual(service.get_stats().entries, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
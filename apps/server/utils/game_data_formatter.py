@@ -14,6 +14,9 @@ def format_game_data_for_web(game_data: Dict[str, Any]) -> Dict[str, Any]:
         'positions': _format_positions_for_web(game_data.get('positions', [])),
         'moves': game_data.get('moves', []),
         'street': game_data.get('street', 'unknown'),
+        'equity': game_data.get('equity'),
+        'starting_hand': game_data.get('starting_hand'),
+        'range_equity': game_data.get('range_equity'),
         'solver_link': game_data.get('solver_link'),
         'last_update': game_data.get('last_update', datetime.now().isoformat()),
         'detection_interval': game_data.get('detection_interval', 3)  # Include client detection interval
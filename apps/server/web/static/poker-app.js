@@ -72,6 +72,41 @@ function createPlayerCardsSection(detection, isUpdate) {
     return '<div class="no-cards">No cards detected</div>';
 }
 
+function createEquityIndicator(detection) {
+    if (!detection.equity) {
+        return '';
+    }
+
+    const equity = detection.equity;
+    const percent = (equity.equity * 100).toFixed(1);
+    return `<span class="equity-indicator" title="${equity.trials} trials">${percent}% vs ${equity.opponents}</span>`;
+}
+
+function createRangeEquityIndicator(detection) {
+    if (!detection.range_equity) {
+        return '';
+    }
+
+    const rangeEquity = detection.range_equity;
+    if (rangeEquity.status !== 'done') {
+        return `<span class="range-equity-indicator running" title="Computing equity vs ${rangeEquity.range_id}">… vs ${rangeEquity.range_id}</span>`;
+    }
+    const percent = (rangeEquity.equity * 100).toFixed(1);
+    const samples = rangeEquity.exact ? `all ${rangeEquity.samples} hands` : `${rangeEquity.samples} samples`;
+    return `<span class="range-equity-indicator" title="${samples}">${percent}% vs ${rangeEquity.range_id}</span>`;
+}
+
+function createStartingHandIndicator(detection) {
+    if (!detection.starting_hand) {
+        return '';
+    }
+
+    const hand = detection.starting_hand;
+    const top = Math.max(hand.top_share * 100, 0.1).toFixed(1);
+    const equity = (hand.equity * 100).toFixed(1);
+    return `<span class="starting-hand-indicator" title="Heads-up equity vs a random hand">Top ${top}% · ${equity}%</span>`;
+}
+
 function createTableCardsSection(detection, isUpdate) {
     if (!config.show_table_cards) {
         return '';
@@ -201,7 +236,7 @@ function createTableContainer(detection, isUpdate, tableId) {
     // Build main cards section conditionally
     let mainCardsContent = `
         <div class="player-cards-column">
-            <div class="cards-label">Player Cards:</div>
+            <div class="cards-label">Player Cards: ${createStartingHandIndicator(detection)}${createEquityIndicator(detection)}${createRangeEquityIndicator(detection)}</div>
             <div class="player-section">
                 ${createPlayerCardsSection(detection, isUpdate)}
             </div>
@@ -101,6 +101,10 @@ class DetectedPosition(Enum):
         """Check if this detection represents action text that replaced a position marker."""
         return not self.is_position() and self != self.NO_POSITION
     
+    def is_fold(self) -> bool:
+        """Check if this detection shows the seat has folded: a folded marker or the folds text."""
+        return self == self.FOLDS or '_fold' in self.value
+    
     def to_position(self) -> Optional[Position]:
         """
         Convert to actual Position enum if this represents a position.
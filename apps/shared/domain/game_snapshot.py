@@ -17,7 +17,9 @@ class GameSnapshot:
             bids: Optional[List[Any]] = None,
             is_player_move: bool = False,
             actions: Optional[Dict[int, List[Detection]]] = None,
-            moves: Optional[Dict[Street, List[Tuple[Position, MoveType]]]] = None
+            moves: Optional[Dict[Street, List[Tuple[Position, MoveType]]]] = None,
+            equity: Optional[Dict[str, Any]] = None,
+            starting_hand: Optional[Dict[str, Any]] = None
     ):
         self.player_cards = player_cards or []
         self.table_cards = table_cards or []
@@ -26,6 +28,8 @@ class GameSnapshot:
         self.is_player_move = is_player_move
         self.actions = actions or {}
         self.moves = moves or defaultdict(list)
+        self.equity = equity
+        self.starting_hand = starting_hand
 
     @property
     def has_cards(self) -> bool:
@@ -101,6 +105,8 @@ class GameSnapshot:
                 ],
                 'moves': self._format_moves_for_protocol(),
                 'street': self.get_street_display(),
+                'equity': self.equity,
+                'starting_hand': self.starting_hand,
                 'solver_link': FlopHeroLinkService.generate_link(self)
             },
             detection_interval=detection_interval
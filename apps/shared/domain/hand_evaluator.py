@@ -0,0 +1,124 @@
+from itertools import combinations
+from typing import Callable, Iterable, List
+
+import numpy as np
+
+RANKS = '23456789TJQKA'
+SUITS = 'CDHS'
+DECK_SIZE = len(RANKS) * len(SUITS)
+
+# Hand categories, in the high bits of a score
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+CATEGORY_SHIFT = 52
+
+WHEEL_MASK = 0b1000000001111  # A-2-3-4-5 rank bits
+
+# Omaha hands play exactly two hole cards and three board cards
+HOLE_PAIRS = np.array(list(combinations(range(4), 2)), dtype=np.intp)
+BOARD_TRIPLES = np.array(list(combinations(range(5), 3)), dtype=np.intp)
+
+
+def encode_card(name: str) -> int:
+    """Card template name ("AS", "Th", ...) to 0-51: rank * 4 + suit."""
+    rank, suit = name[:-1].upper(), name[-1].upper()
+    if rank == '10':
+        rank = 'T'
+    if len(rank) != 1 or rank not in RANKS or suit not in SUITS:
+        raise ValueError(f"Unknown card: {name}")
+    return RANKS.index(rank) * 4 + SUITS.index(suit)
+
+
+def encode_cards(names: Iterable[str]) -> List[int]:
+    return [encode_card(name) for name in names]
+
+
+def decode_card(card: int) -> str:
+    return RANKS[card >> 2] + SUITS[card & 3]
+
+
+def _category_table() -> np.ndarray:
+    """(largest rank count, distinct ranks) -> category, for hands that are neither straights nor flushes."""
+    table = np.zeros((5, 6), dtype=np.int64)
+    table[1, 5] = HIGH_CARD
+    table[2, 4] = PAIR
+    table[2, 3] = TWO_PAIR
+    table[3, 3] = TRIPS
+    table[3, 2] = FULL_HOUSE
+    table[4, 2] = QUADS
+    return table.ravel()
+
+
+CATEGORIES = _category_table()
+CARD_PAIRS = list(combinations(range(5), 2))
+
+
+def evaluate_5(cards: np.ndarray) -> np.ndarray:
+    """
+    Scores of 5-card hands, ``cards`` being an integer array of shape (..., 5).
+
+    A higher score is a better hand and equal scores tie. The category sits
+    above CATEGORY_SHIFT; below it every rank sets one bit in the layer of
+    its count (singles in bits 0-12, pairs in 13-25, trips above), so two
+    hands of a category compare by their biggest group first and kickers
+    last. There is no sorting or gathering per hand: the whole batch costs
+    a few dozen elementwise NumPy operations.
+    """
+    cards = np.asarray(cards)
+    shape = cards.shape[:-1]
+    columns = np.ascontiguousarray(cards.reshape(-1, 5).T, dtype=np.int64)
+    ranks = columns >> 2
+    suits = columns & 3
+
+    equal = {}
+    for i, j in CARD_PAIRS:
+        equal[i, j] = equal[j, i] = ranks[i] == ranks[j]
+
+    key = 0
+    max_count = 1
+    distinct = 0
+    for i in range(5):
+        count = 1
+        for j in range(5):
+            if j != i:
+                count = count + equal[i, j]
+        # Each rank is counted by its first card only
+        first = True
+        for j in range(i):
+            first = first & ~equal[i, j]
+        key = key + np.where(first, np.left_shift(1, ranks[i] + len(RANKS) * (count - 1)), 0)
+        max_count = np.maximum(max_count, count)
+        distinct = distinct + first
+
+    is_wheel = key == WHEEL_MASK
+    # Five distinct ranks in a row: the rank bits are the lowest one times 0b11111
+    is_straight = (distinct == 5) & ((key == (key & -key) * 0b11111) | is_wheel)
+    is_flush = (suits[0] == suits[1]) & (suits[0] == suits[2]) & (suits[0] == suits[3]) & (suits[0] == suits[4])
+
+    category = CATEGORIES.take(max_count * 6 + distinct)
+    category = np.where(is_straight, STRAIGHT, category)
+    category = np.where(is_flush, np.where(is_straight, STRAIGHT_FLUSH, FLUSH), category)
+    # The wheel is the lowest straight, below 6-high
+    key = np.where(is_wheel, WHEEL_MASK & 0b1111, key)
+    return ((category << CATEGORY_SHIFT) | key).reshape(shape)
+
+
+def omaha_combinations(hole_cards: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """
+    Every 2-from-hand, 3-from-board 5-card hand: hole cards (..., 4) and
+    boards (..., 5) with matching leading dimensions give (..., 60, 5).
+    """
+    pairs = hole_cards[..., HOLE_PAIRS]
+    triples = boards[..., BOARD_TRIPLES]
+    lead = np.broadcast_shapes(pairs.shape[:-2], triples.shape[:-2])
+    pairs = np.broadcast_to(pairs[..., :, None, :], lead + (len(HOLE_PAIRS), len(BOARD_TRIPLES), 2))
+    triples = np.broadcast_to(triples[..., None, :, :], lead + (len(HOLE_PAIRS), len(BOARD_TRIPLES), 3))
+    return np.concatenate((pairs, triples), axis=-1).reshape(lead + (-1, 5))
+
+
+def best_omaha_scores(hole_cards: np.ndarray, boards: np.ndarray,
+                      rank_hands: Callable[[np.ndarray], np.ndarray] = evaluate_5) -> np.ndarray:
+    """
+    Score of the best Omaha hand for hole cards (..., 4) on boards (..., 5),
+    by ``rank_hands`` (evaluate_5 or a HandRankTable's rank_many).
+    """
+    return rank_hands(omaha_combinations(hole_cards, boards)).max(axis=-1)
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+import numpy as np
+
+# Starting hand table built by table_detector.domain.starting_hand_table, read by the detector and the server
+STARTING_HAND_TABLE_PATH = Path(__file__).parent.parent / "resources" / "hand_ranks" / "plo_starting_hands.npz"
+
+# Class equities are stored as uint16 fractions of EQUITY_SCALE
+EQUITY_SCALE = 65535
+
+
+def load_hand_equities(path: Path = STARTING_HAND_TABLE_PATH) -> np.ndarray:
+    """Stored heads-up equity (0 to EQUITY_SCALE) of every starting hand, by colex index."""
+    with np.load(path) as table:
+        return table['equities'][table['hand_classes']]
@@ -1,13 +1,21 @@
 import os
+import time
 import traceback
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from loguru import logger
 
+from shared.domain.game_snapshot import GameSnapshot
+from table_detector.domain.simulation_cache import get_simulation_cache
+from table_detector.services.detection_pipeline import DetectionPipeline
 from table_detector.services.image_capture_service import ImageCaptureService
+from table_detector.services.matching_executor import MatchingExecutor
 from table_detector.services.poker_game_processor import PokerGameProcessor
+from table_detector.services.replay_capture_backend import ReplayCaptureBackend, ReplayStats
+from table_detector.services.table_scheduler import TableScheduler
+from table_detector.services.window_process_pool import WindowProcessPool
 from table_detector.utils.fs_utils import create_timestamp_folder, create_window_folder
 from table_detector.utils.log_accumulator import LogAccumulator
 from table_detector.utils.windows_utils import initialize_platform
@@ -25,13 +33,35 @@ class DetectionClient:
         # Initialize detection services (reuse existing components)
         self.image_capture_service = ImageCaptureService()
         self.poker_game_processor = PokerGameProcessor()
+        # Optionally process windows in parallel worker processes instead of one after another
+        self.window_process_pool = WindowProcessPool.from_env()
         self.debug_mode = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+        # Poll each table at a rate set by its activity instead of all tables every detection_interval
+        self.table_scheduler = None
+        if os.getenv('ADAPTIVE_SCHEDULING', 'false').lower() == 'true':
+            self.table_scheduler = TableScheduler.from_env(detection_interval)
+        # Optionally run capture, change filter, detect, serialize and send as separate threaded stages
+        self.pipeline = None
+        if os.getenv('PIPELINE_MODE', 'false').lower() == 'true':
+            self.pipeline = DetectionPipeline(
+                change_filter=self._pipeline_filter,
+                detect=self._pipeline_detect,
+                serialize=self._pipeline_serialize,
+                send=self._pipeline_send,
+                on_discard_frame=self._discard_pipeline_frame,
+                is_removal=self._is_pipeline_removal,
+                **DetectionPipeline.workers_from_env()
+            )
         self.scheduler = BackgroundScheduler()
         self._setup_scheduler()
 
         logger.info(f"🎯 Detection client initialized: {self.client_id}")
 
     def _setup_scheduler(self):
+        if self.table_scheduler:
+            self._schedule_adaptive_cycle(datetime.now())
+            return
+
         self.scheduler.add_job(
             func=self.detect_and_send,
             trigger='interval',
@@ -43,27 +73,89 @@ class DetectionClient:
             max_instances=1,
         )
 
+    def _schedule_adaptive_cycle(self, run_date: datetime):
+        self.scheduler.add_job(
+            func=self._run_adaptive_cycle,
+            trigger='date',
+            run_date=run_date,
+            id='detect_and_send',
+            name='Poker Detection and Send Job',
+            replace_existing=True,
+            misfire_grace_time=None,
+        )
+
+    def _run_adaptive_cycle(self):
+        """Run one cycle, then schedule the next for when the next table is due."""
+        try:
+            self.detect_and_send()
+        finally:
+            if self.scheduler.running:
+                delay = self.table_scheduler.next_delay()
+                self._schedule_adaptive_cycle(datetime.now() + timedelta(seconds=delay))
+
     def start_detection(self):
         """Start the detection scheduler."""
         if not self.scheduler.running:
+            if self.pipeline:
+                self.pipeline.start()
             self.scheduler.start()
-            logger.info(f"✅ Detection started (interval: {self.detection_interval}s)")
+            if self.table_scheduler:
+                logger.info(f"✅ Detection started (adaptive per-table intervals "
+                            f"{self.table_scheduler.min_interval}-{self.table_scheduler.max_interval}s)")
+            else:
+                logger.info(f"✅ Detection started (interval: {self.detection_interval}s)")
         else:
             logger.info("⚠️ Detection is already running")
 
     def stop_detection(self):
-        """Stop the detection scheduler."""
+        """Stop the detection scheduler and the shared matching pool."""
         if self.scheduler.running:
             self.scheduler.shutdown(wait=True)
             logger.info("✅ Detection stopped")
         else:
             logger.info("⚠️ Detection is not running")
 
+        if self.pipeline:
+            self.pipeline.stop()
+        self.image_capture_service.close()
+        if self.window_process_pool:
+            self.window_process_pool.shutdown()
+        MatchingExecutor.shutdown()
+
+    def run_replay(self, replay_backend: ReplayCaptureBackend) -> ReplayStats:
+        """Run detect-and-send cycles over a recorded session instead of the interval scheduler."""
+        self.image_capture_service.capture_backend = replay_backend
+        self.image_capture_service.debug_mode = False
+        self.image_capture_service.save_windows = False
+        # Recorded frames are already paced by their timestamps and must all be processed
+        self.table_scheduler = None
+        self.pipeline = None
+
+        logger.info(f"🎞️ Replaying {len(replay_backend.frames)} recorded frames")
+        try:
+            while replay_backend.next_frame():
+                self.detect_and_send()
+        finally:
+            self.image_capture_service.close()
+            if self.window_process_pool:
+                self.window_process_pool.shutdown()
+            MatchingExecutor.shutdown()
+
+        stats = replay_backend.get_stats()
+        logger.info(f"🎞️ Replay finished: {stats.frames_played} frames in {stats.elapsed_seconds:.1f}s, "
+                    f"{stats.achieved_fps:.2f} fps achieved (recorded {stats.recorded_fps:.2f} fps, "
+                    f"speed {stats.speed}), {stats.frames_late} late")
+        return stats
+
     def is_detection_running(self) -> bool:
         return self.scheduler.running
 
     def detect_and_send(self):
         """Main detection loop - detect game state and send to server."""
+        if self.pipeline:
+            self._capture_into_pipeline()
+            return
+
         log_accumulator = LogAccumulator() if not self.debug_mode else None
 
         try:
@@ -71,13 +163,27 @@ class DetectionClient:
             if log_accumulator:
                 log_accumulator.start_capture()
 
+            window_filter = None
+            if self.table_scheduler:
+                self.table_scheduler.begin_cycle()
+                window_filter = self.table_scheduler.should_capture
+
             base_timestamp_folder = create_timestamp_folder(self.debug_mode)
-            window_changes = self.image_capture_service.get_changed_images(base_timestamp_folder)
+            capture_start = time.perf_counter()
+            window_changes = self.image_capture_service.get_changed_images(base_timestamp_folder, window_filter)
+
+            # Capture time is shared evenly by the windows captured this cycle
+            captured_count = len(window_changes.changed_images) + len(window_changes.unchanged_windows)
+            capture_cost = (time.perf_counter() - capture_start) / max(1, captured_count)
+            if self.table_scheduler:
+                for window_name in window_changes.unchanged_windows:
+                    self.table_scheduler.record(window_name, capture_cost)
 
             # Only process and write logs if there are changed windows
             if window_changes.changed_images:
                 # Process changed windows and collect changed game states
-                changed_games = self._handle_changed_windows(window_changes.changed_images, base_timestamp_folder)
+                changed_games = self._handle_changed_windows(window_changes.changed_images, base_timestamp_folder,
+                                                             capture_cost)
 
                 # Handle removed windows and collect removal messages
                 removal_messages = self._handle_removed_windows(window_changes.removed_windows)
@@ -85,6 +191,13 @@ class DetectionClient:
                 # Send updates to server (let the method handle empty inputs)
                 self._send_updates_to_server(changed_games, removal_messages)
 
+                logger.debug(f"🧵 Matching pool: {MatchingExecutor.get().get_stats()}")
+                simulation_cache = get_simulation_cache()
+                if simulation_cache is not None:
+                    simulation_cache.log_stats()
+                if self.table_scheduler:
+                    self.table_scheduler.log_stats()
+
                 # Write accumulated logs to file
                 if log_accumulator and log_accumulator.has_logs():
                     log_accumulator.write_to_file(base_timestamp_folder / "app.log")
@@ -107,20 +220,43 @@ class DetectionClient:
             if log_accumulator:
                 log_accumulator.stop_capture()
 
-    def _handle_changed_windows(self, captured_windows, base_timestamp_folder):
+    def _handle_changed_windows(self, captured_windows, base_timestamp_folder, capture_cost: float = 0.0):
         """Process changed windows using existing poker game processor and return list of changed game states."""
         changed_games = []
 
+        # In pool mode all windows are handed to the workers up front and collected below
+        pool_futures = {}
+        if self.window_process_pool:
+            for captured_image in captured_windows:
+                try:
+                    self.poker_game_processor.validate_image(captured_image)
+                    window_folder = create_window_folder(base_timestamp_folder, captured_image.window_name)
+                    pool_futures[captured_image.window_name] = self.window_process_pool.submit(captured_image,
+                                                                                               window_folder)
+                except Exception as e:
+                    logger.error(f"❌ Error processing {captured_image.window_name}: {str(e)}")
+
         for i, captured_image in enumerate(captured_windows):
+            process_start = time.perf_counter()
+            processing_seconds = None
+            game_snapshot = None
             try:
                 logger.info(f"\n📷 Processing image {i + 1}: {captured_image.window_name}")
                 logger.info("-" * 40)
 
-                # Create window-specific folder
-                window_folder = create_window_folder(base_timestamp_folder, captured_image.window_name)
+                if self.window_process_pool:
+                    future = pool_futures.get(captured_image.window_name)
+                    if future is None:
+                        continue
+                    window_result = future.result()
+                    game_snapshot = window_result.snapshot
+                    processing_seconds = window_result.seconds
+                else:
+                    # Create window-specific folder
+                    window_folder = create_window_folder(base_timestamp_folder, captured_image.window_name)
 
-                # Process and get GameSnapshot
-                game_snapshot = self.poker_game_processor.process_window(captured_image, window_folder)
+                    # Process and get GameSnapshot
+                    game_snapshot = self.poker_game_processor.process_window(captured_image, window_folder)
 
                 if game_snapshot:
                     # Store tuple of (game_snapshot, window_name) for later processing
@@ -132,16 +268,30 @@ class DetectionClient:
             finally:
                 # Clean up the image immediately after processing to prevent memory leaks
                 captured_image.close()
+                if self.table_scheduler:
+                    if processing_seconds is None:
+                        processing_seconds = time.perf_counter() - process_start
+                    self.table_scheduler.record(captured_image.window_name, capture_cost + processing_seconds,
+                                                game_snapshot)
+
+        if self.window_process_pool:
+            logger.debug(f"🧮 Window process pool: {self.window_process_pool.get_stats()}")
 
         return changed_games
 
-    def _handle_removed_windows(self, removed_window_names):
-        """Handle removed windows and return removal message data for transmission."""
+    def _handle_removed_windows(self, removed_window_names, forget_windows: bool = True):
+        """Handle removed windows and return removal message data for transmission.
+
+        With ``forget_windows`` False the caller drops the per-window state itself,
+        as the pipeline does once the window's in-flight frame is detected.
+        """
         logger.info(f"🗑️ Removing {len(removed_window_names)} closed windows")
 
         removal_messages = []
         for window_name in removed_window_names:
             logger.info(f"    Removing: {window_name}")
+            if forget_windows:
+                self._forget_window(window_name)
 
             # Create removal message data structure
             removal_data = {
@@ -154,6 +304,106 @@ class DetectionClient:
 
         return removal_messages
 
+    def _forget_window(self, window_name: str):
+        self.poker_game_processor.forget_window(window_name)
+        if self.window_process_pool:
+            self.window_process_pool.forget_window(window_name)
+        if self.table_scheduler:
+            self.table_scheduler.forget(window_name)
+
+    def _capture_into_pipeline(self):
+        """Capture stage: hand every captured window to the pipeline and return without waiting."""
+        try:
+            window_filter = None
+            if self.table_scheduler:
+                self.table_scheduler.begin_cycle()
+                window_filter = self.table_scheduler.should_capture
+
+            base_timestamp_folder = create_timestamp_folder(self.debug_mode)
+            capture_start = time.perf_counter()
+            window_capture = self.image_capture_service.capture_windows(base_timestamp_folder, window_filter)
+            capture_seconds = time.perf_counter() - capture_start
+            self.pipeline.record_capture(capture_seconds)
+
+            if window_capture.removed_windows:
+                for removal_data in self._handle_removed_windows(window_capture.removed_windows,
+                                                                 forget_windows=False):
+                    self.pipeline.submit_removal(removal_data['window_name'], removal_data)
+
+            capture_cost = capture_seconds / max(1, len(window_capture.captured_windows))
+            for captured_window in window_capture.captured_windows:
+                self.pipeline.submit_frame(captured_window.window_name,
+                                           (captured_window, base_timestamp_folder, capture_cost))
+
+            self.pipeline.log_stats()
+        except Exception as e:
+            logger.error(f"Error in capture stage: {str(e)}\n{traceback.format_exc()}")
+
+    def _pipeline_filter(self, window_name: str, frame):
+        captured_window, _, capture_cost = frame
+        if self.image_capture_service.has_changed(captured_window):
+            return frame
+
+        captured_window.close()
+        if self.table_scheduler:
+            self.table_scheduler.record(window_name, capture_cost)
+        return None
+
+    @staticmethod
+    def _discard_pipeline_frame(item):
+        # Removal notices share the detect queue with frames
+        if isinstance(item, tuple):
+            item[0].close()
+
+    @staticmethod
+    def _is_pipeline_removal(item) -> bool:
+        # A removal notice before serialization, the removal message after
+        return isinstance(item, (dict, TableRemovalMessage))
+
+    def _pipeline_detect(self, window_name: str, frame):
+        if isinstance(frame, dict):
+            # Removal notice: no frame of this window is in flight, so its state can go
+            self._forget_window(window_name)
+            return frame
+
+        captured_window, base_timestamp_folder, capture_cost = frame
+        if not self.image_capture_service.is_open(window_name):
+            # Closed while the frame waited; detecting it would recreate the state just forgotten
+            captured_window.close()
+            return None
+        process_start = time.perf_counter()
+        game_snapshot = None
+        try:
+            self.poker_game_processor.validate_image(captured_window)
+            window_folder = create_window_folder(base_timestamp_folder, window_name)
+            if self.window_process_pool:
+                game_snapshot = self.window_process_pool.submit(captured_window, window_folder).result().snapshot
+            else:
+                game_snapshot = self.poker_game_processor.process_window(captured_window, window_folder)
+            return game_snapshot
+        finally:
+            captured_window.close()
+            if self.table_scheduler:
+                self.table_scheduler.record(window_name, capture_cost + time.perf_counter() - process_start,
+                                            game_snapshot)
+
+    def _pipeline_serialize(self, window_name: str, payload):
+        if isinstance(payload, GameSnapshot):
+            # The window may have closed while its frame was being detected
+            if not self.image_capture_service.is_open(window_name):
+                return None
+            return self._build_game_update(payload, window_name)
+        return self._build_removal_message(payload)
+
+    def _pipeline_send(self, window_name: str, message):
+        if not self.http_connector:
+            return None
+        if isinstance(message, TableRemovalMessage):
+            self.http_connector.send_removal_message(message)
+        else:
+            self.http_connector.send_game_update(message)
+        return None
+
     def _send_updates_to_server(self, changed_games=None, removal_messages=None):
         """Send specific changed game states and removal messages to servers via HTTP requests.
 
@@ -189,12 +439,7 @@ class DetectionClient:
     def _send_game_update(self, game_snapshot, window_name: str):
         """Send individual game update via HTTP."""
         try:
-            # Convert GameSnapshot directly to GameUpdateMessage
-            game_update = game_snapshot.to_game_update_message(
-                client_id=self.client_id,
-                window_name=window_name,
-                detection_interval=self.detection_interval
-            )
+            game_update = self._build_game_update(game_snapshot, window_name)
 
             # Simple HTTP request - fire and forget
             self.http_connector.send_game_update(game_update)
@@ -205,13 +450,7 @@ class DetectionClient:
     def _send_removal_update(self, removal_data: dict):
         """Send individual removal message via HTTP."""
         try:
-            # Convert removal data to message protocol
-            removal_message = TableRemovalMessage(
-                type=removal_data.get('type', 'table_removal'),
-                client_id=removal_data.get('client_id'),
-                removed_windows=[removal_data.get('window_name')],  # Convert single window to list
-                timestamp=removal_data.get('timestamp')
-            )
+            removal_message = self._build_removal_message(removal_data)
 
             # Simple HTTP request - fire and forget
             self.http_connector.send_removal_message(removal_message)
@@ -219,6 +458,24 @@ class DetectionClient:
         except Exception as e:
             logger.debug(f"Failed to send removal update for {removal_data.get('window_name', 'unknown')}: {str(e)}")
 
+    def _build_game_update(self, game_snapshot, window_name: str) -> GameUpdateMessage:
+        # Convert GameSnapshot directly to GameUpdateMessage
+        return game_snapshot.to_game_update_message(
+            client_id=self.client_id,
+            window_name=window_name,
+            detection_interval=self.detection_interval
+        )
+
+    @staticmethod
+    def _build_removal_message(removal_data: dict) -> TableRemovalMessage:
+        # Convert removal data to message protocol
+        return TableRemovalMessage(
+            type=removal_data.get('type', 'table_removal'),
+            client_id=removal_data.get('client_id'),
+            removed_windows=[removal_data.get('window_name')],  # Convert single window to list
+            timestamp=removal_data.get('timestamp')
+        )
+
     def get_client_id(self) -> str:
         """Get the client ID."""
         return self.client_id
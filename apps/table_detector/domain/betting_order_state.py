@@ -0,0 +1,193 @@
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+# player count -> (small blind seat, big blind seat), in pokerkit's seat numbering (heads-up reverses the blinds)
+BLIND_SEATS: Dict[int, Tuple[int, int]] = {
+    2: (1, 0),
+    **{player_count: (0, 1) for player_count in range(3, 7)}
+}
+
+# player count -> seat -> every seat in acting order starting from it
+ACTING_ORDER: Dict[int, Tuple[Tuple[int, ...], ...]] = {
+    player_count: tuple(
+        tuple((seat + offset) % player_count for offset in range(player_count))
+        for seat in range(player_count)
+    )
+    for player_count in range(2, 7)
+}
+
+RIVER_INDEX = 3
+
+
+class BettingOrderState:
+    """
+    Pot limit betting order of one hand, without cards or pots.
+
+    Implements the part of pokerkit's ``State`` that OmahaEngine uses (who
+    acts, on which street, and whether folding, checking/calling and min
+    bets/raises are legal) with pokerkit's own rules for seats, blinds,
+    street openers and short all-ins, so OmahaEngine produces the same moves
+    and errors on either. Each street is a queue of seats still to act:
+    checks, calls and folds pop it, a bet or raise refills it with everyone
+    else behind the raiser, and the street ends when it empties.
+    """
+
+    def __init__(self, blinds: Tuple[float, float], min_bet: float, starting_stacks: Sequence[float],
+                 player_count: int):
+        if player_count not in BLIND_SEATS:
+            raise ValueError(f"Unsupported player count: {player_count}")
+
+        self.player_count = player_count
+        self.min_bet = min_bet
+        self.stacks: List[float] = list(starting_stacks)
+        self.bets: List[float] = [0] * player_count
+        self.statuses: List[bool] = [True] * player_count
+        self.street_index: Optional[int] = 0
+        self.opener_index: Optional[int] = None
+
+        self._blinds: List[float] = [0] * player_count
+        for seat, blind in zip(BLIND_SEATS[player_count], blinds):
+            self._blinds[seat] = blind
+            self._pay(seat, min(blind, self.stacks[seat]))
+
+        self._actors: Deque[int] = deque()
+        self._acted: Set[int] = set()
+        # Size of the largest full bet or raise this street, and the all-ins short of it since
+        self._completion_amount: float = 0
+        self._short_all_ins: List[float] = []
+
+        self._begin_street()
+
+    @property
+    def status(self) -> bool:
+        return self.street_index is not None
+
+    @property
+    def actor_index(self) -> Optional[int]:
+        return self._actors[0] if self._actors else None
+
+    @property
+    def checking_or_calling_amount(self) -> Optional[float]:
+        actor = self.actor_index
+        if actor is None:
+            return None
+        return min(self.stacks[actor], max(self.bets) - self.bets[actor])
+
+    @property
+    def min_completion_betting_or_raising_to_amount(self) -> Optional[float]:
+        if not self.can_complete_bet_or_raise_to():
+            return None
+        actor = self.actor_index
+        amount = max(self._completion_amount, self.min_bet) + max(self.bets)
+        return min(self.stacks[actor] + self.bets[actor], amount)
+
+    def can_fold(self) -> bool:
+        # Folding when a check is free is not allowed
+        actor = self.actor_index
+        return actor is not None and self.bets[actor] < max(self.bets)
+
+    def can_check_or_call(self) -> bool:
+        return self.actor_index is not None
+
+    def can_complete_bet_or_raise_to(self) -> bool:
+        actor = self.actor_index
+        if actor is None:
+            return False
+
+        max_bet = max(self.bets)
+        # A short all-in does not reopen the betting for whoever already acted on the full bet
+        if self.checking_or_calling_amount < self._completion_amount:
+            return False
+        if self._short_all_ins and sum(self._short_all_ins) < self._completion_amount and actor in self._acted:
+            return False
+        if self.stacks[actor] <= max_bet - self.bets[actor]:
+            return False
+        # Someone has to be left who could call more
+        return any(seat != actor and self.statuses[seat] and self.stacks[seat] + self.bets[seat] > max_bet
+                   for seat in range(self.player_count))
+
+    def fold(self):
+        actor = self._pop_actor()
+        self.statuses[actor] = False
+        self._update_street()
+
+    def check_or_call(self):
+        amount = self.checking_or_calling_amount
+        actor = self._pop_actor()
+        self._pay(actor, amount)
+        self._update_street()
+
+    def complete_bet_or_raise_to(self, amount: float):
+        minimum = self.min_completion_betting_or_raising_to_amount
+        if minimum is None or amount < minimum or amount > self.stacks[self.actor_index] + self.bets[self.actor_index]:
+            raise ValueError(f"Invalid bet or raise to {amount}")
+
+        actor = self._pop_actor()
+        increment = amount - max(self.bets)
+        self._pay(actor, amount - self.bets[actor])
+
+        self._actors = deque(seat for seat in ACTING_ORDER[self.player_count][actor][1:]
+                             if self.statuses[seat] and self.stacks[seat])
+        self.opener_index = actor
+        if increment >= self._completion_amount:
+            self._acted = {actor}
+        self._completion_amount = max(self._completion_amount, increment)
+
+        if self.stacks[actor]:
+            self._short_all_ins.clear()
+        else:
+            self._short_all_ins.append(increment)
+        if sum(self._short_all_ins) >= self._completion_amount:
+            self._short_all_ins.clear()
+
+        self._update_street()
+
+    def _pay(self, seat: int, amount: float):
+        self.stacks[seat] -= amount
+        self.bets[seat] += amount
+
+    def _pop_actor(self) -> int:
+        if not self._actors:
+            raise ValueError("There is no player to act")
+        actor = self._actors.popleft()
+        self._acted.add(actor)
+        return actor
+
+    def _effective_stack(self, seat: int) -> float:
+        totals = sorted(self.stacks[other] + self.bets[other]
+                        for other in range(self.player_count) if self.statuses[other])
+        return min(self.stacks[seat], max(0, totals[-2] - self.bets[seat]))
+
+    def _begin_street(self):
+        # The seat after the biggest blind opens preflop; the first seat after the button opens later streets
+        bet_owner = max(range(self.player_count),
+                        key=lambda seat: (self.bets[seat] * (self._blinds[seat] > 0), seat))
+        self.opener_index = (bet_owner + 1) % self.player_count
+
+        self._actors = deque(seat for seat in ACTING_ORDER[self.player_count][self.opener_index]
+                             if self.statuses[seat] and self.stacks[seat] and self._effective_stack(seat))
+        self._completion_amount = 0
+        self._acted.clear()
+        self._short_all_ins.clear()
+
+        only_actor_covered = len(self._actors) == 1 and self.bets[self._actors[0]] >= max(self.bets)
+        self._update_street(only_actor_covered)
+
+    def _update_street(self, finished: bool = False):
+        if self._actors and sum(self.statuses) > 1 and not finished:
+            return
+
+        self._actors.clear()
+        if sum(self.statuses) <= 1:
+            self.street_index = None
+            return
+
+        # With at most one player left holding chips the rest of the board is dealt without betting
+        players_with_chips = sum(1 for seat in range(self.player_count) if self.statuses[seat] and self.stacks[seat])
+        if players_with_chips <= 1 or self.street_index == RIVER_INDEX:
+            self.street_index = None
+            return
+
+        self.street_index += 1
+        self.bets = [0] * self.player_count
+        self._begin_street()
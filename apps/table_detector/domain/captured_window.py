@@ -1,6 +1,7 @@
 import hashlib
 from typing import Optional
 
+import cv2
 import numpy as np
 from PIL import Image
 from loguru import logger
@@ -9,25 +10,69 @@ from table_detector.utils.opencv_utils import pil_to_cv2
 
 
 class CapturedWindow:
+    """
+    A captured window backed either by a PIL image or by a raw NumPy frame.
+
+    Raw frames are BGR (h, w, 3) or BGRX/BGRA (h, w, 4) buffers straight from the
+    capture backend. For those, the cv2 image is a read-only view of the buffer
+    and hashing/saving read from it directly, without a PIL round trip.
+    """
+
+    HASH_SIZE = 100
+
     def __init__(
             self,
-            image: Image.Image,
+            image: Optional[Image.Image],
             filename: str,
             window_name: str,
             description: str = 'test',
+            frame: Optional[np.ndarray] = None,
     ):
-        self.image = image
+        if image is None and frame is None:
+            raise ValueError("CapturedWindow needs an image or a frame")
+
+        self._image = image
+        self._frame = CapturedWindow._as_bgr_view(frame) if frame is not None else None
         self.filename = filename
         self.window_name = window_name
         self.description = None
         self._image_hash: Optional[str] = None
         self._is_closed = False
 
+    @classmethod
+    def from_frame(cls, frame: np.ndarray, filename: str, window_name: str,
+                   description: str = 'test') -> 'CapturedWindow':
+        """Wrap a BGR or BGRX frame buffer without copying it."""
+        return cls(image=None, filename=filename, window_name=window_name, description=description, frame=frame)
+
+    @staticmethod
+    def _as_bgr_view(frame: np.ndarray) -> np.ndarray:
+        if frame.ndim != 3 or frame.shape[2] not in (3, 4) or frame.dtype != np.uint8:
+            raise ValueError(f"Expected a uint8 BGR/BGRX frame, got {frame.dtype} {frame.shape}")
+
+        view = frame[..., :3]
+        # Detectors share this buffer, so accidental in-place drawing must fail loudly
+        view.flags.writeable = False
+        return view
+
+    @property
+    def has_frame(self) -> bool:
+        return self._frame is not None
+
+    @property
+    def image(self) -> Image.Image:
+        """PIL image; built lazily (one copy) for frame-backed windows."""
+        if self._image is None and self._frame is not None:
+            self._image = Image.fromarray(cv2.cvtColor(self._frame, cv2.COLOR_BGR2RGB))
+        return self._image
+
     def get_cv2_image(self) -> np.ndarray:
         if self._is_closed:
             raise Exception(f"❌ Cannot convert closed image {self.window_name}")
+        if self._frame is not None:
+            return self._frame
         try:
-            return pil_to_cv2(self.image)
+            return pil_to_cv2(self._image)
         except Exception as e:
             raise Exception(f"❌ Error converting image {self.window_name}: {str(e)}")
 
@@ -37,42 +82,59 @@ class CapturedWindow:
             
         if self._image_hash is None:
             try:
-                resized_image = self.image.resize((100, 100))
-                image_bytes = resized_image.tobytes()
-                self._image_hash = hashlib.sha256(image_bytes).hexdigest()[:16]
-                # Clean up the resized image immediately
-                resized_image.close()
+                if self._frame is not None:
+                    self._image_hash = CapturedWindow._hash_frame(self._frame)
+                else:
+                    resized_image = self._image.resize((self.HASH_SIZE, self.HASH_SIZE))
+                    image_bytes = resized_image.tobytes()
+                    self._image_hash = hashlib.sha256(image_bytes).hexdigest()[:16]
+                    # Clean up the resized image immediately
+                    resized_image.close()
             except Exception as e:
                 logger.error(f"❌ Error calculating image hash: {str(e)}")
                 self._image_hash = ""
 
         return self._image_hash
 
+    @staticmethod
+    def _hash_frame(frame: np.ndarray) -> str:
+        # Every pixel feeds the hash: a changed digit or glyph must mark the window as changed
+        return hashlib.blake2b(np.ascontiguousarray(frame).data, digest_size=8).hexdigest()
+
     def get_size(self) -> tuple[int, int]:
         if self._is_closed:
             raise Exception(f"❌ Cannot get size of closed image {self.window_name}")
-        return self.image.size
+        if self._frame is not None:
+            return self._frame.shape[1], self._frame.shape[0]
+        return self._image.size
 
     def save(self, filepath: str) -> bool:
         if self._is_closed:
             logger.error(f"❌ Cannot save closed image {self.filename}")
             return False
         try:
-            self.image.save(filepath)
+            if self._frame is not None:
+                if not cv2.imwrite(filepath, self._frame):
+                    raise IOError(f"cv2.imwrite failed for {filepath}")
+            else:
+                self._image.save(filepath)
             return True
         except Exception as e:
             logger.error(f"❌ Failed to save {self.filename}: {e}")
             return False
 
     def close(self):
-        """Explicitly release the PIL Image memory."""
-        if not self._is_closed and self.image:
-            try:
-                self.image.close()
-                self._is_closed = True
-                logger.debug(f"🧹 Closed image: {self.window_name}")
-            except Exception as e:
-                logger.error(f"❌ Error closing image {self.window_name}: {e}")
+        """Explicitly release the PIL Image / frame buffer memory."""
+        if self._is_closed:
+            return
+        try:
+            if self._image:
+                self._image.close()
+            self._frame = None
+            self._is_closed = True
+            logger.debug(f"🧹 Closed image: {self.window_name}")
+        except Exception as e:
+            logger.error(f"❌ Error closing image {self.window_name}: {e}")
 
     def __enter__(self):
         """Context manager entry."""
@@ -84,7 +146,7 @@ class CapturedWindow:
 
     def __del__(self):
         """Destructor - ensure cleanup happens."""
-        if not self._is_closed:
+        if not getattr(self, '_is_closed', True):
             self.close()
 
     def to_dict(self) -> dict:
@@ -92,7 +154,8 @@ class CapturedWindow:
             'image': self.image,
             'filename': self.filename,
             'window_name': self.window_name,
-            'description': self.description
+            'description': self.description,
+            'frame': self._frame
         }
 
     @classmethod
@@ -101,7 +164,8 @@ class CapturedWindow:
             image=data['image'],
             filename=data['filename'],
             window_name=data['window_name'],
-            description=data.get('description', '')
+            description=data.get('description', ''),
+            frame=data.get('frame')
         )
 
     def __str__(self) -> str:
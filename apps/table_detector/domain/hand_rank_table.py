@@ -0,0 +1,107 @@
+import threading
+from itertools import chain, combinations
+from math import comb
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from shared.domain.hand_evaluator import DECK_SIZE, evaluate_5
+
+HAND_COUNT = comb(DECK_SIZE, 5)
+# Distinct 5-card hand values, from 7-5-4-3-2 high (0) to a royal flush (7461)
+HAND_CLASS_COUNT = 7462
+
+DEFAULT_TABLE_PATH = Path(__file__).parent.parent / "resources" / "hand_ranks" / "rank5.npy"
+
+# Comparators of an optimal sorting network for five elements
+SORTING_NETWORK = ((0, 1), (3, 4), (2, 4), (2, 3), (0, 3), (0, 2), (1, 4), (1, 3), (1, 2))
+
+# BINOMIALS[k][card] = C(card, k + 1): the colex index of cards c0 < ... < c4 is the sum of C(ck, k + 1)
+BINOMIALS = np.array([[comb(card, k + 1) for card in range(DECK_SIZE)] for k in range(5)], dtype=np.int32)
+
+
+def all_hands() -> np.ndarray:
+    """Every 5-card hand, cards ascending, as a (2598960, 5) array."""
+    return np.fromiter(chain.from_iterable(combinations(range(DECK_SIZE), 5)), dtype=np.int8,
+                       count=5 * HAND_COUNT).reshape(-1, 5)
+
+
+def hand_indices(cards: np.ndarray) -> np.ndarray:
+    """
+    Colex index (0 to 2598959) of 5-card hands given as (..., 5) in any
+    card order: a minimal perfect hash of the set of cards.
+    """
+    cards = np.asarray(cards)
+    shape = cards.shape[:-1]
+    columns = list(np.ascontiguousarray(cards.reshape(-1, 5).T, dtype=np.int32))
+    for i, j in SORTING_NETWORK:
+        low = np.minimum(columns[i], columns[j])
+        columns[j] = np.maximum(columns[i], columns[j])
+        columns[i] = low
+
+    index = BINOMIALS[0].take(columns[0])
+    for k in range(1, 5):
+        index += BINOMIALS[k].take(columns[k])
+    return index.reshape(shape)
+
+
+def build_rank_table() -> np.ndarray:
+    """Hand class (0 worst to 7461 best) of every 5-card hand, by colex index."""
+    hands = all_hands()
+    _, classes = np.unique(evaluate_5(hands), return_inverse=True)
+    table = np.zeros(HAND_COUNT, dtype=np.uint16)
+    table[hand_indices(hands)] = classes.ravel()
+    return table
+
+
+class HandRankTable:
+    """
+    5-card hand ranks looked up from a precomputed table.
+
+    The table holds the hand class of every 5-card hand at the hand's colex
+    index, so ranking is a sort of five cards, five small lookups and one
+    table read, all vectorized. The file is memory-mapped read-only:
+    loading is instant and every detector process shares the same pages.
+    """
+
+    def __init__(self, table: np.ndarray):
+        if table.shape != (HAND_COUNT,):
+            raise ValueError(f"Hand rank table has shape {table.shape}, expected ({HAND_COUNT},)")
+        self.table = table
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_TABLE_PATH) -> 'HandRankTable':
+        path = Path(path)
+        if not path.exists():
+            logger.warning(f"⚠️ Hand rank table {path} missing, building it")
+            HandRankTable.build(path)
+        return cls(np.load(path, mmap_mode='r'))
+
+    @staticmethod
+    def build(path: Path = DEFAULT_TABLE_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, build_rank_table())
+        logger.info(f"🃏 Saved hand rank table to {path}")
+
+    def rank_many(self, cards: np.ndarray) -> np.ndarray:
+        """Hand class of 5-card hands given as integer cards (..., 5); higher is better."""
+        return self.table.take(hand_indices(cards))
+
+
+_table: Optional[HandRankTable] = None
+_table_lock = threading.Lock()
+
+
+def get_hand_rank_table() -> HandRankTable:
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = HandRankTable.load()
+        return _table
+
+
+if __name__ == '__main__':
+    HandRankTable.build()
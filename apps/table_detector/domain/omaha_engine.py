@@ -1,10 +1,12 @@
-from typing import Dict, List, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 from pokerkit import Automation, PotLimitOmahaHoldem
 from shared.domain.moves import MoveType
 from shared.domain.position import Position
 from shared.domain.street import Street
+from table_detector.domain.betting_order_state import BettingOrderState
 
 
 class OmahaEngineException(Exception):
@@ -60,7 +62,11 @@ class OmahaEngine:
         Automation.HOLE_DEALING
     )
 
-    def __init__(self, player_count):
+    POKERKIT_BACKEND = 'pokerkit'
+    # Betting order only: no chips in pots, cards or automations
+    NATIVE_BACKEND = 'native'
+
+    def __init__(self, player_count, backend: Optional[str] = None):
         if player_count < 2:
             raise WrongPlayerAmount("Need at least 2 players to start game")
 
@@ -77,15 +83,21 @@ class OmahaEngine:
         starting_stacks = [100] * player_count  # Default stack size
         blinds = (0.5, 1)  # Default blinds (SB, BB)
 
-        self.poker_state = PotLimitOmahaHoldem.create_state(
-            self.AUTOMATIONS,
-            True,  # Uniform antes?
-            0,  # Antes
-            blinds,  # Blinds (SB, BB)
-            1,  # Min-bet
-            starting_stacks,  # Starting stacks
-            player_count,  # Number of players
-        )
+        if backend is None:
+            backend = os.getenv('OMAHA_ENGINE_BACKEND', self.POKERKIT_BACKEND).lower()
+
+        if backend == self.NATIVE_BACKEND:
+            self.poker_state = BettingOrderState(blinds, 1, starting_stacks, player_count)
+        else:
+            self.poker_state = PotLimitOmahaHoldem.create_state(
+                self.AUTOMATIONS,
+                True,  # Uniform antes?
+                0,  # Antes
+                blinds,  # Blinds (SB, BB)
+                1,  # Min-bet
+                starting_stacks,  # Starting stacks
+                player_count,  # Number of players
+            )
 
         self.seat_mapping = self._get_seat_to_position_mapping()
 
@@ -0,0 +1,121 @@
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from shared.domain.moves import MoveType
+from shared.domain.position import Position
+from shared.domain.street import Street
+from table_detector.domain.omaha_engine import OmahaEngine, OmahaEngineException
+from table_detector.domain.simulation_cache import SimulationCache
+
+PositionActions = Dict[Position, List[MoveType]]
+MovesByStreet = Dict[Street, List[Tuple[Position, MoveType]]]
+
+
+class OmahaSession:
+    """
+    One table's OmahaEngine, kept across detection cycles.
+
+    Detected actions only ever grow during a hand, so when a cycle's actions
+    extend the sequence the engine already accepted only the new moves are
+    simulated. Replaying the accepted prefix again would reach the same state,
+    so the result is the same as a fresh ``simulate_all_moves``. A new hand,
+    different seats, or actions that do not extend the accepted ones (a
+    detection flickered) start a fresh engine, unless ``cache`` already knows
+    the result; cached results leave no engine, so the next extension replays.
+    """
+
+    def __init__(self, cache: Optional[SimulationCache] = None):
+        self.cache = cache
+        self._engine: Optional[OmahaEngine] = None
+        self._hand: Optional[Hashable] = None
+        self._accepted: PositionActions = {}
+        self._moves: Optional[MovesByStreet] = None
+        # Actions that last failed to simulate and the error they raised
+        self._failed: Optional[Tuple[PositionActions, OmahaEngineException]] = None
+
+        self.replays = 0
+        self.extensions = 0
+        self.reuses = 0
+
+    def simulate(self, position_actions: PositionActions, hand: Hashable = None) -> MovesByStreet:
+        """
+        Moves by street for ``position_actions`` (left unmodified), raising the
+        same OmahaEngineException a fresh engine would.
+        """
+        if hand != self._hand:
+            self.reset()
+            self._hand = hand
+
+        if self._failed is not None and self._failed[0] == position_actions:
+            self.reuses += 1
+            raise self._failed[1]
+
+        if self._moves is not None and position_actions == self._accepted:
+            self.reuses += 1
+            return OmahaSession._copy_moves(self._moves)
+
+        delta = self._delta(position_actions)
+        if delta is None and self.cache is not None:
+            try:
+                hit, moves = self.cache.get(position_actions)
+            except OmahaEngineException as e:
+                self._fail(position_actions, e)
+                raise
+            if hit:
+                self._engine = None
+                self._accept(position_actions, moves)
+                return OmahaSession._copy_moves(self._moves)
+
+        try:
+            if delta is None:
+                self.replays += 1
+                self._engine = OmahaEngine(len(position_actions))
+                delta = {position: list(moves) for position, moves in position_actions.items()}
+            else:
+                self.extensions += 1
+            self._engine.simulate_all_moves(delta)
+        except OmahaEngineException as e:
+            self._fail(position_actions, e)
+            if self.cache is not None:
+                self.cache.put_failure(position_actions, e)
+            raise
+
+        self._accept(position_actions, self._engine.get_moves_by_street())
+        if self.cache is not None:
+            self.cache.put(position_actions, self._moves)
+        return OmahaSession._copy_moves(self._moves)
+
+    def reset(self):
+        self._engine = None
+        self._accepted = {}
+        self._moves = None
+        self._failed = None
+
+    def _accept(self, position_actions: PositionActions, moves: MovesByStreet):
+        self._failed = None
+        self._accepted = {position: list(moves) for position, moves in position_actions.items()}
+        self._moves = OmahaSession._copy_moves(moves)
+
+    def _fail(self, position_actions: PositionActions, error: OmahaEngineException):
+        # The engine is left half way through the new moves
+        self._engine = None
+        self._accepted = {}
+        self._moves = None
+        self._failed = ({position: list(moves) for position, moves in position_actions.items()}, error)
+
+    def _delta(self, position_actions: PositionActions) -> Optional[PositionActions]:
+        """The moves past the accepted ones, or None if the actions do not extend them."""
+        if self._engine is None or position_actions.keys() != self._accepted.keys():
+            return None
+
+        delta = {}
+        for position, moves in position_actions.items():
+            accepted = self._accepted[position]
+            if moves[:len(accepted)] != accepted:
+                return None
+            delta[position] = list(moves[len(accepted):])
+        return delta
+
+    @staticmethod
+    def _copy_moves(moves: MovesByStreet) -> MovesByStreet:
+        # Snapshots keep the returned lists while the engine keeps appending to its own
+        return {street: list(street_moves) for street, street_moves in moves.items()}
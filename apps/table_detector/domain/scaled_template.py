@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ScaledTemplate:
+    """A template resized once for a scale factor, with its sizes precomputed."""
+    image: np.ndarray
+    scale: float
+    width: int
+    height: int
+    template_width: int
+    template_height: int
@@ -0,0 +1,169 @@
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from loguru import logger
+
+from shared.domain.moves import MoveType
+from shared.domain.position import Position
+from shared.domain.street import Street
+from table_detector.domain.omaha_engine import OmahaEngine, OmahaEngineException
+
+PositionActions = Dict[Position, List[MoveType]]
+MovesByStreet = Dict[Street, List[Tuple[Position, MoveType]]]
+SimulationKey = Tuple[int, Tuple[Tuple[Position, Tuple[MoveType, ...]], ...]]
+
+
+@dataclass
+class SimulationCacheStats:
+    hits: int
+    misses: int
+    failure_hits: int  # Hits that re-raised a cached engine error
+    evictions: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class CachedFailure:
+    """An OmahaEngineException kept without its traceback, so cached entries hold no engine frames."""
+    exception_type: Type[OmahaEngineException]
+    message: str
+    args: Tuple[Any, ...]
+    attributes: Dict[str, Any]
+
+    @classmethod
+    def from_exception(cls, error: OmahaEngineException) -> 'CachedFailure':
+        return cls(type(error), str(error), error.args, dict(vars(error)))
+
+    def to_exception(self) -> OmahaEngineException:
+        # Subclasses such as InvalidActionError take extra constructor arguments, so skip __init__
+        error = self.exception_type.__new__(self.exception_type)
+        error.args = self.args
+        vars(error).update(self.attributes)
+        return error
+
+
+class SimulationCache:
+    """
+    Bounded LRU of OmahaEngine simulations shared by every table in the process.
+
+    The engine's result depends only on the player count and each position's
+    detected moves, and the same sequences show up again and again: across
+    cycles of a table, after a detection flickers back, and on different
+    tables playing the same lines. Entries hold either the moves by street or
+    the engine error the sequence raised, re-raised as a fresh exception on a
+    hit.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[SimulationKey, Union[MovesByStreet, CachedFailure]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._failure_hits = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(position_actions: PositionActions) -> SimulationKey:
+        """Player count plus the moves of every position, independent of dict order."""
+        return len(position_actions), tuple(
+            (position, tuple(moves))
+            for position, moves in sorted(position_actions.items(), key=lambda item: item[0].value)
+        )
+
+    def get(self, position_actions: PositionActions) -> Tuple[bool, Optional[MovesByStreet]]:
+        """(hit, moves by street); raises the cached OmahaEngineException on a hit for a failed sequence."""
+        key = SimulationCache.key(position_actions)
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            entry = self._entries[key]
+            if isinstance(entry, CachedFailure):
+                self._failure_hits += 1
+
+        if isinstance(entry, CachedFailure):
+            raise entry.to_exception()
+        return True, SimulationCache._copy_moves(entry)
+
+    def put(self, position_actions: PositionActions, moves: MovesByStreet):
+        self._put(SimulationCache.key(position_actions), SimulationCache._copy_moves(moves))
+
+    def put_failure(self, position_actions: PositionActions, error: OmahaEngineException):
+        self._put(SimulationCache.key(position_actions), CachedFailure.from_exception(error))
+
+    def simulate(self, position_actions: PositionActions) -> MovesByStreet:
+        """Moves by street for ``position_actions`` (left unmodified), as a fresh OmahaEngine would simulate them."""
+        hit, moves = self.get(position_actions)
+        if hit:
+            return moves
+
+        try:
+            engine = OmahaEngine(len(position_actions))
+            engine.simulate_all_moves({position: list(moves) for position, moves in position_actions.items()})
+        except OmahaEngineException as e:
+            self.put_failure(position_actions, e)
+            raise
+
+        moves = engine.get_moves_by_street()
+        self.put(position_actions, moves)
+        return SimulationCache._copy_moves(moves)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> SimulationCacheStats:
+        with self._lock:
+            return SimulationCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                failure_hits=self._failure_hits,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                max_entries=self.max_entries
+            )
+
+    def log_stats(self):
+        stats = self.get_stats()
+        logger.debug(f"♟️ Simulation cache: {stats.hit_rate:.0%} hit rate ({stats.hits} hits, "
+                     f"{stats.failure_hits} cached errors, {stats.misses} misses), "
+                     f"{stats.entries}/{stats.max_entries} entries, {stats.evictions} evictions")
+
+    def _put(self, key: SimulationKey, entry: Union[MovesByStreet, CachedFailure]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    @staticmethod
+    def _copy_moves(moves: MovesByStreet) -> MovesByStreet:
+        return {street: list(street_moves) for street, street_moves in moves.items()}
+
+
+_cache: Optional[SimulationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_simulation_cache() -> Optional[SimulationCache]:
+    """The process-wide cache, or None when SIMULATION_CACHE_MODE is off."""
+    global _cache
+    if os.getenv('SIMULATION_CACHE_MODE', 'true').lower() != 'true':
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SimulationCache(int(os.getenv('SIMULATION_CACHE_SIZE', '4096')))
+        return _cache
@@ -0,0 +1,171 @@
+import argparse
+import multiprocessing
+import threading
+from dataclasses import dataclass, asdict
+from itertools import chain, combinations, permutations
+from math import comb
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from shared.domain.hand_evaluator import DECK_SIZE, decode_card, encode_cards
+from shared.domain.starting_hands import EQUITY_SCALE, STARTING_HAND_TABLE_PATH
+from table_detector.domain.hand_rank_table import BINOMIALS
+
+STARTING_HAND_COUNT = comb(DECK_SIZE, 4)
+# Starting hands that differ only by a renaming of suits play the same preflop
+CANONICAL_CLASS_COUNT = 16432
+
+DEFAULT_TABLE_PATH = STARTING_HAND_TABLE_PATH
+
+SUIT_PERMUTATIONS = np.array(list(permutations(range(4))), dtype=np.int8)
+
+
+@dataclass
+class StartingHand:
+    class_id: int
+    canonical: str  # Representative hand of the class, highest card first, e.g. "AD AC KD KC"
+    equity: float  # Heads-up all-in equity against a random hand
+    top_share: float  # Share of all starting hands at least this strong
+    combos: int  # Starting hands in the class
+
+    def to_dict(self) -> Dict:
+        return {key: round(value, 4) if isinstance(value, float) else value for key, value in asdict(self).items()}
+
+
+def starting_hand_indices(hands: np.ndarray) -> np.ndarray:
+    """Colex index (0 to 270724) of 4-card hands (..., 4) with cards ascending."""
+    hands = np.asarray(hands, dtype=np.intp)
+    return sum(BINOMIALS[k].take(hands[..., k]) for k in range(4))
+
+
+def canonical_indices(hands: np.ndarray) -> np.ndarray:
+    """
+    Index of the canonical form of 4-card hands (N, 4): the smallest colex
+    index over all 24 renamings of the suits.
+    """
+    hands = np.asarray(hands, dtype=np.int8)
+    renamed = (hands >> 2)[None] * 4 + SUIT_PERMUTATIONS[:, hands & 3]
+    return starting_hand_indices(np.sort(renamed, axis=-1)).min(axis=0)
+
+
+def all_starting_hands() -> np.ndarray:
+    """Every 4-card hand, cards ascending, ordered by colex index."""
+    hands = np.fromiter(chain.from_iterable(combinations(range(DECK_SIZE), 4)), dtype=np.int8,
+                        count=4 * STARTING_HAND_COUNT).reshape(-1, 4)
+    ordered = np.empty_like(hands)
+    ordered[starting_hand_indices(hands)] = hands
+    return ordered
+
+
+def build_classes() -> Tuple[np.ndarray, np.ndarray]:
+    """(class id of every starting hand by colex index, representative cards of every class)."""
+    hands = all_starting_hands()
+    canonical, hand_classes = np.unique(canonical_indices(hands), return_inverse=True)
+    return hand_classes.astype(np.uint16), hands[canonical]
+
+
+def _class_equities(job: Tuple[np.ndarray, int, int]) -> List[float]:
+    # Only building the table needs the equity service
+    from table_detector.domain.hand_rank_table import get_hand_rank_table
+    from table_detector.services.equity_service import EquityService
+
+    representatives, trials, seed = job
+    service = EquityService(max_trials=trials, time_budget_ms=float('inf'), seed=seed,
+                            rank_hands=get_hand_rank_table().rank_many)
+    return [service.calculate([decode_card(card) for card in cards], [], 1).equity for cards in representatives]
+
+
+def build_starting_hand_table(path: Path = DEFAULT_TABLE_PATH, trials: int = 2000, workers: int = 0,
+                              chunk_size: int = 256):
+    """Simulate every class's heads-up equity across ``workers`` processes and save the table."""
+    hand_classes, representatives = build_classes()
+    jobs = [(representatives[start:start + chunk_size], trials, start)
+            for start in range(0, len(representatives), chunk_size)]
+    workers = workers or multiprocessing.cpu_count()
+    logger.info(f"🃏 Simulating {len(representatives)} starting hand classes, {trials} trials each, "
+                f"on {workers} processes")
+
+    equities = []
+    with multiprocessing.Pool(workers) as pool:
+        for done, chunk in enumerate(pool.imap(_class_equities, jobs), start=1):
+            equities.extend(chunk)
+            if done % 10 == 0 or done == len(jobs):
+                logger.info(f"🃏 {len(equities)}/{len(representatives)} classes simulated")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, hand_classes=hand_classes, representatives=representatives,
+                        equities=np.round(np.array(equities) * EQUITY_SCALE).astype(np.uint16))
+    logger.info(f"🃏 Saved starting hand table to {path}")
+
+
+class StartingHandTable:
+    """
+    Preflop strength of PLO starting hands by suit-isomorphic class.
+
+    Every one of the 270,725 starting hands maps to one of 16,432 classes
+    (hands equal up to renaming suits), and every class has a heads-up
+    equity simulated offline by ``build_starting_hand_table``. A lookup is
+    the hand's colex index into the class array and the class's row: O(1).
+    """
+
+    def __init__(self, hand_classes: np.ndarray, representatives: np.ndarray, equities: np.ndarray):
+        self.hand_classes = hand_classes
+        self.representatives = representatives
+        self.equities = equities.astype(np.float64) / EQUITY_SCALE
+        self.combos = np.bincount(hand_classes, minlength=len(equities))
+
+        # Strongest first; classes of equal equity share their top share
+        order = np.argsort(-self.equities, kind='stable')
+        at_least = np.cumsum(self.combos[order])
+        strength_rank = np.searchsorted(-self.equities[order], -self.equities, side='right') - 1
+        self.top_shares = at_least[strength_rank] / STARTING_HAND_COUNT
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_TABLE_PATH) -> 'StartingHandTable':
+        with np.load(path) as data:
+            table = cls(data['hand_classes'], data['representatives'], data['equities'])
+        logger.info(f"🃏 Loaded {len(table.equities)} starting hand classes")
+        return table
+
+    def lookup(self, card_names: Sequence[str]) -> Optional[StartingHand]:
+        """Strength of four hole cards ("AS", "Kh", ...), None unless they are four distinct cards."""
+        try:
+            cards = sorted(encode_cards(card_names))
+        except ValueError:
+            return None
+        if len(cards) != 4 or len(set(cards)) != 4:
+            return None
+
+        class_id = int(self.hand_classes[sum(comb(card, k + 1) for k, card in enumerate(cards))])
+        return StartingHand(
+            class_id=class_id,
+            canonical=' '.join(decode_card(int(card)) for card in self.representatives[class_id][::-1]),
+            equity=float(self.equities[class_id]),
+            top_share=float(self.top_shares[class_id]),
+            combos=int(self.combos[class_id])
+        )
+
+
+_table: Optional[StartingHandTable] = None
+_table_lock = threading.Lock()
+
+
+def get_starting_hand_table() -> StartingHandTable:
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = StartingHandTable.load()
+        return _table
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the PLO starting hand strength table")
+    parser.add_argument('--trials', type=int, default=2000, help="Monte Carlo trials per class")
+    parser.add_argument('--workers', type=int, default=0, help="Processes (default: one per core)")
+    parser.add_argument('--output', type=Path, default=DEFAULT_TABLE_PATH)
+    args = parser.parse_args()
+    build_starting_hand_table(args.output, args.trials, args.workers)
@@ -0,0 +1,125 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class TemplateStack:
+    """
+    Same-size templates of one category stacked into a single contiguous tensor.
+
+    Holds everything the batched matcher needs so that nothing is re-derived per
+    match call: the float32 stack, per-template L2 norms, an optional grayscale
+    variant and the FFT spectra of the (flipped) templates for each padded
+    search shape that has been requested so far.
+    """
+
+    def __init__(self, names: List[str], templates: List[np.ndarray], scale: float = 1.0,
+                 template_size: Optional[Tuple[int, int]] = None):
+        if not names or len(names) != len(templates):
+            raise ValueError("TemplateStack needs one name per template")
+
+        # Single-channel templates (e.g. rank glyphs) are kept as (h, w, 1)
+        templates = [t[..., None] if t.ndim == 2 else t for t in templates]
+
+        self.names = list(names)
+        self.height, self.width = templates[0].shape[:2]
+        self.templates = np.ascontiguousarray(np.stack(templates).astype(np.float32))
+        self.norms = TemplateStack._compute_norms(self.templates)
+
+        # Scale relative to the original templates and their unscaled (width, height)
+        self.scale = scale
+        self.template_size = template_size or (self.width, self.height)
+
+        self._grayscale = None
+        self._grayscale_norms = None
+        self._spectra: Dict[Tuple[int, int, bool], np.ndarray] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def from_templates(templates: Dict[str, np.ndarray]) -> List['TemplateStack']:
+        """Group a template dictionary into stacks of equally sized templates."""
+        groups: Dict[Tuple[int, int], List[str]] = {}
+        for template_name, template in templates.items():
+            groups.setdefault(template.shape[:2], []).append(template_name)
+
+        return [
+            TemplateStack(names, [templates[name] for name in names])
+            for names in groups.values()
+        ]
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Template size as (width, height)."""
+        return self.width, self.height
+
+    def rescaled(self, scale: float) -> 'TemplateStack':
+        """New stack with every template resized by ``scale`` (relative to the originals)."""
+        template_w, template_h = self.template_size
+        scaled_size = (int(template_w * scale), int(template_h * scale))
+        templates = [cv2.resize(t, scaled_size) for t in self.templates]
+        return TemplateStack(self.names, templates, scale=scale, template_size=self.template_size)
+
+    @property
+    def channels(self) -> int:
+        return self.templates.shape[-1]
+
+    @property
+    def grayscale(self) -> np.ndarray:
+        self._ensure_grayscale()
+        return self._grayscale
+
+    def get_norms(self, grayscale: bool = False) -> np.ndarray:
+        if grayscale:
+            self._ensure_grayscale()
+            return self._grayscale_norms
+        return self.norms
+
+    def _ensure_grayscale(self):
+        if self._grayscale is None:
+            with self._lock:
+                if self._grayscale is None:
+                    if self.channels == 1:
+                        gray = self.templates[..., 0]
+                    else:
+                        gray = np.stack([cv2.cvtColor(t, cv2.COLOR_BGR2GRAY) for t in self.templates])
+                    self._grayscale_norms = TemplateStack._compute_norms(gray)
+                    self._grayscale = np.ascontiguousarray(gray)
+
+    def get_spectra(self, fft_shape: Tuple[int, int], grayscale: bool = False) -> np.ndarray:
+        """
+        Spectra of the flipped templates zero-padded to ``fft_shape``.
+
+        Color stacks are returned channel-first as (C, n, fh, fw // 2 + 1) so the
+        matcher can accumulate channels with plain in-place products.
+        """
+        key = (fft_shape[0], fft_shape[1], grayscale)
+        spectra = self._spectra.get(key)
+        if spectra is None:
+            with self._lock:
+                spectra = self._spectra.get(key)
+                if spectra is None:
+                    spectra = self._build_spectra(fft_shape, grayscale)
+                    self._spectra[key] = spectra
+        return spectra
+
+    def _build_spectra(self, fft_shape: Tuple[int, int], grayscale: bool) -> np.ndarray:
+        if grayscale:
+            flipped = self.grayscale[:, ::-1, ::-1]
+            return np.fft.rfft2(flipped, s=fft_shape, axes=(1, 2)).astype(np.complex64)[None]
+
+        flipped = self.templates[:, ::-1, ::-1, :]
+        spectra = np.fft.rfft2(flipped, s=fft_shape, axes=(1, 2)).astype(np.complex64)
+        return np.ascontiguousarray(np.moveaxis(spectra, -1, 0))
+
+    @staticmethod
+    def _compute_norms(stack: np.ndarray) -> np.ndarray:
+        flat = stack.reshape(len(stack), -1).astype(np.float64)
+        return np.sqrt(np.einsum('ij,ij->i', flat, flat))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"TemplateStack(size={self.width}x{self.height}, templates={len(self.names)})"
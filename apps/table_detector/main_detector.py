@@ -7,6 +7,7 @@ from flask.cli import load_dotenv
 from loguru import logger
 
 from table_detector.detection_client import DetectionClient
+from table_detector.services.replay_capture_backend import ReplayCaptureBackend
 
 
 from table_detector.connectors.server_connector import SimpleHttpConnector, ServerConfig
@@ -63,6 +64,9 @@ DETECTION_INTERVAL = int(os.getenv('DETECTION_INTERVAL', '3'))
 CONNECTION_TIMEOUT = int(os.getenv('CONNECTION_TIMEOUT', '10'))
 RETRY_ATTEMPTS = int(os.getenv('RETRY_ATTEMPTS', '1'))
 DEBUG_MODE = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+# Replay a recorded session (results folder or zip) instead of capturing live windows
+REPLAY_SOURCE = os.getenv('REPLAY_SOURCE')
+REPLAY_SPEED = float(os.getenv('REPLAY_SPEED', '1.0'))  # 0 = as fast as possible
 
 
 def main():
@@ -94,6 +98,14 @@ def main():
         # Registration will happen automatically when sending data
         logger.info("📝 Registration will occur automatically when sending data")
 
+        if REPLAY_SOURCE:
+            replay_backend = ReplayCaptureBackend(REPLAY_SOURCE, speed=REPLAY_SPEED)
+            try:
+                detection_client.run_replay(replay_backend)
+            finally:
+                replay_backend.close()
+            return
+
         # Start detection (works regardless of server connectivity)
         logger.info("🚀 Starting poker detection...")
         detection_client.start_detection()
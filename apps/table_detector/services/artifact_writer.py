@@ -0,0 +1,173 @@
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2
+import numpy as np
+from loguru import logger
+
+DROP_NEWEST = 'drop_newest'
+DROP_OLDEST = 'drop_oldest'
+
+
+@dataclass
+class ArtifactWriterStats:
+    submitted: int
+    written: int
+    dropped: int
+    failed: int
+    backlog: int
+    max_backlog: int
+    bytes_written: int
+    avg_write_ms: float
+    last_flush_ms: float
+
+
+class ArtifactWriter:
+    """
+    Bounded background writer for screenshot artifacts.
+
+    The detection cycle only enqueues frames; PNG encoding and disk I/O happen on
+    a worker thread. When the queue is full the newest frame is rejected
+    (``drop_newest``) or the oldest pending one is evicted (``drop_oldest``), so
+    a slow disk can never stall detection.
+    """
+
+    def __init__(self, max_queue_size: int = 32, compression: int = 1, drop_policy: str = DROP_NEWEST):
+        if drop_policy not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+
+        self.compression = compression
+        self.drop_policy = drop_policy
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+
+        self._stats_lock = threading.Condition()
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._pending = 0
+        self._max_backlog = 0
+        self._bytes_written = 0
+        self._write_seconds = 0.0
+        self._last_flush_ms = 0.0
+
+        self._worker = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def from_env(cls) -> 'ArtifactWriter':
+        return cls(
+            max_queue_size=int(os.getenv('ARTIFACT_QUEUE_SIZE', '32')),
+            compression=int(os.getenv('PNG_COMPRESSION', '1')),
+            drop_policy=os.getenv('ARTIFACT_DROP_POLICY', DROP_NEWEST).lower()
+        )
+
+    def submit(self, image: np.ndarray, filepath: str) -> bool:
+        """Queue ``image`` (BGR) for writing to ``filepath``; False if it was dropped."""
+        with self._stats_lock:
+            self._submitted += 1
+            # Count the item before the worker can see it, so its decrement never runs first.
+            self._pending += 1
+
+        item = (image, str(filepath))
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if self.drop_policy == DROP_NEWEST:
+                self._release_pending()
+                self._record_drop(filepath)
+                return False
+
+            try:
+                evicted = self._queue.get_nowait()
+                self._queue.task_done()
+                self._record_drop(evicted[1], evicted=True)
+                self._queue.put_nowait(item)
+            except (queue.Empty, queue.Full):
+                self._release_pending()
+                self._record_drop(filepath)
+                return False
+
+        with self._stats_lock:
+            self._max_backlog = max(self._max_backlog, self._queue.qsize())
+        return True
+
+    def _release_pending(self):
+        with self._stats_lock:
+            self._pending -= 1
+            self._stats_lock.notify_all()
+
+    def _record_drop(self, filepath: str, evicted: bool = False):
+        with self._stats_lock:
+            self._dropped += 1
+            if evicted:
+                self._pending -= 1
+                self._stats_lock.notify_all()
+        logger.warning(f"⚠️ Artifact writer saturated, dropped {os.path.basename(filepath)}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued artifact is written; False on timeout."""
+        start_time = time.perf_counter()
+        with self._stats_lock:
+            flushed = self._stats_lock.wait_for(lambda: self._pending == 0, timeout)
+            self._last_flush_ms = (time.perf_counter() - start_time) * 1000
+        return flushed
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Flush outstanding artifacts and stop the worker."""
+        if not self.flush(timeout):
+            logger.warning(f"⚠️ Artifact writer closed with {self._queue.qsize()} unwritten artifacts")
+        self._queue.put(None)
+        self._worker.join(timeout)
+        logger.info(f"💾 Artifact writer stopped: {self.get_stats()}")
+
+    def get_stats(self) -> ArtifactWriterStats:
+        with self._stats_lock:
+            return ArtifactWriterStats(
+                submitted=self._submitted,
+                written=self._written,
+                dropped=self._dropped,
+                failed=self._failed,
+                backlog=self._queue.qsize(),
+                max_backlog=self._max_backlog,
+                bytes_written=self._bytes_written,
+                avg_write_ms=self._write_seconds * 1000 / self._written if self._written else 0.0,
+                last_flush_ms=self._last_flush_ms
+            )
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            image, filepath = item
+            start_time = time.perf_counter()
+            written = self._write(image, filepath)
+            elapsed = time.perf_counter() - start_time
+
+            with self._stats_lock:
+                if written:
+                    self._written += 1
+                    self._write_seconds += elapsed
+                    self._bytes_written += os.path.getsize(filepath)
+                else:
+                    self._failed += 1
+                self._pending -= 1
+                self._stats_lock.notify_all()
+            self._queue.task_done()
+
+    def _write(self, image: np.ndarray, filepath: str) -> bool:
+        try:
+            os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+            if not cv2.imwrite(filepath, image, [cv2.IMWRITE_PNG_COMPRESSION, self.compression]):
+                raise IOError("cv2.imwrite returned False")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to write artifact {filepath}: {e}")
+            return False
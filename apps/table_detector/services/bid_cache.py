@@ -0,0 +1,95 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+
+from shared.domain.detected_bid import DetectedBid
+
+
+@dataclass
+class BidCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BidCache:
+    """
+    Bounded LRU of bid reads for one table, keyed by seat and a fingerprint of
+    the raw seat crop.
+
+    Bid chips stay on the felt for several cycles, so an unchanged crop is not
+    read again. Seats that showed no bid are cached too (as None). Everything
+    is dropped when the table's hand changes, since a new hand starts with new
+    bids and the old entries can never match again.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[int, bytes], Optional[DetectedBid]]' = OrderedDict()
+        self._hand: Optional[Hashable] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def fingerprint(region: np.ndarray) -> bytes:
+        return hashlib.blake2b(np.ascontiguousarray(region).data, digest_size=16).digest()
+
+    def get(self, position: int, fingerprint: bytes) -> Tuple[bool, Optional[DetectedBid]]:
+        """(hit, bid); bid is None on a hit for a seat that showed no bid."""
+        key = (position, fingerprint)
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, self._entries[key]
+
+    def put(self, position: int, fingerprint: bytes, bid: Optional[DetectedBid]):
+        key = (position, fingerprint)
+        with self._lock:
+            self._entries[key] = bid
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def update_hand(self, hand: Hashable) -> bool:
+        """Record the table's current hand (e.g. the hero cards); invalidates and returns True when it changed."""
+        with self._lock:
+            if hand == self._hand:
+                return False
+            self._hand = hand
+        self.invalidate()
+        return True
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def get_stats(self) -> BidCacheStats:
+        with self._lock:
+            return BidCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self.max_entries
+            )
@@ -1,4 +1,5 @@
-from typing import Dict, Tuple, List
+import os
+from typing import Dict, Tuple, List, Optional
 
 import cv2
 import numpy as np
@@ -6,6 +7,9 @@ import pytesseract
 from loguru import logger
 
 from shared.domain.detected_bid import DetectedBid
+from table_detector.services.bid_cache import BidCache
+from table_detector.services.bid_digit_recognizer import get_bid_digit_recognizer
+from table_detector.services.bid_ocr_engine import BidOcrEngine, get_bid_ocr_engine
 
 # Player position coordinates (position_id: (x, y, width, height))
 PLAYER_BID_POSITIONS = {
@@ -33,13 +37,23 @@ TESSERACT_CONFIG = (
     "-c load_system_dawg=0 -c load_freq_dawg=0"
 )
 
+# White space (in upscaled pixels) around and between seat tiles in the batched composite
+TILE_MARGIN = 40
 
-def detect_bids(cv2_image: np.ndarray, debug = False) -> Dict[int, DetectedBid]:
+
+def detect_bids(cv2_image: np.ndarray, debug = False, batched: Optional[bool] = None,
+                recognizer: Optional[str] = None, cache: Optional[BidCache] = None) -> Dict[int, DetectedBid]:
     """
     Detect bid amounts for all player positions
 
     Args:
         cv2_image: Full poker table screenshot
+        batched: OCR all seats in one call (default from BID_OCR_BATCHED, false: the
+            batched read still misses a seat on the bid fixtures)
+        recognizer: 'ocr' to OCR every seat, 'template' to read digits by glyph
+            templates and OCR only the seats they cannot read (default from
+            BID_RECOGNIZER, 'ocr'; the template set is still incomplete)
+        cache: The table's bid cache; seats whose raw crop is cached are not read again
 
     Returns:
         Dictionary mapping position number to DetectedBid object
@@ -48,78 +62,188 @@ def detect_bids(cv2_image: np.ndarray, debug = False) -> Dict[int, DetectedBid]:
 
     try:
         # First extract all regions
-        processed_regions = {}
+        regions = {}
         for position, bounds in PLAYER_BID_POSITIONS.items():
             x, y, w, h = bounds
-            region = cv2_image[y:y + h, x:x + w]
-            processed_regions[position] = _preprocess_bid_region(region)
+            regions[position] = cv2_image[y:y + h, x:x + w]
 
         # Visualize all processed regions on single plot
         if debug:
             import matplotlib.pyplot as plt
             fig, axes = plt.subplots(2, 3, figsize=(12, 8))
             axes = axes.ravel()
-            for idx, (position, processed_region) in enumerate(processed_regions.items()):
-                axes[idx].imshow(processed_region, cmap='gray')
+            for idx, (position, region) in enumerate(regions.items()):
+                axes[idx].imshow(_preprocess_bid_region(region), cmap='gray')
                 axes[idx].set_title(f'Position {position}')
             plt.tight_layout()
             plt.show()
 
+        fingerprints = {}
+        if cache is not None:
+            for position, region in list(regions.items()):
+                fingerprints[position] = BidCache.fingerprint(region)
+                hit, cached_bid = cache.get(position, fingerprints[position])
+                if hit:
+                    del regions[position]
+                    if cached_bid is not None:
+                        detected_bids[position] = cached_bid
+
+        if recognizer is None:
+            recognizer = os.getenv('BID_RECOGNIZER', 'ocr').lower()
+
+        bid_texts = {}
+        if recognizer == 'template':
+            for position, region in regions.items():
+                bid_text = _read_bid_text_with_templates(region)
+                if bid_text is not None:
+                    bid_texts[position] = bid_text
+
+        unread_regions = {
+            position: _preprocess_bid_region(region)
+            for position, region in regions.items() if position not in bid_texts
+        }
+        if unread_regions:
+            bid_texts.update(_extract_bid_texts(unread_regions, batched))
+
         # Process each region for bids
-        for position, processed_region in processed_regions.items():
+        for position, bid_text in sorted(bid_texts.items()):
             bounds = PLAYER_BID_POSITIONS[position]
-            bid_text = _extract_bid_text(processed_region, bounds)
 
+            detected_bid = None
             if bid_text and _is_valid_bid_text(bid_text):
                 detected_bid = _create_detected_bid(position, bid_text, bounds)
                 detected_bids[position] = detected_bid
                 logger.info(f"Position {position}: ${bid_text}")
+            if cache is not None:
+                cache.put(position, fingerprints[position], detected_bid)
 
-        return detected_bids
+        return dict(sorted(detected_bids.items()))
 
     except Exception as e:
         logger.error(f"❌ Error detecting bids: {str(e)}")
         return {}
 
 
-def _extract_bid_text(processed_region, bounds: Tuple[int, int, int, int]) -> str:
-    """Extract bid text from specific image region using OCR"""
+def _read_bid_text_with_templates(region: np.ndarray) -> Optional[str]:
+    """Bid text of a raw seat region by digit templates; None when OCR has to read it"""
     try:
-        # Get detailed OCR data with confidence scores and positions
-        data = pytesseract.image_to_data(processed_region, config=TESSERACT_CONFIG, output_type=pytesseract.Output.DICT)
+        return get_bid_digit_recognizer().read(region)
+    except Exception as e:
+        logger.error(f"❌ Error reading bid digits: {str(e)}")
+        return None
 
-        # Filter for high-confidence text detections
-        valid_texts = []
-        for i in range(len(data['text'])):
-            text = data['text'][i].strip()
-            conf = int(data['conf'][i])
 
-            # Only consider non-empty text with decent confidence
-            if text and conf > 40:
-                valid_texts.append({
-                    'text': text,
-                    'conf': conf,
-                    'left': data['left'][i],
-                    'top': data['top'][i],
-                    'width': data['width'][i],
-                    'height': data['height'][i]
-                })
+def _extract_bid_texts(processed_regions: Dict[int, np.ndarray], batched: Optional[bool] = None) -> Dict[int, str]:
+    """OCR the preprocessed seat regions, all in one call or one call per seat"""
+    if batched is None:
+        batched = os.getenv('BID_OCR_BATCHED', 'false').lower() == 'true'
+    if batched:
+        return _extract_bid_texts_batched(processed_regions)
 
-        if not valid_texts:
-            return ""
+    bid_texts = {}
+    for position, processed_region in processed_regions.items():
+        bid_text = _extract_bid_text(processed_region, PLAYER_BID_POSITIONS[position])
+        # A failed read is left out, so it is neither reported nor cached as an empty seat
+        if bid_text is not None:
+            bid_texts[position] = bid_text
+    return bid_texts
 
-        # Sort by confidence (highest first)
-        valid_texts.sort(key=lambda x: x['conf'], reverse=True)
 
-        # Try to combine separate detections into a single bid amount
-        combined_text = _combine_bid_detections(valid_texts)
+def _extract_bid_text(processed_region, bounds: Tuple[int, int, int, int]) -> Optional[str]:
+    """Extract bid text from specific image region using OCR; None if OCR failed"""
+    try:
+        # Get detailed OCR data with confidence scores and positions
+        data = pytesseract.image_to_data(processed_region, config=TESSERACT_CONFIG, output_type=pytesseract.Output.DICT)
+
+        words = [
+            {
+                'text': data['text'][i],
+                'conf': int(data['conf'][i]),
+                'left': data['left'][i],
+                'top': data['top'][i],
+                'width': data['width'][i],
+                'height': data['height'][i]
+            }
+            for i in range(len(data['text']))
+        ]
 
-        return combined_text
+        return _combine_words(words)
 
     except Exception as e:
         logger.error(f"❌ Error extracting bid text at {bounds}: {str(e)}")
+        return None
+
+
+def _extract_bid_texts_batched(processed_regions: Dict[int, np.ndarray],
+                               engine: Optional[BidOcrEngine] = None) -> Dict[int, str]:
+    """
+    Extract the bid text of every seat with a single OCR call: the seat regions
+    are stacked into one composite image and each word is mapped back to the
+    seat whose tile contains its vertical center.
+    """
+    try:
+        composite, tile_rows = _compose_bid_tiles(processed_regions)
+        words = (engine or get_bid_ocr_engine()).read_words(composite)
+    except Exception as e:
+        logger.error(f"❌ Error extracting batched bid text: {str(e)}")
+        return {}
+
+    words_by_position: Dict[int, List[Dict]] = {position: [] for position in processed_regions}
+    for word in words:
+        center_y = word['top'] + word['height'] / 2
+        for position, (top, bottom) in tile_rows.items():
+            if top <= center_y < bottom:
+                # Tile-relative coordinates, as if the seat had been read on its own
+                words_by_position[position].append(dict(word, left=word['left'] - TILE_MARGIN, top=word['top'] - top))
+                break
+
+    return {position: _combine_words(position_words) for position, position_words in words_by_position.items()}
+
+
+def _compose_bid_tiles(processed_regions: Dict[int, np.ndarray]) -> Tuple[np.ndarray, Dict[int, Tuple[int, int]]]:
+    """
+    Stack the preprocessed seat regions top to bottom on a white canvas.
+
+    Returns:
+        The composite image and each position's (top, bottom) row range in it
+    """
+    width = max(region.shape[1] for region in processed_regions.values()) + 2 * TILE_MARGIN
+    height = sum(region.shape[0] for region in processed_regions.values()) + \
+        TILE_MARGIN * (len(processed_regions) + 1)
+    composite = np.full((height, width), 255, dtype=np.uint8)
+
+    tile_rows = {}
+    top = TILE_MARGIN
+    for position, region in processed_regions.items():
+        region_height, region_width = region.shape[:2]
+        composite[top:top + region_height, TILE_MARGIN:TILE_MARGIN + region_width] = region
+        # Words may overhang a tile slightly, so each tile owns half the gap on both sides
+        tile_rows[position] = (top - TILE_MARGIN // 2, top + region_height + TILE_MARGIN // 2)
+        top += region_height + TILE_MARGIN
+
+    return composite, tile_rows
+
+
+def _combine_words(words: List[Dict]) -> str:
+    """Keep the confident, non-empty words and combine them into a single bid amount"""
+    # Filter for high-confidence text detections
+    valid_texts = []
+    for word in words:
+        text = word['text'].strip()
+
+        # Only consider non-empty text with decent confidence
+        if text and word['conf'] > 40:
+            valid_texts.append(dict(word, text=text))
+
+    if not valid_texts:
         return ""
 
+    # Sort by confidence (highest first)
+    valid_texts.sort(key=lambda x: x['conf'], reverse=True)
+
+    # Try to combine separate detections into a single bid amount
+    return _combine_bid_detections(valid_texts)
+
 
 def _combine_bid_detections(detections: List[Dict]) -> str:
     """Combine multiple OCR detections into a single bid amount"""
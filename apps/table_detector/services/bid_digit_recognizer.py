@@ -0,0 +1,229 @@
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+# Bid text is near-white on a dark pill; anything above this gray level is ink
+INK_THRESHOLD = 150
+# Gray level of the pill itself, the zero of the ink intensity glyphs are matched on
+BACKGROUND_LEVEL = 100
+
+# Glyphs are compared on a fixed canvas (the font renders digits 8px tall at table size)
+GLYPH_HEIGHT = 8
+GLYPH_WIDTH = 9
+
+# Horizontal offsets tried when matching, to absorb sub-pixel rendering differences
+MATCH_SHIFTS = (-1, 0, 1)
+
+# Minimum normalized correlation for a glyph to be read as a template character, and the lead it
+# needs over the runner-up
+MIN_MATCH_SCORE = 0.8
+MIN_MATCH_MARGIN = 0.1
+
+# A digit without a template of its own can still clear both thresholds against a similar one (a 6
+# reads as a 5), so glyphs are only classified once every digit has a template
+DIGITS = "0123456789"
+
+DEFAULT_TEMPLATES_DIR = Path(__file__).parent.parent / "resources" / "templates" / "canada" / "bid_digits"
+
+
+class BidDigitRecognizer:
+    """
+    Reads bid amounts straight from the raw seat crop by glyph templates.
+
+    The crop is thresholded, split into characters at empty columns and each
+    character is classified against every digit template in one matrix
+    product. Decimal points are recognized by shape (a short blob on the
+    baseline) rather than by template.
+
+    Incomplete: templates exist only for 0, 1, 3 and 5. Until they cover
+    every digit, only empty seats are read and any seat showing glyphs is
+    left to OCR, so BID_RECOGNIZER defaults to 'ocr'. ``allow_partial``
+    classifies against an incomplete set anyway, for measuring the templates
+    that exist.
+    """
+
+    def __init__(self, templates: Dict[str, np.ndarray], allow_partial: bool = False):
+        self.allow_partial = allow_partial
+        self.characters: List[str] = []
+        vectors = []
+        for name, template in sorted(templates.items()):
+            self.characters.append(name[0])
+            vectors.append(BidDigitRecognizer._normalize(BidDigitRecognizer._to_canvas(template)))
+        self._template_matrix = np.stack(vectors) if vectors else np.zeros((0, GLYPH_HEIGHT * GLYPH_WIDTH))
+        self.missing_digits = [digit for digit in DIGITS if digit not in self.characters]
+
+    @classmethod
+    def load(cls, templates_dir: Path = DEFAULT_TEMPLATES_DIR, allow_partial: bool = False) -> 'BidDigitRecognizer':
+        """Templates are <character>.png, or <character>_<variant>.png for extra variants."""
+        templates = {}
+        for path in Path(templates_dir).glob('*.png'):
+            templates[path.stem] = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        logger.info(f"🔢 Loaded {len(templates)} bid digit templates: {sorted(templates)}")
+        recognizer = cls(templates, allow_partial)
+        if recognizer.missing_digits and not allow_partial:
+            logger.warning(f"⚠️ No bid digit templates for {''.join(recognizer.missing_digits)}: "
+                           f"seats showing a bid are read by OCR")
+        return recognizer
+
+    def read(self, region: np.ndarray) -> Optional[str]:
+        """
+        Bid text of a raw seat crop: "" when the seat shows no bid, None when it
+        shows something the templates cannot read (anything, while a digit has
+        no template).
+        """
+        gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY) if len(region.shape) == 3 else region
+        segments = BidDigitRecognizer.segment(gray > INK_THRESHOLD)
+        if segments is None:
+            return None
+        if not segments:
+            return ""
+        if self.missing_digits and not self.allow_partial:
+            return None
+
+        ink = BidDigitRecognizer._ink(gray)
+        glyphs = [ink[top:bottom, left:right] for kind, (left, right, top, bottom) in segments if kind == 'glyph']
+        if not glyphs:
+            return None
+        characters = self.classify(glyphs)
+        if characters is None:
+            return None
+
+        text = ""
+        glyph_index = 0
+        for kind, _ in segments:
+            if kind == 'dot':
+                text += '.'
+            else:
+                text += characters[glyph_index]
+                glyph_index += 1
+        return text
+
+    def classify(self, glyphs: List[np.ndarray]) -> Optional[List[str]]:
+        """Best template character per glyph, or None if any glyph matches no template well."""
+        if not len(self._template_matrix):
+            return None
+
+        # Every glyph at every shift as one row, scored against all templates at once
+        candidates = np.stack([
+            BidDigitRecognizer._normalize(np.roll(BidDigitRecognizer._to_canvas(glyph), shift, axis=1))
+            for glyph in glyphs for shift in MATCH_SHIFTS
+        ])
+        scores = (candidates @ self._template_matrix.T).reshape(len(glyphs), len(MATCH_SHIFTS), -1).max(axis=1)
+
+        ranked = np.sort(scores, axis=1)
+        best_scores = ranked[:, -1]
+        runner_up_scores = ranked[:, -2] if ranked.shape[1] > 1 else np.full(len(glyphs), -1.0)
+        if (best_scores < MIN_MATCH_SCORE).any() or (best_scores - runner_up_scores < MIN_MATCH_MARGIN).any():
+            return None
+        return [self.characters[index] for index in scores.argmax(axis=1)]
+
+    @staticmethod
+    def segment(mask: np.ndarray) -> Optional[List[Tuple[str, Tuple[int, int, int, int]]]]:
+        """
+        Split an ink mask into ('glyph' | 'dot', (left, right, top, bottom))
+        segments by column projection, left to right. Partial blobs cut by
+        the crop border (chip icons, neighbouring badges) are ignored; None
+        means the ink does not look like a bid.
+        """
+        runs = BidDigitRecognizer._column_runs(mask.any(axis=0))
+        if not runs:
+            return []
+
+        rows_per_run = [np.flatnonzero(mask[:, left:right].any(axis=1)) for left, right in runs]
+        line_height = max(rows[-1] - rows[0] + 1 for rows in rows_per_run)
+        glyph_rows = [rows for rows in rows_per_run if rows[-1] - rows[0] + 1 >= line_height * 0.75]
+        line_top = min(rows[0] for rows in glyph_rows)
+        line_bottom = max(rows[-1] for rows in glyph_rows) + 1
+
+        segments = []
+        for (left, right), rows in zip(runs, rows_per_run):
+            touches_border = left == 0 or right == mask.shape[1]
+            height = rows[-1] - rows[0] + 1
+            if height >= line_height * 0.75:
+                if touches_border:
+                    continue
+                segments.append(('glyph', (left, right, line_top, line_bottom)))
+            elif rows[0] >= line_bottom - 3 and right - left <= 3:
+                segments.append(('dot', (left, right, rows[0], rows[-1] + 1)))
+            elif not touches_border:
+                return None
+
+        if not any(kind == 'glyph' for kind, _ in segments):
+            return None if segments else []
+        return segments
+
+    @staticmethod
+    def build_templates(samples: Iterable[Tuple[np.ndarray, str]]) -> Dict[str, np.ndarray]:
+        """
+        Average the glyphs of raw seat crops with known bid text into one
+        template per character.
+        """
+        glyphs: Dict[str, List[np.ndarray]] = {}
+        for region, text in samples:
+            gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY) if len(region.shape) == 3 else region
+            segments = BidDigitRecognizer.segment(gray > INK_THRESHOLD) or []
+            ink = BidDigitRecognizer._ink(gray)
+            characters = [character for character in text if character != '.']
+            glyph_boxes = [box for kind, box in segments if kind == 'glyph']
+            if len(glyph_boxes) != len(characters):
+                logger.warning(f"⚠️ Skipping bid sample '{text}': found {len(glyph_boxes)} glyphs")
+                continue
+            for character, (left, right, top, bottom) in zip(characters, glyph_boxes):
+                glyphs.setdefault(character, []).append(
+                    BidDigitRecognizer._to_canvas(ink[top:bottom, left:right]))
+
+        return {
+            character: np.clip(np.mean(canvases, axis=0), 0, 255).astype(np.uint8)
+            for character, canvases in glyphs.items()
+        }
+
+    @staticmethod
+    def _column_runs(columns: np.ndarray) -> List[Tuple[int, int]]:
+        padded = np.concatenate(([False], columns, [False])).astype(np.int8)
+        edges = np.flatnonzero(np.diff(padded))
+        return list(zip(edges[::2], edges[1::2]))
+
+    @staticmethod
+    def _ink(gray: np.ndarray) -> np.ndarray:
+        """Gray crop to ink intensity: 0 on the pill, 255 on full white text."""
+        scale = 255.0 / (255 - BACKGROUND_LEVEL)
+        return np.clip((gray.astype(np.float32) - BACKGROUND_LEVEL) * scale, 0, 255)
+
+    @staticmethod
+    def _to_canvas(glyph: np.ndarray) -> np.ndarray:
+        """Scale a glyph to the canvas height and center it horizontally."""
+        height, width = glyph.shape[:2]
+        if height != GLYPH_HEIGHT:
+            width = max(1, round(width * GLYPH_HEIGHT / height))
+            glyph = cv2.resize(glyph.astype(np.float32), (width, GLYPH_HEIGHT), interpolation=cv2.INTER_AREA)
+        if width > GLYPH_WIDTH:
+            glyph = cv2.resize(glyph.astype(np.float32), (GLYPH_WIDTH, GLYPH_HEIGHT), interpolation=cv2.INTER_AREA)
+            width = GLYPH_WIDTH
+
+        canvas = np.zeros((GLYPH_HEIGHT, GLYPH_WIDTH), dtype=np.float32)
+        left = (GLYPH_WIDTH - width) // 2
+        canvas[:, left:left + width] = glyph
+        return canvas
+
+    @staticmethod
+    def _normalize(canvas: np.ndarray) -> np.ndarray:
+        vector = canvas.astype(np.float32).ravel()
+        vector = vector - vector.mean()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+
+_recognizer: Optional[BidDigitRecognizer] = None
+_recognizer_lock = threading.Lock()
+
+
+def get_bid_digit_recognizer() -> BidDigitRecognizer:
+    global _recognizer
+    with _recognizer_lock:
+        if _recognizer is None:
+            _recognizer = BidDigitRecognizer.load()
+        return _recognizer
@@ -0,0 +1,141 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+BID_CHAR_WHITELIST = "0123456789."
+
+# A composite of stacked seat tiles is one block of text lines, not a single line
+BATCHED_TESSERACT_CONFIG = (
+    "--psm 6 --oem 3 "
+    f"-c tessedit_char_whitelist={BID_CHAR_WHITELIST} "
+    "-c load_system_dawg=0 -c load_freq_dawg=0"
+)
+
+
+class BidOcrEngine(ABC):
+    """Reads the words of a preprocessed image in the pytesseract image_to_data format."""
+
+    name = "base"
+
+    @abstractmethod
+    def read_words(self, image: np.ndarray) -> List[Dict]:
+        """Words as dicts with text, conf, left, top, width and height."""
+        pass
+
+
+class PytesseractEngine(BidOcrEngine):
+    """Launches one tesseract process per call."""
+
+    name = "pytesseract"
+
+    def __init__(self, config: str = BATCHED_TESSERACT_CONFIG):
+        self.config = config
+
+    def read_words(self, image: np.ndarray) -> List[Dict]:
+        import pytesseract
+
+        data = pytesseract.image_to_data(image, config=self.config, output_type=pytesseract.Output.DICT)
+        return [
+            {
+                'text': data['text'][i],
+                'conf': int(float(data['conf'][i])),
+                'left': data['left'][i],
+                'top': data['top'][i],
+                'width': data['width'][i],
+                'height': data['height'][i]
+            }
+            for i in range(len(data['text']))
+        ]
+
+
+class TesserocrEngine(BidOcrEngine):
+    """
+    Keeps one tesseract instance loaded in process via tesserocr, so the
+    language model is read once instead of on every call.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self):
+        from tesserocr import OEM, PSM, PyTessBaseAPI
+
+        self._api = PyTessBaseAPI(
+            psm=PSM.SINGLE_BLOCK,
+            oem=OEM.DEFAULT,
+            variables={
+                'tessedit_char_whitelist': BID_CHAR_WHITELIST,
+                'load_system_dawg': '0',
+                'load_freq_dawg': '0'
+            }
+        )
+        # A tesseract instance is not thread safe
+        self._lock = threading.Lock()
+
+    def read_words(self, image: np.ndarray) -> List[Dict]:
+        from PIL import Image
+        from tesserocr import RIL, iterate_level
+
+        words = []
+        with self._lock:
+            self._api.SetImage(Image.fromarray(image))
+            self._api.Recognize()
+            iterator = self._api.GetIterator()
+            if iterator is None:
+                return words
+            for word in iterate_level(iterator, RIL.WORD):
+                text = word.GetUTF8Text(RIL.WORD)
+                box = word.BoundingBox(RIL.WORD)
+                if text is None or box is None:
+                    continue
+                x1, y1, x2, y2 = box
+                words.append({
+                    'text': text,
+                    'conf': int(word.Confidence(RIL.WORD)),
+                    'left': x1,
+                    'top': y1,
+                    'width': x2 - x1,
+                    'height': y2 - y1
+                })
+        return words
+
+    def close(self):
+        with self._lock:
+            self._api.End()
+
+
+_engine: Optional[BidOcrEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_bid_ocr_engine() -> BidOcrEngine:
+    """
+    The process-wide OCR engine for bids. BID_OCR_ENGINE=auto uses tesserocr
+    when it is installed and falls back to the tesseract command line.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = _create_engine(os.getenv('BID_OCR_ENGINE', 'auto').lower())
+            logger.info(f"🔤 Bid OCR engine: {_engine.name}")
+        return _engine
+
+
+def set_bid_ocr_engine(engine: Optional[BidOcrEngine]):
+    """Replace the process-wide engine; None makes the next call pick one again."""
+    global _engine
+    with _engine_lock:
+        _engine = engine
+
+
+def _create_engine(engine_name: str) -> BidOcrEngine:
+    if engine_name in ('auto', 'tesserocr'):
+        try:
+            return TesserocrEngine()
+        except Exception as e:
+            if engine_name == 'tesserocr':
+                logger.warning(f"⚠️ tesserocr unavailable, using the tesseract command line: {e}")
+    return PytesseractEngine()
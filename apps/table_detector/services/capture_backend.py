@@ -0,0 +1,106 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+from PIL import ImageGrab
+from loguru import logger
+
+from table_detector.services.window_registry import WindowRegistry
+from table_detector.utils.windows_utils import capture_window_frame
+
+
+class CaptureBackend(ABC):
+    """
+    Source of window frames for the capture pipeline.
+
+    Windows are described by the same dicts get_window_info returns ('hwnd',
+    'title', 'rect', 'process', 'width', 'height'); frames are uint8 BGR or
+    BGRX arrays that CapturedWindow wraps without copying.
+    """
+
+    @abstractmethod
+    def list_windows(self, title_filter: Optional[str] = None) -> List[Dict]:
+        """With ``title_filter`` only windows whose title contains it."""
+        pass
+
+    @abstractmethod
+    def capture_window(self, window: Dict) -> Optional[np.ndarray]:
+        pass
+
+    def capture_fullscreen(self) -> Optional[np.ndarray]:
+        return None
+
+
+class Win32CaptureBackend(CaptureBackend):
+    """PrintWindow capture, falling back to a screen-region grab."""
+
+    def __init__(self, registry: Optional[WindowRegistry] = None):
+        # Process names are looked up once per window instead of on every enumeration
+        self.registry = registry or WindowRegistry()
+
+    def list_windows(self, title_filter: Optional[str] = None) -> List[Dict]:
+        # The registry only reads rects and processes of windows passing the filter
+        return self.registry.list_windows(title_filter)
+
+    def capture_window(self, window: Dict) -> Optional[np.ndarray]:
+        frame = capture_window_frame(window['hwnd'], window['width'], window['height'])
+        if frame is None:
+            logger.info("  Using fallback method: screen region capture")
+            frame = Win32CaptureBackend._grab_screen(window['rect'])
+        return frame
+
+    def capture_fullscreen(self) -> Optional[np.ndarray]:
+        return Win32CaptureBackend._grab_screen()
+
+    @staticmethod
+    def _grab_screen(rect=None) -> Optional[np.ndarray]:
+        try:
+            with ImageGrab.grab(bbox=rect) as screen:
+                return cv2.cvtColor(np.asarray(screen.convert('RGB')), cv2.COLOR_RGB2BGR)
+        except Exception as e:
+            logger.error(f"  Error capturing screen: {e}")
+            return None
+
+
+class InMemoryCaptureBackend(CaptureBackend):
+    """Serves frames set by the caller; used to run the capture pipeline off Windows."""
+
+    def __init__(self, frames: Optional[Dict[str, np.ndarray]] = None, process: str = "memory"):
+        self._frames: Dict[str, np.ndarray] = {}
+        self._handles: Dict[str, int] = {}
+        self._process = process
+        self.fullscreen: Optional[np.ndarray] = None
+
+        for title, frame in (frames or {}).items():
+            self.set_frame(title, frame)
+
+    def set_frame(self, title: str, frame: np.ndarray):
+        if title not in self._handles:
+            self._handles[title] = len(self._handles) + 1
+        self._frames[title] = frame
+
+    def remove_window(self, title: str):
+        self._frames.pop(title, None)
+
+    def list_windows(self, title_filter: Optional[str] = None) -> List[Dict]:
+        windows = []
+        for title, frame in self._frames.items():
+            if title_filter is not None and title_filter not in title:
+                continue
+            height, width = frame.shape[:2]
+            windows.append({
+                'hwnd': self._handles[title],
+                'title': title,
+                'rect': (0, 0, width, height),
+                'process': self._process,
+                'width': width,
+                'height': height
+            })
+        return windows
+
+    def capture_window(self, window: Dict) -> Optional[np.ndarray]:
+        return self._frames.get(window['title'])
+
+    def capture_fullscreen(self) -> Optional[np.ndarray]:
+        return self.fullscreen
@@ -0,0 +1,303 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+# A stage handler takes (key, item) and returns what to pass downstream, or None to stop the item there
+StageHandler = Callable[[Hashable, Any], Optional[Any]]
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int
+    processed: int
+    superseded: int
+    dropped: int
+    errors: int
+    backlog: int
+    max_backlog: int
+    avg_wait_ms: float
+    avg_service_ms: float
+    max_service_ms: float
+
+
+class LatestFrameQueue:
+    """
+    Bounded queue holding at most one item per key (per table).
+
+    Putting an item for a key that is already waiting replaces it in place, so
+    only the newest frame of a table is ever processed. When every slot is
+    taken by other keys the oldest waiting item is dropped, except items
+    ``never_drop`` selects (removal notices): those are kept even if the
+    queue has to grow past ``maxsize`` for them. A key handed to a
+    worker is not handed out again until ``task_done`` so one table is never
+    processed by two workers at once.
+    """
+
+    def __init__(self, maxsize: int, on_discard: Optional[Callable[[Any], None]] = None,
+                 never_drop: Optional[Callable[[Any], bool]] = None):
+        self.maxsize = maxsize
+        self._on_discard = on_discard
+        self._never_drop = never_drop
+        self._items: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._in_flight: Set[Hashable] = set()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self.superseded = 0
+        self.dropped = 0
+        self.max_backlog = 0
+
+    def put(self, key: Hashable, item: Any):
+        discarded = []
+        with self._condition:
+            if key in self._items:
+                discarded.append(self._items[key][0])
+                self._items[key] = (item, time.perf_counter())
+                self.superseded += 1
+            else:
+                if len(self._items) >= self.maxsize:
+                    oldest_key = self._oldest_droppable_key()
+                    if oldest_key is not None:
+                        discarded.append(self._items.pop(oldest_key)[0])
+                        self.dropped += 1
+                self._items[key] = (item, time.perf_counter())
+            self.max_backlog = max(self.max_backlog, len(self._items))
+            self._condition.notify()
+
+        if self._on_discard is not None:
+            for discarded_item in discarded:
+                self._on_discard(discarded_item)
+
+    def _oldest_droppable_key(self) -> Optional[Hashable]:
+        for key, (item, _) in self._items.items():
+            if self._never_drop is None or not self._never_drop(item):
+                return key
+        return None
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[Hashable, Any, float]]:
+        """Next (key, item, enqueued_at) whose key is not in flight; None on timeout or close."""
+        deadline = time.perf_counter() + timeout if timeout is not None else None
+        with self._condition:
+            while True:
+                for key in self._items:
+                    if key not in self._in_flight:
+                        item, enqueued_at = self._items.pop(key)
+                        self._in_flight.add(key)
+                        return key, item, enqueued_at
+                if self._closed:
+                    return None
+                remaining = deadline - time.perf_counter() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def task_done(self, key: Hashable):
+        with self._condition:
+            self._in_flight.discard(key)
+            self._condition.notify_all()
+
+    def is_idle(self) -> bool:
+        with self._condition:
+            return not self._items and not self._in_flight
+
+    def close(self) -> List[Any]:
+        """Wake all workers and return the items still waiting."""
+        with self._condition:
+            self._closed = True
+            pending = [item for item, _ in self._items.values()]
+            self._items.clear()
+            self._condition.notify_all()
+        return pending
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+
+class PipelineStage:
+
+    def __init__(self, name: str, handler: StageHandler, workers: int = 1, queue_size: int = 16,
+                 on_discard: Optional[Callable[[Any], None]] = None,
+                 never_drop: Optional[Callable[[Any], bool]] = None):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue = LatestFrameQueue(queue_size, on_discard, never_drop)
+        self.on_discard = on_discard
+        self.downstream: Optional['PipelineStage'] = None
+
+        self._threads: List[threading.Thread] = []
+        self._stats_lock = threading.Lock()
+        self._processed = 0
+        self._errors = 0
+        self._wait_seconds = 0.0
+        self._service_seconds = 0.0
+        self._max_service_seconds = 0.0
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"pipeline-{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        for item in self.queue.close():
+            if self.on_discard is not None:
+                self.on_discard(item)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def _run(self):
+        while True:
+            entry = self.queue.get()
+            if entry is None:
+                return
+
+            key, item, enqueued_at = entry
+            start_time = time.perf_counter()
+            try:
+                result = self.handler(key, item)
+                if result is not None and self.downstream is not None:
+                    self.downstream.queue.put(key, result)
+            except Exception as e:
+                with self._stats_lock:
+                    self._errors += 1
+                logger.error(f"❌ Pipeline stage {self.name} failed for {key}: {e}")
+            finally:
+                finished_at = time.perf_counter()
+                self.queue.task_done(key)
+                with self._stats_lock:
+                    self._processed += 1
+                    self._wait_seconds += start_time - enqueued_at
+                    self._service_seconds += finished_at - start_time
+                    self._max_service_seconds = max(self._max_service_seconds, finished_at - start_time)
+
+    def get_stats(self) -> StageStats:
+        with self._stats_lock:
+            processed = self._processed
+            return StageStats(
+                name=self.name,
+                workers=self.workers,
+                processed=processed,
+                superseded=self.queue.superseded,
+                dropped=self.queue.dropped,
+                errors=self._errors,
+                backlog=len(self.queue),
+                max_backlog=self.queue.max_backlog,
+                avg_wait_ms=self._wait_seconds * 1000 / processed if processed else 0.0,
+                avg_service_ms=self._service_seconds * 1000 / processed if processed else 0.0,
+                max_service_ms=self._max_service_seconds * 1000
+            )
+
+
+class DetectionPipeline:
+    """
+    Capture -> change filter -> detect -> serialize -> send, as threaded stages.
+
+    The capture job only enqueues captured windows and returns, so a slow
+    detector or server never delays the next capture. Every stage queue keeps
+    the latest item per table: when a stage falls behind, stale frames and
+    stale updates are replaced rather than queued up, and the queues are
+    bounded so a burst of tables drops the oldest work instead of growing.
+    Removal notices enter at the detect stage: they replace any frame still
+    pending for the same table and, since a table is never in flight on two
+    workers, reach the detect handler only after the table's current frame is
+    done. The detect handler passes them on to serialize, where they replace
+    any pending update. ``is_removal`` recognizes them at every stage, so a
+    full queue never drops one: the table's state would never be forgotten
+    and the server never told.
+    """
+
+    def __init__(self, change_filter: StageHandler, detect: StageHandler, serialize: StageHandler,
+                 send: StageHandler, detect_workers: int = 2, send_workers: int = 2, queue_size: int = 16,
+                 on_discard_frame: Optional[Callable[[Any], None]] = None,
+                 is_removal: Optional[Callable[[Any], bool]] = None):
+        self.filter_stage = PipelineStage('filter', change_filter, 1, queue_size, on_discard_frame)
+        self.detect_stage = PipelineStage('detect', detect, detect_workers, queue_size, on_discard_frame, is_removal)
+        self.serialize_stage = PipelineStage('serialize', serialize, 1, queue_size, never_drop=is_removal)
+        self.send_stage = PipelineStage('send', send, send_workers, queue_size, never_drop=is_removal)
+
+        self.stages = [self.filter_stage, self.detect_stage, self.serialize_stage, self.send_stage]
+        for upstream, downstream in zip(self.stages, self.stages[1:]):
+            upstream.downstream = downstream
+
+        self._capture_lock = threading.Lock()
+        self._captures = 0
+        self._capture_seconds = 0.0
+        self._max_capture_seconds = 0.0
+        self._running = False
+
+    @staticmethod
+    def workers_from_env() -> Dict[str, int]:
+        return {
+            'detect_workers': int(os.getenv('PIPELINE_DETECT_WORKERS', '2')),
+            'send_workers': int(os.getenv('PIPELINE_SEND_WORKERS', '2')),
+            'queue_size': int(os.getenv('PIPELINE_QUEUE_SIZE', '16'))
+        }
+
+    def start(self):
+        if self._running:
+            return
+        for stage in self.stages:
+            stage.start()
+        self._running = True
+        logger.info(f"🚰 Detection pipeline started: "
+                    f"{', '.join(f'{stage.name} x{stage.workers}' for stage in self.stages)}")
+
+    def stop(self, timeout: Optional[float] = 10.0):
+        if not self._running:
+            return
+        for stage in self.stages:
+            stage.stop(timeout)
+        self._running = False
+        logger.info(f"🚰 Detection pipeline stopped: {self.get_stats()}")
+
+    def submit_frame(self, window_name: str, captured_window: Any):
+        self.filter_stage.queue.put(window_name, captured_window)
+
+    def submit_removal(self, window_name: str, removal: Any):
+        self.detect_stage.queue.put(window_name, removal)
+
+    def record_capture(self, seconds: float):
+        with self._capture_lock:
+            self._captures += 1
+            self._capture_seconds += seconds
+            self._max_capture_seconds = max(self._max_capture_seconds, seconds)
+
+    def is_idle(self) -> bool:
+        return all(stage.queue.is_idle() for stage in self.stages)
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if self.is_idle():
+                return True
+            time.sleep(0.01)
+        return self.is_idle()
+
+    def get_stats(self) -> List[StageStats]:
+        with self._capture_lock:
+            captures = self._captures
+            capture_stats = StageStats(
+                name='capture', workers=1, processed=captures, superseded=0, dropped=0, errors=0, backlog=0,
+                max_backlog=0, avg_wait_ms=0.0,
+                avg_service_ms=self._capture_seconds * 1000 / captures if captures else 0.0,
+                max_service_ms=self._max_capture_seconds * 1000
+            )
+        return [capture_stats] + [stage.get_stats() for stage in self.stages]
+
+    def log_stats(self):
+        summary = ", ".join(
+            f"{stats.name}: {stats.avg_service_ms:.0f}ms backlog {stats.backlog}"
+            f"{f' superseded {stats.superseded}' if stats.superseded else ''}"
+            f"{f' dropped {stats.dropped}' if stats.dropped else ''}"
+            for stats in self.get_stats()
+        )
+        logger.debug(f"🚰 Pipeline: {summary}")
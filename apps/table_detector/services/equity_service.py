@@ -0,0 +1,119 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from shared.domain.hand_evaluator import DECK_SIZE, best_omaha_scores, encode_cards, evaluate_5
+from table_detector.domain.hand_rank_table import get_hand_rank_table
+
+# Trials dealt and evaluated together; the time budget is checked between batches
+EQUITY_BATCH_SIZE = 250
+
+
+@dataclass
+class EquityResult:
+    equity: float  # Share of the pot won on average, ties split
+    win: float
+    tie: float
+    opponents: int
+    trials: int
+    elapsed_ms: float
+
+    def to_dict(self) -> Dict:
+        return {key: round(value, 4) if isinstance(value, float) else value for key, value in asdict(self).items()}
+
+
+class EquityService:
+    """
+    Monte Carlo equity of a PLO hand against random opponent hands.
+
+    Each batch deals every trial's opponent hands and board runout at once
+    from the cards left in the deck, scores all 60 two-from-hand,
+    three-from-board combinations of every hand in one vectorized
+    evaluation, and settles the trials with array operations; there is no
+    Python loop per trial. Batches run until the trial budget or the time
+    budget runs out, whichever comes first. Hands are ranked by
+    ``rank_hands``: evaluate_5, or the precomputed table which is faster.
+    """
+
+    def __init__(self, max_trials: int = 2000, time_budget_ms: float = 20.0, seed: Optional[int] = None,
+                 rank_hands: Callable[[np.ndarray], np.ndarray] = evaluate_5):
+        self.max_trials = max_trials
+        self.time_budget_ms = time_budget_ms
+        self.rank_hands = rank_hands
+        self._rng = np.random.default_rng(seed)
+        self._rng_lock = threading.Lock()
+
+    def calculate(self, hero_cards: Sequence[str], board_cards: Sequence[str], opponents: int) -> EquityResult:
+        """Equity of the hero's four hole cards on a board of 0, 3, 4 or 5 cards against ``opponents`` hands."""
+        hero = encode_cards(hero_cards)
+        board = encode_cards(board_cards)
+        if len(hero) != 4:
+            raise ValueError(f"Expected 4 hole cards, got {len(hero)}")
+        if len(board) not in (0, 3, 4, 5):
+            raise ValueError(f"Expected a board of 0, 3, 4 or 5 cards, got {len(board)}")
+        if len(set(hero + board)) != len(hero) + len(board):
+            raise ValueError(f"Duplicate cards: {list(hero_cards)} {list(board_cards)}")
+
+        deck = np.setdiff1d(np.arange(DECK_SIZE), hero + board)
+        missing = 5 - len(board)
+        if opponents < 1 or 4 * opponents + missing > len(deck):
+            raise ValueError(f"Can't deal {opponents} opponents")
+
+        started = time.perf_counter()
+        wins = ties = shares = 0.0
+        trials = 0
+        while trials < self.max_trials:
+            batch = min(EQUITY_BATCH_SIZE, self.max_trials - trials)
+            batch_wins, batch_ties, batch_shares = self._run_batch(hero, board, deck, opponents, missing, batch)
+            wins += batch_wins
+            ties += batch_ties
+            shares += batch_shares
+            trials += batch
+            if (time.perf_counter() - started) * 1000 >= self.time_budget_ms:
+                break
+
+        return EquityResult(
+            equity=float(shares / trials),
+            win=float(wins / trials),
+            tie=float(ties / trials),
+            opponents=opponents,
+            trials=trials,
+            elapsed_ms=(time.perf_counter() - started) * 1000
+        )
+
+    def _run_batch(self, hero: List[int], board: List[int], deck: np.ndarray, opponents: int, missing: int,
+                   batch: int):
+        # A random permutation prefix of the remaining deck per trial: dealing without replacement
+        with self._rng_lock:
+            keys = self._rng.random((batch, len(deck)))
+        dealt = deck[keys.argsort(axis=1)[:, :4 * opponents + missing]]
+        boards = np.concatenate((np.broadcast_to(np.array(board, dtype=dealt.dtype), (batch, len(board))),
+                                 dealt[:, 4 * opponents:]), axis=1)
+        opponent_cards = dealt[:, :4 * opponents].reshape(batch, opponents, 4)
+
+        hero_scores = best_omaha_scores(np.array(hero), boards, self.rank_hands)
+        opponent_scores = best_omaha_scores(opponent_cards, boards[:, None, :], self.rank_hands)
+
+        best_opponent = opponent_scores.max(axis=1)
+        won = hero_scores > best_opponent
+        tied = hero_scores == best_opponent
+        split_ways = 1 + (opponent_scores == hero_scores[:, None]).sum(axis=1)
+        return won.sum(), tied.sum(), won.sum() + (tied / split_ways).sum()
+
+
+_service: Optional[EquityService] = None
+_service_lock = threading.Lock()
+
+
+def get_equity_service() -> EquityService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = EquityService(int(os.getenv('EQUITY_MAX_TRIALS', '2000')),
+                                     float(os.getenv('EQUITY_TIME_BUDGET_MS', '20')),
+                                     rank_hands=get_hand_rank_table().rank_many)
+        return _service
@@ -1,47 +1,113 @@
 import os
-from typing import List, Dict, NamedTuple
+import threading
+from typing import Callable, List, Dict, NamedTuple, Optional, Set
 
 from loguru import logger
 
 from table_detector.domain.captured_window import CapturedWindow
+from table_detector.services.artifact_writer import ArtifactWriter
+from table_detector.services.capture_backend import CaptureBackend, Win32CaptureBackend
+from table_detector.services.screenshot_archive import ScreenshotArchive
 from table_detector.services.window_capture_service import capture_and_save_windows
+from table_detector.utils.fs_utils import get_results_folder
 
 
 class WindowChanges(NamedTuple):
     changed_images: List[CapturedWindow]
     removed_windows: List[str]
+    # Captured windows whose image did not change
+    unchanged_windows: List[str] = []
+
+
+class WindowCapture(NamedTuple):
+    captured_windows: List[CapturedWindow]
+    removed_windows: List[str]
 
 
 class ImageCaptureService:
-    def __init__(self):
+    def __init__(self, capture_backend: Optional[CaptureBackend] = None):
         self.debug_mode = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+        self.capture_backend = capture_backend or Win32CaptureBackend()
+        # Replays already have their screenshots on disk, so they turn this off
+        self.save_windows = True
+        self.artifact_writer: Optional[ArtifactWriter] = None
+        if os.getenv('ASYNC_ARTIFACT_WRITER', 'true').lower() == 'true':
+            self.artifact_writer = ArtifactWriter.from_env()
+        self.archive: Optional[ScreenshotArchive] = None
+        if os.getenv('ARCHIVE_POLICY', 'true').lower() == 'true':
+            self.archive = ScreenshotArchive(get_results_folder())
         self._window_hashes: Dict[str, str] = {}
+        self._open_windows: Set[str] = set()
+        # Capture and change filtering may run on different pipeline threads
+        self._hash_lock = threading.Lock()
+
+    def close(self):
+        """Flush screenshots still queued for disk and close the archive index."""
+        if self.artifact_writer is not None:
+            self.artifact_writer.close()
+            self.artifact_writer = None
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+
+    def capture_windows(self, base_timestamp_folder,
+                        window_filter: Optional[Callable[[str], bool]] = None) -> WindowCapture:
+        """
+        Capture the poker windows and report which were closed since the last
+        capture. Windows rejected by ``window_filter`` are not captured but
+        still count as open.
+        """
+        listed_windows: Set[str] = set()
+
+        def track_window(window_name: str) -> bool:
+            listed_windows.add(window_name)
+            return window_filter(window_name)
 
-    def get_changed_images(self, base_timestamp_folder) -> WindowChanges:
         captured_windows = capture_and_save_windows(
             timestamp_folder=base_timestamp_folder,
-            save_windows=not self.debug_mode,
-            debug=self.debug_mode
+            save_windows=self.save_windows and not self.debug_mode,
+            debug=self.debug_mode,
+            backend=self.capture_backend,
+            writer=self.artifact_writer,
+            archive=self.archive,
+            window_filter=track_window if window_filter is not None else None
         )
 
-        if not captured_windows:
+        if not captured_windows and not listed_windows:
             logger.warning("🚫 No poker tables detected")
-            removed_windows = list(self._window_hashes.keys())
-            self._window_hashes.clear()
-            return WindowChanges(changed_images=[], removed_windows=removed_windows)
+
+        open_windows = listed_windows | {window.window_name for window in captured_windows}
+        with self._hash_lock:
+            removed_windows = list(self._open_windows - open_windows)
+            self._open_windows = open_windows
+            for window_name in removed_windows:
+                self._window_hashes.pop(window_name, None)
+
+        return WindowCapture(captured_windows=captured_windows, removed_windows=removed_windows)
+
+    def has_changed(self, captured_window: CapturedWindow) -> bool:
+        """Whether the window image differs from the last one seen; remembers this one."""
+        current_hash = captured_window.calculate_hash()
+        with self._hash_lock:
+            changed = self._window_hashes.get(captured_window.window_name) != current_hash
+            self._window_hashes[captured_window.window_name] = current_hash
+        return changed
+
+    def is_open(self, window_name: str) -> bool:
+        with self._hash_lock:
+            return window_name in self._open_windows
+
+    def get_changed_images(self, base_timestamp_folder,
+                           window_filter: Optional[Callable[[str], bool]] = None) -> WindowChanges:
+        """Capture the poker windows and report which changed."""
+        window_capture = self.capture_windows(base_timestamp_folder, window_filter)
+        captured_windows = window_capture.captured_windows
+        removed_windows = window_capture.removed_windows
 
         changed_images = []
         unchanged_windows = []
-        current_hashes = {}
-        current_window_names = set()
-
         for captured_window in captured_windows:
-            window_name = captured_window.window_name
-            current_window_names.add(window_name)
-            current_hash = captured_window.calculate_hash()
-            current_hashes[window_name] = current_hash
-
-            if self._window_hashes.get(window_name) != current_hash:
+            if self.has_changed(captured_window):
                 changed_images.append(captured_window)
             else:
                 unchanged_windows.append(captured_window)
@@ -50,13 +116,8 @@ class ImageCaptureService:
         for unchanged_window in unchanged_windows:
             unchanged_window.close()
 
-        previous_window_names = set(self._window_hashes.keys())
-        removed_windows = list(previous_window_names - current_window_names)
-
-        self._window_hashes = current_hashes
-
         if changed_images:
-            logger.info(f"🔍 Processing {len(changed_images)} changed/new images out of {len(captured_windows)} total")
+            logger.info(f"🔍 Processing {len(changed_images)} changed/new images out of {len(captured_windows)} captured")
 
         if removed_windows:
             logger.info(f"🗑️ Detected {len(removed_windows)} removed windows: {removed_windows}")
@@ -64,4 +125,5 @@ class ImageCaptureService:
         if not changed_images and not removed_windows:
             logger.info("📊 All windows unchanged")
 
-        return WindowChanges(changed_images=changed_images, removed_windows=removed_windows)
+        return WindowChanges(changed_images=changed_images, removed_windows=removed_windows,
+                             unchanged_windows=[window.window_name for window in unchanged_windows])
@@ -0,0 +1,127 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+from loguru import logger
+
+
+@dataclass
+class MatchingExecutorStats:
+    max_workers: int
+    queue_depth: int
+    active_workers: int
+    submitted: int
+    completed: int
+    utilization: float  # Share of worker time spent running tasks since start
+
+
+class MatchingExecutor:
+    """
+    Process-wide thread pool shared by all template matching.
+
+    Detectors used to create and tear down a ThreadPoolExecutor on every call;
+    this keeps one long-lived pool (size from MATCHING_WORKERS) for the whole
+    process. Tasks submitted from one of its own workers run inline, so nested
+    matching can never deadlock waiting for a free worker.
+    """
+
+    _instance: Optional['MatchingExecutor'] = None
+    _instance_lock = threading.Lock()
+
+    THREAD_NAME_PREFIX = "matcher"
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.THREAD_NAME_PREFIX)
+        self._worker_threads = set()
+
+        self._stats_lock = threading.Lock()
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._created_at = time.perf_counter()
+
+    @staticmethod
+    def default_workers() -> int:
+        configured = int(os.getenv('MATCHING_WORKERS', '0'))
+        return configured if configured > 0 else min(4, multiprocessing.cpu_count())
+
+    @classmethod
+    def get(cls) -> 'MatchingExecutor':
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = MatchingExecutor(cls.default_workers())
+                    logger.info(f"🧵 Matching executor started with {cls._instance.max_workers} workers")
+        return cls._instance
+
+    @classmethod
+    def configure(cls, max_workers: int) -> 'MatchingExecutor':
+        """Replace the shared pool with one of ``max_workers`` workers."""
+        cls.shutdown()
+        with cls._instance_lock:
+            cls._instance = MatchingExecutor(max_workers)
+            logger.info(f"🧵 Matching executor started with {max_workers} workers")
+        return cls._instance
+
+    @classmethod
+    def shutdown(cls, wait: bool = True):
+        with cls._instance_lock:
+            instance, cls._instance = cls._instance, None
+
+        if instance is not None:
+            instance._executor.shutdown(wait=wait)
+            logger.info(f"🧵 Matching executor stopped: {instance.get_stats()}")
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if threading.current_thread() in self._worker_threads:
+            return MatchingExecutor._run_inline(fn, *args, **kwargs)
+
+        with self._stats_lock:
+            self._submitted += 1
+        return self._executor.submit(self._run_tracked, fn, *args, **kwargs)
+
+    def map(self, fn: Callable, items: Iterable) -> List:
+        """Run ``fn`` over ``items`` on the pool and return results in order."""
+        futures = [self.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def _run_tracked(self, fn: Callable, *args, **kwargs):
+        self._worker_threads.add(threading.current_thread())
+        with self._stats_lock:
+            self._started += 1
+
+        start_time = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start_time
+            with self._stats_lock:
+                self._completed += 1
+                self._busy_seconds += elapsed
+
+    @staticmethod
+    def _run_inline(fn: Callable, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def get_stats(self) -> MatchingExecutorStats:
+        with self._stats_lock:
+            lifetime = max(time.perf_counter() - self._created_at, 1e-9)
+            return MatchingExecutorStats(
+                max_workers=self.max_workers,
+                queue_depth=self._submitted - self._started,
+                active_workers=self._started - self._completed,
+                submitted=self._submitted,
+                completed=self._completed,
+                utilization=self._busy_seconds / (lifetime * self.max_workers)
+            )
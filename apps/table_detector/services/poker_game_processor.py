@@ -1,12 +1,29 @@
 import os
+from typing import Dict, Optional, Tuple
 
 from loguru import logger
 
+from shared.domain.detected_position import DetectedPosition
 from shared.domain.game_snapshot import GameSnapshot
+from shared.domain.street import Street
 from table_detector.domain.captured_window import CapturedWindow
 from table_detector.domain.omaha_engine import OmahaEngine, OmahaEngineException
+from table_detector.domain.omaha_session import OmahaSession
+from table_detector.domain.simulation_cache import get_simulation_cache
+from table_detector.domain.starting_hand_table import get_starting_hand_table
+from table_detector.services.bid_cache import BidCache, BidCacheStats
+from table_detector.services.bid_detection_service import detect_bids
+from table_detector.services.equity_service import get_equity_service
 from table_detector.services.position_service import PositionService
-from table_detector.utils.detect_utils import DetectUtils
+from table_detector.services.region_change_tracker import (
+    RegionChangeTracker,
+    WindowRegionState,
+    PLAYER_CARDS_REGION,
+    TABLE_CARDS_REGION,
+    position_region,
+    action_region
+)
+from table_detector.utils.detect_utils import DetectUtils, PLAYER_POSITIONS, ACTION_POSITIONS
 from table_detector.utils.drawing_utils import save_detection_result
 
 
@@ -14,6 +31,20 @@ class PokerGameProcessor:
 
     def __init__(self):
         self.debug_mode = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+        # Re-run only the detectors whose screen regions changed since the window's last frame
+        self.region_change_mode = os.getenv('REGION_CHANGE_MODE', 'true').lower() == 'true'
+        self.region_tracker = RegionChangeTracker()
+        # Keep each table's OmahaEngine between cycles and simulate only newly detected actions
+        self.incremental_engine_mode = os.getenv('INCREMENTAL_ENGINE_MODE', 'true').lower() == 'true'
+        self.omaha_sessions: Dict[str, OmahaSession] = {}
+        self.bid_detection_mode = os.getenv('BID_DETECTION_MODE', 'false').lower() == 'true'
+        self.bid_cache_size = int(os.getenv('BID_CACHE_SIZE', '64'))
+        self.bid_caches: Dict[str, BidCache] = {}
+        # Monte Carlo equity of the hero's hand, recomputed only when the cards or opponent count change
+        self.equity_mode = os.getenv('EQUITY_MODE', 'false').lower() == 'true'
+        self.equity_results: Dict[str, Tuple[Tuple, Optional[dict]]] = {}
+        # Preflop strength of the hero's hand from the precomputed starting hand table
+        self.starting_hand_mode = os.getenv('STARTING_HAND_MODE', 'true').lower() == 'true'
 
     def process_window(self, captured_image: CapturedWindow, timestamp_folder) -> GameSnapshot:
         """Process captured image and return GameSnapshot."""
@@ -21,12 +52,88 @@ class PokerGameProcessor:
 
         self.validate_image(captured_image)
 
-        game_snapshot = PokerGameProcessor.create_game_snapshot(captured_image.get_cv2_image())
+        region_state = self.region_tracker.get_state(window_name) if self.region_change_mode else None
+        omaha_session = None
+        if self.incremental_engine_mode:
+            omaha_session = self.omaha_sessions.get(window_name)
+            if omaha_session is None:
+                omaha_session = OmahaSession(get_simulation_cache())
+                self.omaha_sessions[window_name] = omaha_session
+        game_snapshot = PokerGameProcessor.create_game_snapshot(captured_image.get_cv2_image(), region_state,
+                                                                omaha_session)
+        if self.bid_detection_mode:
+            game_snapshot.bids = self._detect_bids(window_name, captured_image.get_cv2_image(), game_snapshot)
+        if self.equity_mode:
+            game_snapshot.equity = self._calculate_equity(window_name, game_snapshot)
+        if self.starting_hand_mode and game_snapshot.get_street() == Street.PREFLOP:
+            starting_hand = get_starting_hand_table().lookup([card.name for card in game_snapshot.player_cards])
+            game_snapshot.starting_hand = starting_hand.to_dict() if starting_hand else None
         if self.debug_mode:
             save_detection_result(timestamp_folder, captured_image, game_snapshot)
 
         return game_snapshot
 
+    def forget_window(self, window_name: str):
+        """Drop cached region state of a closed window."""
+        self.region_tracker.forget(window_name)
+        self.omaha_sessions.pop(window_name, None)
+        self.bid_caches.pop(window_name, None)
+        self.equity_results.pop(window_name, None)
+
+    def _detect_bids(self, window_name: str, cv2_image, game_snapshot: GameSnapshot):
+        bid_cache = self.bid_caches.get(window_name)
+        if bid_cache is None:
+            bid_cache = BidCache(self.bid_cache_size)
+            self.bid_caches[window_name] = bid_cache
+
+        # Bids belong to a hand: new hero cards mean none of the cached reads can show up again
+        bid_cache.update_hand(tuple(card.name for card in game_snapshot.player_cards))
+        return detect_bids(cv2_image, cache=bid_cache)
+
+    def _calculate_equity(self, window_name: str, game_snapshot: GameSnapshot) -> Optional[dict]:
+        hero_cards = tuple(card.name for card in game_snapshot.player_cards)
+        board_cards = tuple(card.name for card in game_snapshot.table_cards)
+        opponents = PokerGameProcessor.count_opponents(game_snapshot)
+        key = (hero_cards, board_cards, opponents)
+
+        cached = self.equity_results.get(window_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        equity = None
+        if len(hero_cards) == 4 and game_snapshot.get_street() is not None and opponents:
+            try:
+                result = get_equity_service().calculate(hero_cards, board_cards, opponents)
+                logger.info(f"🎲 Equity {result.equity:.1%} vs {opponents} in {result.trials} trials "
+                            f"({result.elapsed_ms:.1f}ms)")
+                equity = result.to_dict()
+            except ValueError as e:
+                logger.warning(f"⚠️ Equity skipped for {window_name}: {e}")
+
+        self.equity_results[window_name] = (key, equity)
+        return equity
+
+    @staticmethod
+    def count_opponents(game_snapshot: GameSnapshot) -> int:
+        """Seats other than the hero's (player 1) still in the hand."""
+        configured = int(os.getenv('EQUITY_OPPONENTS', '0'))
+        if configured > 0:
+            return configured
+        opponents = 0
+        for player_id, detection in game_snapshot.positions.items():
+            if player_id == 1:
+                continue
+            try:
+                detected_position = DetectedPosition.from_detection_name(detection.name)
+            except ValueError:
+                continue
+            if detected_position != DetectedPosition.NO_POSITION and not detected_position.is_fold():
+                opponents += 1
+        return opponents
+
+    def get_bid_cache_stats(self) -> Dict[str, BidCacheStats]:
+        return {window_name: bid_cache.get_stats() for window_name, bid_cache in self.bid_caches.items()}
+
     def validate_image(self, captured_image: CapturedWindow):
         # Add size validation
         image_width, image_height = captured_image.get_size()
@@ -35,19 +142,34 @@ class PokerGameProcessor:
                 f"Неправильный размер картинки для окна {captured_image.window_name}. Ожидаеться: 784x584, Реальный размер: {image_width}x{image_height}. Скорее всего нужно поменять Jurojin Layout, размер окна в Jurojin должен быть: 770x577")
 
     @staticmethod
-    def create_game_snapshot(cv2_image):
-        player_cards_detections = DetectUtils.detect_player_cards(cv2_image)
-        table_cards_detections = DetectUtils.detect_table_cards(cv2_image)
-        position_detections = DetectUtils.detect_positions(cv2_image)
-        action_detections = DetectUtils.get_player_actions_detection(cv2_image)
+    def create_game_snapshot(cv2_image, region_state: Optional[WindowRegionState] = None,
+                             omaha_session: Optional[OmahaSession] = None):
+        if region_state is None:
+            player_cards_detections = DetectUtils.detect_player_cards(cv2_image)
+            table_cards_detections = DetectUtils.detect_table_cards(cv2_image)
+            position_detections = DetectUtils.detect_positions(cv2_image)
+            action_detections = DetectUtils.get_player_actions_detection(cv2_image)
+        else:
+            PokerGameProcessor._detect_changed_regions(cv2_image, region_state)
+            player_cards_detections = list(region_state.player_cards)
+            table_cards_detections = list(region_state.table_cards)
+            position_detections = dict(region_state.positions)
+            action_detections = dict(region_state.actions)
 
         moves_data = None
         try:
             recovered_positions = PositionService.get_positions(position_detections)
             position_actions = OmahaEngine.convert_to_position_actions(action_detections, recovered_positions)
-            game = OmahaEngine(len(position_actions))
-            game.simulate_all_moves(position_actions)
-            moves_data = game.get_moves_by_street()
+            if omaha_session is not None:
+                # New hero cards mean a new hand
+                hand = tuple(detection.name for detection in player_cards_detections)
+                moves_data = omaha_session.simulate(position_actions, hand)
+            elif get_simulation_cache() is not None:
+                moves_data = get_simulation_cache().simulate(position_actions)
+            else:
+                game = OmahaEngine(len(position_actions))
+                game.simulate_all_moves(position_actions)
+                moves_data = game.get_moves_by_street()
             logger.info(moves_data)
         except OmahaEngineException as e:
             # logger.error(f"Error in detection cycle: {str(e)}\n{traceback.format_exc()}")
@@ -60,3 +182,33 @@ class PokerGameProcessor:
             actions=action_detections,
             moves=moves_data
         )
+
+    @staticmethod
+    def _detect_changed_regions(cv2_image, region_state: WindowRegionState):
+        """Refresh the detections of changed regions in ``region_state``, reuse the rest."""
+        fingerprints = RegionChangeTracker.fingerprint_regions(cv2_image)
+        changed = region_state.changed_regions(fingerprints)
+
+        if PLAYER_CARDS_REGION in changed:
+            region_state.player_cards = DetectUtils.detect_player_cards(cv2_image)
+        if TABLE_CARDS_REGION in changed:
+            region_state.table_cards = DetectUtils.detect_table_cards(cv2_image)
+
+        position_seats = [seat for seat in PLAYER_POSITIONS if position_region(seat) in changed]
+        detected_positions = DetectUtils.detect_positions(cv2_image, position_seats) if position_seats else {}
+        region_state.positions.update(detected_positions)
+
+        action_seats = [seat for seat in ACTION_POSITIONS if action_region(seat) in changed]
+        if action_seats:
+            region_state.actions.update(DetectUtils.get_player_actions_detection(cv2_image, action_seats))
+
+        reused = len(fingerprints) - len(changed)
+
+        # Seats whose detection failed keep their old fingerprint so they are retried next frame, and
+        # drop their old detection: the region changed, so it no longer describes the seat
+        for seat in position_seats:
+            if seat not in detected_positions:
+                fingerprints.pop(position_region(seat))
+                region_state.positions.pop(seat, None)
+        region_state.fingerprints.update(fingerprints)
+        logger.info(f"🧩 Re-detected {len(changed)} changed regions, reused {reused}")
@@ -0,0 +1,98 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from shared.domain.detection import Detection
+from table_detector.utils.detect_utils import (
+    ACTION_POSITIONS,
+    PLAYER_CARD_SLOTS,
+    PLAYER_POSITIONS,
+    TABLE_CARD_SLOTS
+)
+
+PLAYER_CARDS_REGION = 'player_cards'
+TABLE_CARDS_REGION = 'table_cards'
+
+# Extra pixels around every region: search regions are derived from ratios and may round a pixel off
+REGION_MARGIN = 3
+
+
+def _union(rects) -> Tuple[int, int, int, int]:
+    rects = list(rects)
+    left = min(x for x, _, _, _ in rects)
+    top = min(y for _, y, _, _ in rects)
+    right = max(x + w for x, _, w, _ in rects)
+    bottom = max(y + h for _, y, _, h in rects)
+    return left, top, right - left, bottom - top
+
+
+def position_region(seat: int) -> str:
+    return f"position_{seat}"
+
+
+def action_region(seat: int) -> str:
+    return f"action_{seat}"
+
+
+# Region name -> (x, y, width, height) that each detector depends on
+DETECTION_REGIONS: Dict[str, Tuple[int, int, int, int]] = {
+    PLAYER_CARDS_REGION: _union(PLAYER_CARD_SLOTS.values()),
+    TABLE_CARDS_REGION: _union(TABLE_CARD_SLOTS.values()),
+    **{position_region(seat): (c['x'], c['y'], c['w'], c['h']) for seat, c in PLAYER_POSITIONS.items()},
+    **{action_region(seat): rect for seat, rect in ACTION_POSITIONS.items()},
+}
+
+
+@dataclass
+class WindowRegionState:
+    """Region fingerprints of one window and the detections they produced."""
+    fingerprints: Dict[str, bytes] = field(default_factory=dict)
+    player_cards: List[Detection] = field(default_factory=list)
+    table_cards: List[Detection] = field(default_factory=list)
+    positions: Dict[int, Detection] = field(default_factory=dict)
+    actions: Dict[int, List[Detection]] = field(default_factory=dict)
+
+    def changed_regions(self, fingerprints: Dict[str, bytes]) -> Set[str]:
+        return {name for name, fingerprint in fingerprints.items() if self.fingerprints.get(name) != fingerprint}
+
+
+class RegionChangeTracker:
+    """
+    Per-window region fingerprints so unchanged detector regions can be skipped.
+
+    The whole-window hash in ImageCaptureService only says that *something*
+    changed (often a timer or chat line); this tells which detector regions did.
+    """
+
+    def __init__(self):
+        self._states: Dict[str, WindowRegionState] = {}
+
+    def get_state(self, window_name: str) -> WindowRegionState:
+        state = self._states.get(window_name)
+        if state is None:
+            state = WindowRegionState()
+            self._states[window_name] = state
+        return state
+
+    def forget(self, window_name: str):
+        self._states.pop(window_name, None)
+
+    def __contains__(self, window_name: str) -> bool:
+        return window_name in self._states
+
+    @staticmethod
+    def fingerprint_regions(image: np.ndarray, regions: Optional[Dict[str, Tuple[int, int, int, int]]] = None
+                            ) -> Dict[str, bytes]:
+        if regions is None:
+            regions = DETECTION_REGIONS
+
+        image_h, image_w = image.shape[:2]
+        fingerprints = {}
+        for name, (x, y, w, h) in regions.items():
+            x1, y1 = max(0, x - REGION_MARGIN), max(0, y - REGION_MARGIN)
+            x2, y2 = min(image_w, x + w + REGION_MARGIN), min(image_h, y + h + REGION_MARGIN)
+            region = np.ascontiguousarray(image[y1:y2, x1:x2])
+            fingerprints[name] = hashlib.blake2b(region.data, digest_size=16).digest()
+        return fingerprints
@@ -0,0 +1,239 @@
+import re
+import time
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Set
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from table_detector.services.capture_backend import CaptureBackend
+from table_detector.utils.fs_utils import SCREENSHOT_EXTENSIONS
+
+# resources/results/<YYYY_MM_DD>/<HHMMSS> as written by create_timestamp_folder
+_DATE_TIME_FOLDERS = re.compile(r'(\d{4})_(\d{2})_(\d{2})/(\d{2})(\d{2})(\d{2})$')
+# Older single-folder sessions such as _20250610_025342
+_DATE_TIME_NAME = re.compile(r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})$')
+_WINDOW_PREFIX = re.compile(r'^(\d+)_')
+_TITLE_LINE = re.compile(r'^\s*Title:\s*(.*)$')
+
+
+@dataclass
+class ReplayFrame:
+    """One recorded detection cycle: its time offset and the window screenshots taken."""
+    name: str
+    offset: Optional[float]
+    windows: List[Dict] = field(default_factory=list)
+
+
+@dataclass
+class ReplayStats:
+    frames_total: int
+    frames_played: int
+    frames_decoded: int
+    frames_late: int
+    elapsed_seconds: float
+    achieved_fps: float
+    recorded_fps: float
+    speed: float
+
+
+class ReplayCaptureBackend(CaptureBackend):
+    """
+    Plays back a recorded session as if the poker client were running.
+
+    ``source`` is a results tree (resources/results, a <date> folder or a single
+    <date>/<time> folder) or a zip archive of one. Every folder holding a
+    windows.txt, or failing that every folder with screenshots, is one frame.
+    Frames are paced by their recorded timestamps divided by ``speed``
+    (``speed`` <= 0 plays back to back) and window images are decoded only when
+    captured.
+    """
+
+    # Seconds behind the recorded schedule after which a frame counts as late
+    LATE_TOLERANCE = 0.5
+
+    def __init__(self, source: str, speed: float = 1.0, loop: bool = False,
+                 default_interval: float = 3.0):
+        self.source = Path(source)
+        self.speed = speed
+        self.loop = loop
+        self.default_interval = default_interval
+
+        self._archive = zipfile.ZipFile(self.source) if self.source.is_file() else None
+        self.frames = self._index_frames()
+        if not self.frames:
+            raise ValueError(f"❌ No recorded frames found in {source}")
+
+        self._handles: Dict[str, int] = {}
+        self._index = -1
+        self._clock_start: Optional[float] = None
+        self._started_at: Optional[float] = None
+        self._frames_played = 0
+        self._frames_decoded = 0
+        self._frames_late = 0
+
+        logger.info(f"🎞️ Replay source {self.source}: {len(self.frames)} frames, speed {self.speed}")
+
+    @property
+    def current_frame(self) -> Optional[ReplayFrame]:
+        return self.frames[self._index] if 0 <= self._index < len(self.frames) else None
+
+    def next_frame(self) -> bool:
+        """Advance to the next frame once it is due; False when the session is over."""
+        if self._index + 1 >= len(self.frames):
+            if not self.loop:
+                return False
+            self._index = -1
+            self._clock_start = None
+
+        self._index += 1
+        now = time.perf_counter()
+        if self._clock_start is None:
+            self._clock_start = now
+        if self._started_at is None:
+            self._started_at = now
+
+        if self.speed > 0:
+            delay = self._clock_start + self._offset(self._index) / self.speed - now
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -self.LATE_TOLERANCE:
+                self._frames_late += 1
+
+        self._frames_played += 1
+        return True
+
+    def _offset(self, index: int) -> float:
+        first = self.frames[0].offset
+        offset = self.frames[index].offset
+        if first is None or offset is None:
+            return index * self.default_interval
+        return offset - first
+
+    def list_windows(self, title_filter: Optional[str] = None) -> List[Dict]:
+        frame = self.current_frame
+        if frame is None:
+            return []
+
+        windows = []
+        for window in frame.windows:
+            if title_filter is not None and title_filter not in window['title']:
+                continue
+            handle = self._handles.setdefault(window['key'], len(self._handles) + 1)
+            windows.append({**window, 'hwnd': handle})
+        return windows
+
+    def capture_window(self, window: Dict) -> Optional[np.ndarray]:
+        data = self._read(window['source'])
+        frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            logger.error(f"❌ Cannot decode replay frame {window['source']}")
+            return None
+
+        self._frames_decoded += 1
+        return frame
+
+    def get_stats(self) -> ReplayStats:
+        elapsed = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
+        recorded_span = self._offset(len(self.frames) - 1)
+        return ReplayStats(
+            frames_total=len(self.frames),
+            frames_played=self._frames_played,
+            frames_decoded=self._frames_decoded,
+            frames_late=self._frames_late,
+            elapsed_seconds=elapsed,
+            achieved_fps=self._frames_played / elapsed if elapsed > 0 else 0.0,
+            recorded_fps=(len(self.frames) - 1) / recorded_span if recorded_span > 0 else 0.0,
+            speed=self.speed
+        )
+
+    def close(self):
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def _read(self, source: str) -> bytes:
+        if self._archive is not None:
+            return self._archive.read(source)
+        return Path(source).read_bytes()
+
+    def _index_frames(self) -> List[ReplayFrame]:
+        files = set(self._list_files())
+
+        # A folder with windows.txt is a capture cycle and owns the screenshots in its window subfolders
+        cycle_folders = sorted({path.parent for path in files if path.name == 'windows.txt'})
+        if not cycle_folders:
+            cycle_folders = sorted({path.parent for path in files if self._is_screenshot(path)})
+
+        # Screenshots belong to the nearest cycle folder above them
+        cycle_screenshots: Dict[PurePosixPath, List[PurePosixPath]] = {folder: [] for folder in cycle_folders}
+        for path in files:
+            if not self._is_screenshot(path):
+                continue
+            for parent in path.parents:
+                if parent in cycle_screenshots:
+                    cycle_screenshots[parent].append(path)
+                    break
+
+        frames = []
+        for folder, screenshots in cycle_screenshots.items():
+            titles = self._read_titles(folder, files)
+            windows = [self._describe_window(path, titles) for path in sorted(screenshots)]
+            frames.append(ReplayFrame(name=str(folder), offset=self._parse_timestamp(folder), windows=windows))
+
+        frames.sort(key=lambda f: (f.offset is None, f.offset or 0.0, f.name))
+        return frames
+
+    def _list_files(self) -> List[PurePosixPath]:
+        if self._archive is not None:
+            return [PurePosixPath(name) for name in self._archive.namelist() if not name.endswith('/')]
+        return [PurePosixPath(path.as_posix()) for path in self.source.rglob('*') if path.is_file()]
+
+    @staticmethod
+    def _is_screenshot(path: PurePosixPath) -> bool:
+        name = path.name.lower()
+        return name.endswith(SCREENSHOT_EXTENSIONS) and not name.endswith('_result.png') and path.stem != 'full_screen'
+
+    def _read_titles(self, folder: PurePosixPath, files: Set[PurePosixPath]) -> Dict[int, str]:
+        windows_list = folder / 'windows.txt'
+        if windows_list not in files:
+            return {}
+
+        titles = {}
+        for line in self._read(str(windows_list)).decode('utf-8', errors='replace').splitlines():
+            match = _TITLE_LINE.match(line)
+            if match:
+                titles[len(titles) + 1] = match.group(1).strip()
+        return titles
+
+    @staticmethod
+    def _describe_window(path: PurePosixPath, titles: Dict[int, str]) -> Dict:
+        match = _WINDOW_PREFIX.match(path.stem)
+        title = titles.get(int(match.group(1))) if match else None
+        if not title:
+            title = (path.stem[match.end():] if match else path.stem).replace('_', ' ')
+
+        return {
+            'key': path.stem,
+            'title': title,
+            'rect': (0, 0, 0, 0),
+            'process': 'replay',
+            'width': 0,
+            'height': 0,
+            'source': str(path)
+        }
+
+    @staticmethod
+    def _parse_timestamp(folder: PurePosixPath) -> Optional[float]:
+        text = folder.as_posix()
+        match = _DATE_TIME_FOLDERS.search(text) or _DATE_TIME_NAME.search(text)
+        if not match:
+            return None
+        try:
+            return datetime(*(int(part) for part in match.groups())).timestamp()
+        except ValueError:
+            return None
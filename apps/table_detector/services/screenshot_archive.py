@@ -0,0 +1,293 @@
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from table_detector.domain.captured_window import CapturedWindow
+from table_detector.services.bid_detection_service import PLAYER_BID_POSITIONS
+from table_detector.services.region_change_tracker import DETECTION_REGIONS, REGION_MARGIN
+from table_detector.utils.fs_utils import SCREENSHOT_EXTENSIONS
+
+FULL_SCREEN = 'full_screen'
+
+_DATE_FOLDER = re.compile(r'^\d{4}_\d{2}_\d{2}$')
+_TIME_FOLDER = re.compile(r'^\d{6}$')
+
+# Rectangles kept in ROI-only screenshots: every detector region plus the bid seats
+ARCHIVE_REGIONS: List[Tuple[int, int, int, int]] = [
+    *DETECTION_REGIONS.values(),
+    *PLAYER_BID_POSITIONS.values(),
+]
+
+
+@dataclass
+class ArchivePolicy:
+    # 0 disables the corresponding limit
+    budget_mb: float = 2048.0
+    max_age_days: float = 7.0
+    # Save the full-screen capture every N cycles; 0 never saves it
+    fullscreen_every: int = 10
+    # Keep only the detector regions of window screenshots, the rest is blacked out
+    roi_only: bool = False
+    image_format: str = 'png'
+    prune_interval: float = 60.0
+
+    def __post_init__(self):
+        self.image_format = self.image_format.lower().lstrip('.')
+        if f".{self.image_format}" not in SCREENSHOT_EXTENSIONS:
+            raise ValueError(f"Unsupported archive format: {self.image_format}")
+
+    @classmethod
+    def from_env(cls) -> 'ArchivePolicy':
+        return cls(
+            budget_mb=float(os.getenv('ARCHIVE_BUDGET_MB', '2048')),
+            max_age_days=float(os.getenv('ARCHIVE_MAX_AGE_DAYS', '7')),
+            fullscreen_every=int(os.getenv('ARCHIVE_FULLSCREEN_EVERY', '10')),
+            roi_only=os.getenv('ARCHIVE_ROI_ONLY', 'false').lower() == 'true',
+            image_format=os.getenv('ARCHIVE_FORMAT', 'png'),
+            prune_interval=float(os.getenv('ARCHIVE_PRUNE_INTERVAL', '60'))
+        )
+
+
+@dataclass
+class ArchiveStats:
+    cycles: int
+    fullscreen_saved: int
+    fullscreen_skipped: int
+    indexed_frames: int
+    archive_bytes: int
+    folders_pruned: int
+    bytes_pruned: int
+    last_prune_ms: float
+
+
+class ScreenshotArchive:
+    """
+    Keeps the resources/results tree within a disk budget and age limit.
+
+    Cycle folders (<date>/<time>) are deleted oldest first once they are older
+    than ``max_age_days`` or the tree exceeds ``budget_mb``. Every saved
+    screenshot is appended to a per-session JSONL index in the results root, so
+    tooling can find frames without walking the tree; index entries of pruned
+    cycles point at files that no longer exist.
+
+    ROI-only screenshots keep the full window size with everything outside
+    ARCHIVE_REGIONS (detector regions and bid seats) zeroed: they compress to
+    a fraction of a full frame and still replay through the detectors and bid
+    reading unchanged.
+    """
+
+    def __init__(self, results_folder, policy: Optional[ArchivePolicy] = None, session_id: Optional[str] = None):
+        self.results_folder = Path(results_folder)
+        self.policy = policy or ArchivePolicy.from_env()
+        self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.index_path = self.results_folder / f"index_{self.session_id}.jsonl"
+
+        self._index_file = None
+        self._index_lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._prune_thread: Optional[threading.Thread] = None
+        self._last_prune = 0.0
+        self._masks: Dict[Tuple[int, int], List[Tuple[slice, slice]]] = {}
+        # Sizes of finished cycle folders, so a prune only stats new ones
+        self._folder_sizes: Dict[Path, int] = {}
+
+        self._cycles = 0
+        self._fullscreen_saved = 0
+        self._fullscreen_skipped = 0
+        self._indexed_frames = 0
+        self._archive_bytes = 0
+        self._folders_pruned = 0
+        self._bytes_pruned = 0
+        self._last_prune_ms = 0.0
+
+    def begin_cycle(self) -> bool:
+        """Start a capture cycle; True if its full-screen capture should be saved."""
+        self._cycles += 1
+        every = self.policy.fullscreen_every
+        save_fullscreen = every > 0 and (self._cycles - 1) % every == 0
+        if save_fullscreen:
+            self._fullscreen_saved += 1
+        else:
+            self._fullscreen_skipped += 1
+        return save_fullscreen
+
+    def prepare(self, captured_window: CapturedWindow) -> CapturedWindow:
+        """The window as it should be archived: in the archive format and, for ROI-only, masked."""
+        filename = f"{os.path.splitext(captured_window.filename)[0]}.{self.policy.image_format}"
+        if captured_window.window_name == FULL_SCREEN or not self.policy.roi_only:
+            if filename == captured_window.filename:
+                return captured_window
+            return CapturedWindow.from_frame(captured_window.get_cv2_image(), filename,
+                                             captured_window.window_name, "Archived")
+
+        return CapturedWindow.from_frame(self.mask_regions(captured_window.get_cv2_image()), filename,
+                                         captured_window.window_name, "Archived ROI")
+
+    def mask_regions(self, image: np.ndarray) -> np.ndarray:
+        height, width = image.shape[:2]
+        slices = self._masks.get((height, width))
+        if slices is None:
+            slices = []
+            for x, y, w, h in ARCHIVE_REGIONS:
+                x1, y1 = max(0, x - REGION_MARGIN), max(0, y - REGION_MARGIN)
+                x2, y2 = min(width, x + w + REGION_MARGIN), min(height, y + h + REGION_MARGIN)
+                slices.append((slice(y1, y2), slice(x1, x2)))
+            self._masks[(height, width)] = slices
+
+        masked = np.zeros_like(image)
+        for rows, cols in slices:
+            masked[rows, cols] = image[rows, cols]
+        return masked
+
+    def record(self, cycle_folder, captured_window: CapturedWindow, filepath):
+        """Append one saved screenshot to the session index."""
+        entry = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'cycle': self._relative(cycle_folder),
+            'window': captured_window.window_name,
+            'kind': FULL_SCREEN if captured_window.window_name == FULL_SCREEN else 'window',
+            'path': self._relative(filepath),
+            'roi_only': self.policy.roi_only and captured_window.window_name != FULL_SCREEN
+        }
+
+        with self._index_lock:
+            if self._index_file is None:
+                self.results_folder.mkdir(parents=True, exist_ok=True)
+                self._index_file = open(self.index_path, 'a', encoding='utf-8', buffering=1)
+            self._index_file.write(json.dumps(entry) + "\n")
+            self._indexed_frames += 1
+
+    def _relative(self, path) -> str:
+        try:
+            return Path(path).relative_to(self.results_folder).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
+
+    def maybe_prune(self, current_folder=None):
+        """Prune in the background once ``prune_interval`` has passed since the last prune."""
+        now = time.monotonic()
+        if now - self._last_prune < self.policy.prune_interval:
+            return
+        if self._prune_thread is not None and self._prune_thread.is_alive():
+            return
+
+        self._last_prune = now
+        self._prune_thread = threading.Thread(target=self.prune, kwargs={'current_folder': current_folder},
+                                              name="archive-prune", daemon=True)
+        self._prune_thread.start()
+
+    def prune(self, current_folder=None, now: Optional[datetime] = None) -> Tuple[int, int]:
+        """Delete expired and over-budget cycle folders; returns (folders, bytes) removed."""
+        with self._prune_lock:
+            start_time = time.perf_counter()
+            now = now or datetime.now()
+            current = Path(current_folder).resolve() if current_folder is not None else None
+
+            folders = self._cycle_folders()
+            sizes = {folder: self._folder_size(folder, cache=folder.resolve() != current) for folder, _ in folders}
+            total = sum(sizes.values())
+
+            budget = self.policy.budget_mb * 1024 * 1024
+            max_age = self.policy.max_age_days * 86400
+            removed_folders, removed_bytes = 0, 0
+
+            # Oldest first; the folder being written this cycle is never removed
+            for folder, created in folders:
+                if current is not None and folder.resolve() == current:
+                    continue
+                expired = max_age > 0 and (now - created).total_seconds() > max_age
+                over_budget = budget > 0 and total > budget
+                if not expired and not over_budget:
+                    break
+
+                shutil.rmtree(folder, ignore_errors=True)
+                self._folder_sizes.pop(folder, None)
+                total -= sizes[folder]
+                removed_folders += 1
+                removed_bytes += sizes[folder]
+
+            self._remove_empty_date_folders()
+
+            self._archive_bytes = total
+            self._folders_pruned += removed_folders
+            self._bytes_pruned += removed_bytes
+            self._last_prune_ms = (time.perf_counter() - start_time) * 1000
+
+            if removed_folders:
+                logger.info(f"🧹 Pruned {removed_folders} result folders ({removed_bytes / 1024 / 1024:.1f} MB), "
+                            f"archive now {total / 1024 / 1024:.1f} MB")
+            return removed_folders, removed_bytes
+
+    def _cycle_folders(self) -> List[Tuple[Path, datetime]]:
+        folders = []
+        if not self.results_folder.is_dir():
+            return folders
+
+        for date_entry in os.scandir(self.results_folder):
+            if not date_entry.is_dir() or not _DATE_FOLDER.match(date_entry.name):
+                continue
+            for time_entry in os.scandir(date_entry.path):
+                if not time_entry.is_dir() or not _TIME_FOLDER.match(time_entry.name):
+                    continue
+                try:
+                    created = datetime.strptime(f"{date_entry.name}{time_entry.name}", "%Y_%m_%d%H%M%S")
+                except ValueError:
+                    continue
+                folders.append((Path(time_entry.path), created))
+
+        folders.sort(key=lambda item: item[1])
+        return folders
+
+    def _folder_size(self, folder: Path, cache: bool) -> int:
+        size = self._folder_sizes.get(folder)
+        if size is not None:
+            return size
+
+        size = 0
+        for root, _, files in os.walk(folder):
+            for name in files:
+                try:
+                    size += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        if cache:
+            self._folder_sizes[folder] = size
+        return size
+
+    def _remove_empty_date_folders(self):
+        if not self.results_folder.is_dir():
+            return
+        for date_entry in os.scandir(self.results_folder):
+            if date_entry.is_dir() and _DATE_FOLDER.match(date_entry.name) and not os.listdir(date_entry.path):
+                os.rmdir(date_entry.path)
+
+    def get_stats(self) -> ArchiveStats:
+        return ArchiveStats(
+            cycles=self._cycles,
+            fullscreen_saved=self._fullscreen_saved,
+            fullscreen_skipped=self._fullscreen_skipped,
+            indexed_frames=self._indexed_frames,
+            archive_bytes=self._archive_bytes,
+            folders_pruned=self._folders_pruned,
+            bytes_pruned=self._bytes_pruned,
+            last_prune_ms=self._last_prune_ms
+        )
+
+    def close(self):
+        if self._prune_thread is not None:
+            self._prune_thread.join()
+        with self._index_lock:
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+        logger.info(f"🗄️ Screenshot archive closed: {self.get_stats()}")
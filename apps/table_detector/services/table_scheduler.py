@@ -0,0 +1,226 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from loguru import logger
+
+from shared.domain.game_snapshot import GameSnapshot
+
+HERO_SEAT = 1
+
+HOT = 'hot'  # hero is to act
+ACTIVE = 'active'  # the game state changed on the last poll
+IDLE = 'idle'  # nothing changed or the hero is not in the hand
+
+_PRIORITY = {HOT: 0, ACTIVE: 1, IDLE: 2}
+
+
+@dataclass
+class TableActivity:
+    window_name: str
+    interval: float
+    next_due: float
+    state: str = ACTIVE
+    # Smoothed seconds one capture + detection of this table takes
+    cost: float = 0.0
+    polls: int = 0
+    changes: int = 0
+    signature: Optional[Tuple] = None
+
+
+@dataclass
+class TableSchedulerStats:
+    tables: int
+    hot_tables: int
+    idle_tables: int
+    polls: int
+    deferred: int
+    cpu_load: float
+    cpu_budget: float
+    intervals: Dict[str, float] = field(default_factory=dict)
+
+
+class TableScheduler:
+    """
+    Decides which tables to capture on each detection cycle.
+
+    Every table gets its own polling interval from its recent activity: tables
+    where the hero is to act are polled every ``min_interval``, tables whose
+    game state just changed every ``active_interval``, and unchanged or
+    folded tables back off by ``backoff`` up to ``max_interval``.
+
+    Detection time is paid from a token bucket refilled at ``cpu_budget``
+    seconds per second (the share of one core detection may use) and capped at
+    ``latency_budget`` seconds, the most work a single cycle may take. When the
+    bucket runs dry, due tables wait, hot tables first in line.
+    """
+
+    COST_SMOOTHING = 0.3
+
+    def __init__(self, min_interval: float = 0.5, active_interval: float = 1.0, max_interval: float = 3.0,
+                 backoff: float = 1.5, cpu_budget: float = 0.5, latency_budget: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic):
+        self.min_interval = min_interval
+        self.active_interval = max(active_interval, min_interval)
+        self.max_interval = max(max_interval, self.active_interval)
+        self.backoff = backoff
+        self.cpu_budget = cpu_budget
+        self.latency_budget = latency_budget
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._tables: Dict[str, TableActivity] = {}
+        self._admitted: Set[str] = set()
+        self._tokens = latency_budget
+        self._last_refill = clock()
+        self._started_at = self._last_refill
+        self._spent = 0.0
+        self._polls = 0
+        self._deferred = 0
+
+    @classmethod
+    def from_env(cls, detection_interval: float) -> 'TableScheduler':
+        return cls(
+            min_interval=float(os.getenv('ADAPTIVE_MIN_INTERVAL', '0.5')),
+            active_interval=float(os.getenv('ADAPTIVE_ACTIVE_INTERVAL', '1.0')),
+            max_interval=float(os.getenv('ADAPTIVE_MAX_INTERVAL', str(detection_interval))),
+            backoff=float(os.getenv('ADAPTIVE_BACKOFF', '1.5')),
+            cpu_budget=float(os.getenv('ADAPTIVE_CPU_BUDGET', '0.5')),
+            latency_budget=float(os.getenv('ADAPTIVE_LATENCY_BUDGET', '0.5'))
+        )
+
+    def begin_cycle(self) -> Set[str]:
+        """Pick the due tables this cycle can afford; tables not seen yet are always captured."""
+        with self._lock:
+            now = self._refill()
+            due = [table for table in self._tables.values() if table.next_due <= now]
+            due.sort(key=lambda table: (_PRIORITY[table.state], table.next_due))
+
+            admitted = set()
+            cycle_cost = 0.0
+            for table in due:
+                # The first table always goes so a drained bucket delays tables but never starves them
+                if admitted and (table.cost > self._tokens or cycle_cost + table.cost > self.latency_budget):
+                    break
+                admitted.add(table.window_name)
+                cycle_cost += table.cost
+                self._tokens -= table.cost
+
+            self._deferred += len(due) - len(admitted)
+            self._admitted = admitted
+            return set(admitted)
+
+    def should_capture(self, window_name: str) -> bool:
+        with self._lock:
+            return window_name not in self._tables or window_name in self._admitted
+
+    def record(self, window_name: str, cost: float, snapshot: Optional[GameSnapshot] = None):
+        """
+        Update a polled table. ``snapshot`` is None when the window image did
+        not change, in which case the table keeps its state and backs off unless
+        the hero is still to act.
+        """
+        with self._lock:
+            now = self._clock()
+            table = self._tables.get(window_name)
+            is_new = table is None
+            if is_new:
+                table = TableActivity(window_name, interval=self.active_interval, next_due=now, cost=cost)
+                self._tables[window_name] = table
+
+            # Admitted tables already paid their estimate; settle the difference
+            estimate = table.cost if window_name in self._admitted else 0.0
+            self._tokens += estimate - cost
+            self._admitted.discard(window_name)
+            self._spent += cost
+            self._polls += 1
+
+            table.polls += 1
+            if not is_new:
+                table.cost += self.COST_SMOOTHING * (cost - table.cost)
+
+            if snapshot is not None:
+                signature = TableScheduler.signature(snapshot)
+                changed = signature != table.signature
+                table.signature = signature
+                if TableScheduler.is_hero_to_act(snapshot):
+                    table.state = HOT
+                elif changed and snapshot.player_cards:
+                    table.state = ACTIVE
+                else:
+                    table.state = IDLE
+                if changed:
+                    table.changes += 1
+            elif table.state == ACTIVE:
+                table.state = IDLE
+
+            if table.state == HOT:
+                table.interval = self.min_interval
+            elif table.state == ACTIVE:
+                table.interval = self.active_interval
+            else:
+                table.interval = min(self.max_interval, max(table.interval, self.active_interval) * self.backoff)
+            table.next_due = now + table.interval
+
+    def forget(self, window_name: str):
+        with self._lock:
+            self._tables.pop(window_name, None)
+            self._admitted.discard(window_name)
+
+    def next_delay(self) -> float:
+        """Seconds until the next cycle is worth running."""
+        with self._lock:
+            now = self._refill()
+            if not self._tables:
+                return self.max_interval
+
+            delay = min(table.next_due for table in self._tables.values()) - now
+            if self._tokens < 0 and self.cpu_budget > 0:
+                delay = max(delay, -self._tokens / self.cpu_budget)
+            return min(self.max_interval, max(0.05, delay))
+
+    def _refill(self) -> float:
+        now = self._clock()
+        self._tokens = min(self.latency_budget, self._tokens + (now - self._last_refill) * self.cpu_budget)
+        self._last_refill = now
+        return now
+
+    @staticmethod
+    def is_hero_to_act(snapshot: GameSnapshot) -> bool:
+        """The hero holds cards and has not acted yet on this street."""
+        if snapshot.is_player_move:
+            return True
+        return bool(snapshot.player_cards) and not snapshot.actions.get(HERO_SEAT)
+
+    @staticmethod
+    def signature(snapshot: GameSnapshot) -> Tuple:
+        """The parts of a snapshot that change when the game moves on (not timers or chat)."""
+        return (
+            tuple(card.name for card in snapshot.player_cards),
+            tuple(card.name for card in snapshot.table_cards),
+            tuple(sorted((seat, position.name) for seat, position in snapshot.positions.items())),
+            tuple(sorted((seat, tuple(action.name for action in actions))
+                         for seat, actions in snapshot.actions.items()))
+        )
+
+    def get_stats(self) -> TableSchedulerStats:
+        with self._lock:
+            elapsed = self._clock() - self._started_at
+            tables = list(self._tables.values())
+            return TableSchedulerStats(
+                tables=len(tables),
+                hot_tables=sum(1 for table in tables if table.state == HOT),
+                idle_tables=sum(1 for table in tables if table.state == IDLE),
+                polls=self._polls,
+                deferred=self._deferred,
+                cpu_load=self._spent / elapsed if elapsed > 0 else 0.0,
+                cpu_budget=self.cpu_budget,
+                intervals={table.window_name: round(table.interval, 2) for table in tables}
+            )
+
+    def log_stats(self):
+        stats = self.get_stats()
+        logger.debug(f"⏱️ Table scheduler: {stats.tables} tables ({stats.hot_tables} hot, {stats.idle_tables} idle), "
+                     f"load {stats.cpu_load:.2f}/{stats.cpu_budget:.2f} core, {stats.deferred} deferred polls")
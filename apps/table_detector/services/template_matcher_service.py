@@ -1,5 +1,4 @@
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
@@ -7,11 +6,19 @@ from typing import List, Dict, Optional, Tuple
 import numpy as np
 
 from shared.domain.detection import Detection
-from table_detector.services.template_registry import TemplateRegistry
+from table_detector.domain.template_stack import TemplateStack
+from table_detector.services.matching_executor import MatchingExecutor
+from table_detector.services.template_registry import TemplateRegistry, CARD_GLYPH_BOXES
 from table_detector.utils.template_matching_utils import (
     find_single_template_matches,
+    find_template_stack_peaks,
+    stack_peak_to_detection,
     filter_overlapping_detections,
-    sort_detections_by_position
+    non_max_suppression,
+    sort_detections_by_position,
+    is_card_slot_occupied,
+    classify_card_slot,
+    recognize_card_glyphs
 )
 
 
@@ -24,6 +31,7 @@ class MatchConfig:
     scale_factors: List[float] = None
     sort_by: str = 'x'  # 'x', 'y', 'score'
     max_workers: int = 4
+    grayscale: bool = False  # Only honoured by stack matching
 
     def __post_init__(self):
         if self.scale_factors is None:
@@ -46,27 +54,69 @@ class TemplateMatchService:
         if not templates:
             return []
 
-        # Find all template matches in parallel
+        # Find all template matches in parallel on the shared matching pool
+        executor = MatchingExecutor.get()
+        futures = [
+            executor.submit(
+                find_single_template_matches,
+                image, template, template_name,
+                config.search_region, config.scale_factors,
+                config.threshold, config.min_size,
+                TemplateMatchService.TEMPLATE_REGISTRY
+            )
+            for template_name, template in templates.items()
+        ]
+
         all_detections = []
+        for future in futures:
+            all_detections.extend(future.result())
+
+        return TemplateMatchService._finalize_detections(all_detections, config)
+
+    @staticmethod
+    def find_stack_matches(image: np.ndarray, stacks: List[TemplateStack],
+                           config: MatchConfig = None) -> List[Detection]:
+        if config is None:
+            config = MatchConfig()
+
+        if not stacks:
+            return []
 
-        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-            futures = []
-            for template_name, template in templates.items():
-                future = executor.submit(
-                    find_single_template_matches,
-                    image, template, template_name,
-                    config.search_region, config.scale_factors,
-                    config.threshold, config.min_size
+        # Collect peaks as arrays and build dictionaries only for NMS survivors
+        peak_stacks, peak_indices, peak_boxes, peak_scores = [], [], [], []
+        for scale in config.scale_factors:
+            for stack in TemplateMatchService.TEMPLATE_REGISTRY.get_scaled_template_stacks(stacks, scale):
+                template_indices, boxes, scores = find_template_stack_peaks(
+                    image, stack, config.search_region, config.threshold, config.grayscale
                 )
-                futures.append(future)
+                if len(scores):
+                    peak_stacks.extend([stack] * len(scores))
+                    peak_indices.append(template_indices)
+                    peak_boxes.append(boxes)
+                    peak_scores.append(scores)
+
+        if not peak_scores:
+            return []
+
+        peak_indices = np.concatenate(peak_indices)
+        peak_boxes = np.concatenate(peak_boxes)
+        peak_scores = np.concatenate(peak_scores)
+        keep = non_max_suppression(peak_boxes, peak_scores, config.overlap_threshold)
 
-            for future in futures:
-                detections = future.result()
-                all_detections.extend(detections)
+        survivors = [
+            stack_peak_to_detection(peak_stacks[i], int(peak_indices[i]), peak_boxes[i], peak_scores[i])
+            for i in keep
+        ]
+        return TemplateMatchService._sort_and_convert(survivors, config)
 
+    @staticmethod
+    def _finalize_detections(all_detections: List[Dict], config: MatchConfig) -> List[Detection]:
         # Filter overlapping detections
         filtered = filter_overlapping_detections(all_detections, config.overlap_threshold)
+        return TemplateMatchService._sort_and_convert(filtered, config)
 
+    @staticmethod
+    def _sort_and_convert(filtered: List[Dict], config: MatchConfig) -> List[Detection]:
         # Sort detections
         if config.sort_by == 'score':
             sorted_detections = sorted(filtered, key=lambda d: d['match_score'], reverse=True)
@@ -94,7 +144,7 @@ class TemplateMatchService:
             threshold=0.955,
             sort_by='x'
         )
-        return TemplateMatchService.find_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.player_templates, config)
+        return TemplateMatchService.find_stack_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.player_template_stacks, config)
 
     @staticmethod
     def find_table_cards(image: np.ndarray) -> List[Detection]:
@@ -103,7 +153,50 @@ class TemplateMatchService:
             threshold=0.955,
             sort_by='x'
         )
-        return TemplateMatchService.find_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.table_templates, config)
+        return TemplateMatchService.find_stack_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.table_template_stacks, config)
+
+    @staticmethod
+    def find_table_cards_in_slots(image: np.ndarray, slots: Dict[int, Tuple[int, int, int, int]],
+                                  threshold: float = 0.955) -> List[Detection]:
+        stacks = TemplateMatchService.TEMPLATE_REGISTRY.table_template_stacks
+        if not stacks:
+            return []
+
+        detections = []
+        for slot in slots.values():
+            if not is_card_slot_occupied(image, slot):
+                continue
+
+            detection = classify_card_slot(image, stacks, slot, match_threshold=threshold)
+            if detection:
+                detections.append(detection)
+
+        sorted_detections = sort_detections_by_position(detections, 'x')
+        return [TemplateMatchService._dict_to_detection(d) for d in sorted_detections]
+
+    @staticmethod
+    def find_cards_by_glyphs(image: np.ndarray, slots: Dict[int, Tuple[int, int, int, int]],
+                             category: str) -> List[Detection]:
+        registry = TemplateMatchService.TEMPLATE_REGISTRY
+        rank_stacks = registry.get_card_glyph_stacks(category, 'rank')
+        suit_stacks = registry.get_card_glyph_stacks(category, 'suit')
+        if not rank_stacks or not suit_stacks:
+            return []
+
+        # Report names spelled like the card templates (e.g. 'Jh') so both paths agree
+        templates = registry.player_templates if category == 'player_cards' else registry.table_templates
+        template_names = {name.upper(): name for name in templates}
+
+        boxes = CARD_GLYPH_BOXES[category]
+        detections = []
+        for slot in slots.values():
+            detection = recognize_card_glyphs(image, slot, rank_stacks, suit_stacks, boxes['rank'], boxes['suit'])
+            if detection:
+                detection['template_name'] = template_names.get(detection['template_name'], detection['template_name'])
+                detections.append(detection)
+
+        sorted_detections = sort_detections_by_position(detections, 'x')
+        return [TemplateMatchService._dict_to_detection(d) for d in sorted_detections]
 
     @staticmethod
     def find_positions(image: np.ndarray, search_region: Tuple[float, float, float, float] = None) -> List[Detection]:
@@ -113,8 +206,8 @@ class TemplateMatchService:
             min_size=10,
             sort_by='score'
         )
-        return TemplateMatchService.find_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.position_templates,
-                                                 config)
+        return TemplateMatchService.find_stack_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.position_template_stacks,
+                                                       config)
 
     @staticmethod
     def find_actions(image: np.ndarray) -> List[Detection]:
@@ -124,7 +217,7 @@ class TemplateMatchService:
             min_size=20,
             sort_by='x'
         )
-        return TemplateMatchService.find_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.action_templates, config)
+        return TemplateMatchService.find_stack_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.action_template_stacks, config)
 
     @staticmethod
     def find_jurojin_actions(image: np.ndarray, search_region: Tuple[float, float, float, float]) -> List[Detection]:
@@ -134,4 +227,4 @@ class TemplateMatchService:
             min_size=20,
             sort_by='x'
         )
-        return TemplateMatchService.find_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.jurojin_action_templates, config)
\ No newline at end of file
+        return TemplateMatchService.find_stack_matches(image, TemplateMatchService.TEMPLATE_REGISTRY.jurojin_action_template_stacks, config)
\ No newline at end of file
@@ -1,11 +1,22 @@
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+import cv2
 
 import numpy as np
 from loguru import logger
 
+from table_detector.domain.scaled_template import ScaledTemplate
+from table_detector.domain.template_stack import TemplateStack
 from table_detector.utils.opencv_utils import read_cv2_image
 
+# Rank and suit glyph boxes (x, y, width, height) inside the card templates
+CARD_GLYPH_BOXES = {
+    'player_cards': {'rank': (4, 17, 17, 19), 'suit': (0, 10, 6, 8)},
+    'table_cards': {'rank': (3, 28, 39, 31), 'suit': (2, 16, 11, 13)},
+}
+
 
 class TemplateRegistry:
     def __init__(self, country: str, project_root: str):
@@ -17,6 +28,10 @@ class TemplateRegistry:
         self._position_templates: Optional[Dict[str, np.ndarray]] = None
         self._actions_templates: Optional[Dict[str, np.ndarray]] = None
         self._jurojin_action_templates: Optional[Dict[str, np.ndarray]] = None
+        self._template_stacks: Dict[str, List[TemplateStack]] = {}
+        self._scaled_templates: Dict[Tuple[str, float], Tuple[np.ndarray, ScaledTemplate]] = {}
+        self._scaled_stacks: Dict[Tuple[int, float], Tuple[TemplateStack, TemplateStack]] = {}
+        self._scale_lock = threading.Lock()
 
         self._templates_dir = Path(project_root) / "apps" / "table_detector" / "resources" / "templates" / country
 
@@ -68,6 +83,109 @@ class TemplateRegistry:
             self._jurojin_action_templates = self._load_template_category("moves")
         return self._jurojin_action_templates
 
+    @property
+    def player_template_stacks(self) -> List[TemplateStack]:
+        return self._get_template_stacks("player_cards", lambda: self.player_templates)
+
+    @property
+    def table_template_stacks(self) -> List[TemplateStack]:
+        return self._get_template_stacks("table_cards", lambda: self.table_templates)
+
+    @property
+    def position_template_stacks(self) -> List[TemplateStack]:
+        return self._get_template_stacks("positions", lambda: self.position_templates)
+
+    @property
+    def action_template_stacks(self) -> List[TemplateStack]:
+        return self._get_template_stacks("actions", lambda: self.action_templates)
+
+    @property
+    def jurojin_action_template_stacks(self) -> List[TemplateStack]:
+        return self._get_template_stacks("moves", lambda: self.jurojin_action_templates)
+
+    def _get_template_stacks(self, category: str, load_templates) -> List[TemplateStack]:
+        stacks = self._template_stacks.get(category)
+        if stacks is None:
+            stacks = TemplateStack.from_templates(load_templates())
+            self._template_stacks[category] = stacks
+            logger.info(f"📚 Stacked {category} templates: {stacks}")
+        return stacks
+
+    def get_scaled_template(self, template_name: str, template: np.ndarray, scale: float) -> ScaledTemplate:
+        """
+        Template resized for ``scale``, resized only on the first request per process.
+
+        Entries are keyed by template name and scale; the source array is kept with
+        the entry so a different template under the same name is never served stale.
+        """
+        key = (template_name, scale)
+        cached = self._scaled_templates.get(key)
+        if cached is not None and cached[0] is template:
+            return cached[1]
+
+        template_h, template_w = template.shape[:2]
+        scaled_w, scaled_h = int(template_w * scale), int(template_h * scale)
+        image = template if (scaled_w, scaled_h) == (template_w, template_h) else cv2.resize(template, (scaled_w, scaled_h))
+        scaled = ScaledTemplate(image, scale, scaled_w, scaled_h, template_w, template_h)
+
+        with self._scale_lock:
+            self._scaled_templates[key] = (template, scaled)
+        return scaled
+
+    def get_scaled_template_stacks(self, stacks: List[TemplateStack], scale: float) -> List[TemplateStack]:
+        """Stacks resized for ``scale``; the unit scale returns the stacks themselves."""
+        if scale == 1.0:
+            return stacks
+
+        scaled_stacks = []
+        for stack in stacks:
+            key = (id(stack), scale)
+            cached = self._scaled_stacks.get(key)
+            if cached is None or cached[0] is not stack:
+                with self._scale_lock:
+                    cached = (stack, stack.rescaled(scale))
+                    self._scaled_stacks[key] = cached
+                logger.info(f"📐 Scaled {cached[1]} by {scale}")
+            scaled_stacks.append(cached[1])
+        return scaled_stacks
+
+    def get_card_glyph_stacks(self, category: str, part: str) -> List[TemplateStack]:
+        """
+        Rank ('rank') or suit ('suit') glyph stacks cut out of a card category.
+
+        Rank glyphs are single-channel (channel minimum) so they match all four
+        suit colors, suit glyphs keep their color.
+        """
+        key = f"{category}:{part}"
+        stacks = self._template_stacks.get(key)
+        if stacks is None:
+            templates = self.player_templates if category == "player_cards" else self.table_templates
+            glyphs = TemplateRegistry._extract_card_glyphs(templates, CARD_GLYPH_BOXES[category][part], part)
+            stacks = TemplateStack.from_templates(glyphs) if glyphs else []
+            self._template_stacks[key] = stacks
+            logger.info(f"📚 Stacked {category} {part} glyphs: {sorted(glyphs)}")
+        return stacks
+
+    @staticmethod
+    def _extract_card_glyphs(templates: Dict[str, np.ndarray], box, part: str) -> Dict[str, np.ndarray]:
+        x, y, w, h = box
+        candidates: Dict[str, List[np.ndarray]] = {}
+        for name, template in templates.items():
+            if template.shape[0] < y + h or template.shape[1] < x + w:
+                continue
+            key = name[:-1].upper() if part == "rank" else name[-1].upper()
+            crop = template[y:y + h, x:x + w]
+            candidates.setdefault(key, []).append(crop.min(axis=2) if part == "rank" else crop)
+
+        # Use the crop most similar to its siblings so one odd template cannot define a glyph
+        return {key: TemplateRegistry._most_typical(crops) for key, crops in candidates.items()}
+
+    @staticmethod
+    def _most_typical(crops: List[np.ndarray]) -> np.ndarray:
+        flat = np.stack([c.reshape(-1) for c in crops]).astype(np.float64)
+        flat /= np.maximum(np.linalg.norm(flat, axis=1, keepdims=True), 1e-9)
+        return crops[int(np.argmax((flat @ flat.T).sum(axis=1)))]
+
     def _load_template_category(self, category: str) -> Dict[str, np.ndarray]:
         templates_path = self._templates_dir / category
 
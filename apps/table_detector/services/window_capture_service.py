@@ -1,43 +1,51 @@
 import os
-from typing import List
+from typing import Callable, List, Optional
 
 from loguru import logger
 
 from table_detector.domain.captured_window import CapturedWindow
+from table_detector.services.artifact_writer import ArtifactWriter
+from table_detector.services.capture_backend import CaptureBackend, Win32CaptureBackend
+from table_detector.services.screenshot_archive import ScreenshotArchive
 from table_detector.utils.capture_utils import load_images_from_folder, get_poker_window_info, _capture_windows, \
     save_images_to_window_folders, capture_fullscreen
 from table_detector.utils.windows_utils import write_windows_list
 
 
-def capture_and_save_windows(timestamp_folder: str = None, save_windows=True, debug=False) -> List[CapturedWindow]:
+def capture_and_save_windows(timestamp_folder: str = None, save_windows=True, debug=False,
+                             backend: Optional[CaptureBackend] = None,
+                             writer: Optional[ArtifactWriter] = None,
+                             archive: Optional[ScreenshotArchive] = None,
+                             window_filter: Optional[Callable[[str], bool]] = None) -> List[CapturedWindow]:
     if debug:
         captured_images = load_images_from_folder(timestamp_folder)
+        if window_filter is not None:
+            captured_images = [image for image in captured_images if window_filter(image.window_name)]
         if captured_images:
             logger.info(f"✅ Loaded {len(captured_images)} images from debug folder")
         else:
             logger.error("❌ No images loaded from debug folder")
         return captured_images
 
-    windows = get_poker_window_info("Pot Limit Omaha")
+    if backend is None:
+        backend = Win32CaptureBackend()
+
+    windows = get_poker_window_info("Pot Limit Omaha", backend)
     if len(windows) > 0:
         logger.info(f"Found {len(windows)} poker windows with titles:")
-        os.makedirs(timestamp_folder, exist_ok=True)
     else:
         return []
 
-    captured_images = _capture_windows(windows=windows)
-
-    if save_windows:
-        full_screen = capture_fullscreen()
+    captured_images = _capture_windows(windows=windows, backend=backend, window_filter=window_filter)
+    if captured_images:
+        os.makedirs(timestamp_folder, exist_ok=True)
 
-        full_screen_captured = CapturedWindow(
-            image=full_screen,
-            filename="full_screen.png",
-            window_name='full_screen',
-            description="Full screen"
-        )
-        captured_images.append(full_screen_captured)
-        logger.info(f"Captured full screen")
+    if save_windows and captured_images:
+        # The archive samples full-screen captures instead of grabbing one every cycle
+        full_screen_captured = capture_fullscreen(backend) if archive is None or archive.begin_cycle() else None
+        if full_screen_captured:
+            captured_images.append(full_screen_captured)
+            logger.info(f"Captured full screen")
 
         # Create window folder mapping - each window gets its own folder
         window_folder_mapping = {}
@@ -53,12 +61,22 @@ def capture_and_save_windows(timestamp_folder: str = None, save_windows=True, de
                 # Full screen goes to base folder
                 window_folder_mapping[captured_image.window_name] = timestamp_folder
 
-        # Save images to their respective window folders
-        save_images_to_window_folders(captured_images, timestamp_folder, window_folder_mapping)
+        archived_images = captured_images
+        if archive is not None:
+            archived_images = [archive.prepare(captured_image) for captured_image in captured_images]
+            for archived_image in archived_images:
+                window_folder = window_folder_mapping[archived_image.window_name]
+                archive.record(timestamp_folder, archived_image, os.path.join(window_folder, archived_image.filename))
+
+        # Save images to their respective window folders, in the background when a writer is given
+        save_images_to_window_folders(archived_images, timestamp_folder, window_folder_mapping, writer)
 
         # Write the window list to base folder
         write_windows_list(windows, timestamp_folder)
 
+        if archive is not None:
+            archive.maybe_prune(timestamp_folder)
+
         # Remove full screen from the list before returning
         captured_images = [img for img in captured_images if img.window_name != 'full_screen']
 
@@ -0,0 +1,208 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from shared.domain.game_snapshot import GameSnapshot
+from table_detector.domain.captured_window import CapturedWindow
+
+
+@dataclass
+class WindowResult:
+    window_name: str
+    snapshot: GameSnapshot
+    # Seconds the worker spent in process_window
+    seconds: float
+
+
+@dataclass
+class WindowProcessPoolStats:
+    workers: int
+    windows: int
+    submitted: int
+    completed: int
+    shared_bytes: int
+
+
+# Worker process state: one PokerGameProcessor per worker keeps the region state of the windows routed to it
+_worker_processor = None
+_worker_segments: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    try:
+        # The parent owns and unlinks the segment; the worker must not track it
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(matching_threads: int):
+    global _worker_processor
+    from table_detector.services.matching_executor import MatchingExecutor
+    from table_detector.services.poker_game_processor import PokerGameProcessor
+
+    # Windows run in parallel across processes, so matching inside each stays narrow
+    MatchingExecutor.configure(matching_threads)
+    _worker_processor = PokerGameProcessor()
+
+
+def _process_in_worker(segment_name: str, shape: Tuple[int, ...], filename: str, window_name: str,
+                       timestamp_folder) -> WindowResult:
+    segment = _worker_segments.get(segment_name)
+    if segment is None:
+        segment = _attach_segment(segment_name)
+        _worker_segments[segment_name] = segment
+
+    start_time = time.perf_counter()
+    frame = np.ndarray(shape, dtype=np.uint8, buffer=segment.buf)
+    captured_window = CapturedWindow.from_frame(frame, filename, window_name, "Shared memory frame")
+    try:
+        snapshot = _worker_processor.process_window(captured_window, timestamp_folder)
+    finally:
+        captured_window.close()
+        del frame, captured_window
+    return WindowResult(window_name, snapshot, time.perf_counter() - start_time)
+
+
+def _forget_in_worker(window_name: str, segment_name: Optional[str]):
+    _worker_processor.forget_window(window_name)
+    segment = _worker_segments.pop(segment_name, None) if segment_name else None
+    if segment is not None:
+        segment.close()
+
+
+class WindowProcessPool:
+    """
+    Runs PokerGameProcessor.process_window for several windows in parallel processes.
+
+    Every window owns a shared memory segment its frames are copied into, so a
+    frame crosses the process boundary as a segment name instead of a pickled
+    array; only the GameSnapshot comes back pickled. A window always goes to
+    the same single-process worker, which keeps its region change state warm.
+
+    The pool may be used from several threads. Frames are copied and queued
+    under a lock, and a window's forget task runs on its worker after every
+    frame queued before it, so a segment is never unlinked under a frame that
+    is still being written or read.
+    """
+
+    def __init__(self, workers: int, matching_threads: int = 1):
+        self.workers = workers
+        # spawn everywhere: forking a process that already runs matcher threads is unsafe
+        context = multiprocessing.get_context('spawn')
+        self._executors: List[ProcessPoolExecutor] = [
+            ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_init_worker,
+                                initargs=(matching_threads,))
+            for _ in range(workers)
+        ]
+        # Guards the assignments, segments and counters below
+        self._lock = threading.Lock()
+        self._assignments: Dict[str, int] = {}
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self._submitted = 0
+        self._completed = 0
+
+    @classmethod
+    def from_env(cls) -> Optional['WindowProcessPool']:
+        workers = int(os.getenv('WINDOW_PROCESS_WORKERS', '0'))
+        if workers <= 0:
+            return None
+        pool = cls(workers, matching_threads=int(os.getenv('WINDOW_PROCESS_MATCHING_THREADS', '1')))
+        logger.info(f"🧮 Window process pool started with {workers} workers")
+        return pool
+
+    def submit(self, captured_window: CapturedWindow, timestamp_folder) -> 'Future[WindowResult]':
+        frame = np.ascontiguousarray(captured_window.get_cv2_image())
+        with self._lock:
+            segment = self._segment_for(captured_window.window_name, frame.nbytes)
+            np.ndarray(frame.shape, dtype=np.uint8, buffer=segment.buf)[:] = frame
+
+            executor = self._executors[self._worker_for(captured_window.window_name)]
+            future = executor.submit(_process_in_worker, segment.name, frame.shape, captured_window.filename,
+                                     captured_window.window_name, timestamp_folder)
+            self._submitted += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future):
+        if not future.cancelled() and future.exception() is None:
+            with self._lock:
+                self._completed += 1
+
+    def _worker_for(self, window_name: str) -> int:
+        # Callers hold self._lock
+        worker = self._assignments.get(window_name)
+        if worker is None:
+            loads = [0] * self.workers
+            for assigned in self._assignments.values():
+                loads[assigned] += 1
+            worker = loads.index(min(loads))
+            self._assignments[window_name] = worker
+        return worker
+
+    def _segment_for(self, window_name: str, size: int) -> shared_memory.SharedMemory:
+        # Callers hold self._lock
+        segment = self._segments.get(window_name)
+        if segment is not None and segment.size >= size:
+            return segment
+
+        if segment is not None:
+            # The window was resized: its worker must drop the old mapping before it is unlinked. Waiting
+            # here would block the executor callbacks that take self._lock, so unlink once the forget is done
+            old_segment = segment
+            forgotten = self._executors[self._worker_for(window_name)].submit(_forget_in_worker, window_name,
+                                                                              old_segment.name)
+            forgotten.add_done_callback(lambda _: self._release(old_segment))
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        self._segments[window_name] = segment
+        return segment
+
+    def forget_window(self, window_name: str):
+        """Drop the region state and shared segment of a closed window."""
+        forgotten = None
+        with self._lock:
+            worker = self._assignments.pop(window_name, None)
+            segment = self._segments.pop(window_name, None)
+            if worker is not None:
+                # Queued behind the window's pending frames on its single-process worker
+                forgotten = self._executors[worker].submit(_forget_in_worker, window_name,
+                                                           segment.name if segment else None)
+        if forgotten is not None:
+            forgotten.result()
+        if segment is not None:
+            self._release(segment)
+
+    @staticmethod
+    def _release(segment: shared_memory.SharedMemory):
+        segment.close()
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+    def get_stats(self) -> WindowProcessPoolStats:
+        with self._lock:
+            return WindowProcessPoolStats(
+                workers=self.workers,
+                windows=len(self._assignments),
+                submitted=self._submitted,
+                completed=self._completed,
+                shared_bytes=sum(segment.size for segment in self._segments.values())
+            )
+
+    def shutdown(self):
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        with self._lock:
+            for segment in self._segments.values():
+                self._release(segment)
+            self._segments.clear()
+        logger.info(f"🧮 Window process pool stopped: {self.get_stats()}")
@@ -0,0 +1,236 @@
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+Rect = Tuple[int, int, int, int]
+
+# Windows smaller than this in either dimension are never poker tables
+MIN_WINDOW_SIZE = 50
+
+
+class WindowProvider(ABC):
+    """Raw window queries the registry is built on; one call per Win32 API."""
+
+    @abstractmethod
+    def list_handles(self) -> List[int]:
+        pass
+
+    @abstractmethod
+    def is_shown(self, hwnd: int) -> bool:
+        """Visible and not minimized."""
+        pass
+
+    @abstractmethod
+    def get_title(self, hwnd: int) -> str:
+        pass
+
+    @abstractmethod
+    def get_rect(self, hwnd: int) -> Rect:
+        pass
+
+    @abstractmethod
+    def get_pid(self, hwnd: int) -> int:
+        pass
+
+    @abstractmethod
+    def get_process_name(self, pid: int) -> str:
+        pass
+
+
+class Win32WindowProvider(WindowProvider):
+
+    def list_handles(self) -> List[int]:
+        import win32gui
+
+        handles = []
+        win32gui.EnumWindows(lambda hwnd, results: results.append(hwnd) or True, handles)
+        return handles
+
+    def is_shown(self, hwnd: int) -> bool:
+        import win32gui
+        return bool(win32gui.IsWindowVisible(hwnd)) and not win32gui.IsIconic(hwnd)
+
+    def get_title(self, hwnd: int) -> str:
+        import win32gui
+        return win32gui.GetWindowText(hwnd)
+
+    def get_rect(self, hwnd: int) -> Rect:
+        import win32gui
+        return win32gui.GetWindowRect(hwnd)
+
+    def get_pid(self, hwnd: int) -> int:
+        import win32process
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        return pid
+
+    def get_process_name(self, pid: int) -> str:
+        import psutil
+        return psutil.Process(pid).name()
+
+
+class InMemoryWindowProvider(WindowProvider):
+    """Windows set by the caller; counts process lookups and rect reads so tests can see the cache work."""
+
+    def __init__(self):
+        self.windows: Dict[int, Dict] = {}
+        self.process_lookups = 0
+        self.rect_reads = 0
+
+    def add_window(self, hwnd: int, title: str, rect: Rect, pid: int = 1, process: str = "memory",
+                   shown: bool = True):
+        self.windows[hwnd] = {'title': title, 'rect': rect, 'pid': pid, 'process': process, 'shown': shown}
+
+    def update_window(self, hwnd: int, **changes):
+        self.windows[hwnd].update(changes)
+
+    def remove_window(self, hwnd: int):
+        self.windows.pop(hwnd, None)
+
+    def list_handles(self) -> List[int]:
+        return list(self.windows)
+
+    def is_shown(self, hwnd: int) -> bool:
+        return self.windows[hwnd]['shown']
+
+    def get_title(self, hwnd: int) -> str:
+        return self.windows[hwnd]['title']
+
+    def get_rect(self, hwnd: int) -> Rect:
+        self.rect_reads += 1
+        return self.windows[hwnd]['rect']
+
+    def get_pid(self, hwnd: int) -> int:
+        return self.windows[hwnd]['pid']
+
+    def get_process_name(self, pid: int) -> str:
+        self.process_lookups += 1
+        for window in self.windows.values():
+            if window['pid'] == pid:
+                return window['process']
+        raise LookupError(pid)
+
+
+@dataclass
+class WindowRecord:
+    hwnd: int
+    pid: int
+    process: str
+    title: str = ""
+    rect: Rect = (0, 0, 0, 0)
+
+    def to_dict(self) -> Dict:
+        return {
+            'hwnd': self.hwnd,
+            'title': self.title,
+            'rect': self.rect,
+            'process': self.process,
+            'width': self.rect[2] - self.rect[0],
+            'height': self.rect[3] - self.rect[1]
+        }
+
+
+@dataclass
+class WindowRegistryStats:
+    refreshes: int
+    windows: int
+    added: int
+    removed: int
+    process_lookups: int
+
+
+class WindowRegistry:
+    """
+    Cached hwnd -> process/title/rect map, refreshed incrementally.
+
+    A window's process never changes, so its pid and process name are looked up
+    once when the handle first appears (process names are also shared by pid)
+    and dropped when the handle disappears. Each refresh only re-reads the cheap
+    per-window state: visibility, title and, for titles of interest, the rect.
+    """
+
+    def __init__(self, provider: Optional[WindowProvider] = None):
+        self.provider = provider or Win32WindowProvider()
+        self._records: Dict[int, WindowRecord] = {}
+        self._process_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._refreshes = 0
+        self._added = 0
+        self._removed = 0
+        self._process_lookups = 0
+
+    def list_windows(self, title_filter: Optional[str] = None) -> List[Dict]:
+        """
+        Refresh and return the shown, titled, non-tiny windows in the dict format
+        of windows_utils.get_window_info; with ``title_filter`` only windows whose
+        title contains it.
+        """
+        with self._lock:
+            handles = self.provider.list_handles()
+            self._refreshes += 1
+
+            alive = set(handles)
+            for hwnd in [hwnd for hwnd in self._records if hwnd not in alive]:
+                self._forget(hwnd)
+
+            windows = []
+            for hwnd in handles:
+                try:
+                    if not self.provider.is_shown(hwnd):
+                        continue
+                    title = self.provider.get_title(hwnd)
+                    if not title or (title_filter is not None and title_filter not in title):
+                        continue
+
+                    record = self._records.get(hwnd)
+                    if record is None:
+                        record = self._register(hwnd)
+                    record.title = title
+                    record.rect = tuple(self.provider.get_rect(hwnd))
+                except Exception as e:
+                    # The window was destroyed between enumeration and the query
+                    logger.debug(f"Window {hwnd} vanished during refresh: {e}")
+                    self._forget(hwnd)
+                    continue
+
+                window = record.to_dict()
+                if window['width'] >= MIN_WINDOW_SIZE and window['height'] >= MIN_WINDOW_SIZE:
+                    windows.append(window)
+            return windows
+
+    def _register(self, hwnd: int) -> WindowRecord:
+        pid = self.provider.get_pid(hwnd)
+        process = self._process_names.get(pid)
+        if process is None:
+            self._process_lookups += 1
+            try:
+                process = self.provider.get_process_name(pid)
+            except Exception:
+                process = "unknown"
+            self._process_names[pid] = process
+
+        record = WindowRecord(hwnd=hwnd, pid=pid, process=process)
+        self._records[hwnd] = record
+        self._added += 1
+        return record
+
+    def _forget(self, hwnd: int):
+        record = self._records.pop(hwnd, None)
+        if record is None:
+            return
+        self._removed += 1
+        # A handle and a pid can be reused by the OS, so process names live only as long as their windows
+        if not any(other.pid == record.pid for other in self._records.values()):
+            self._process_names.pop(record.pid, None)
+
+    def get_stats(self) -> WindowRegistryStats:
+        with self._lock:
+            return WindowRegistryStats(
+                refreshes=self._refreshes,
+                windows=len(self._records),
+                added=self._added,
+                removed=self._removed,
+                process_lookups=self._process_lookups
+            )
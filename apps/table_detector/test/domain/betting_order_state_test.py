@@ -0,0 +1,120 @@
+import random
+import time
+import unittest
+
+from loguru import logger
+from pokerkit import PotLimitOmahaHoldem
+
+from shared.domain.moves import MoveType
+from shared.domain.position import Position
+from table_detector.domain.betting_order_state import BettingOrderState
+from table_detector.domain.omaha_engine import OmahaEngine, OmahaEngineException
+
+ACTIONS = [MoveType.FOLD, MoveType.CHECK, MoveType.CALL, MoveType.BET, MoveType.RAISE]
+
+EP, MP, CO, BTN, SB, BB = (Position.EARLY_POSITION, Position.MIDDLE_POSITION, Position.CUTOFF,
+                           Position.BUTTON, Position.SMALL_BLIND, Position.BIG_BLIND)
+F, C, R, X, B = MoveType.FOLD, MoveType.CALL, MoveType.RAISE, MoveType.CHECK, MoveType.BET
+
+# Typical detected hands: a raised pot played to the river and a blind-vs-blind limp
+BENCHMARK_HANDS = [
+    {EP: [F], MP: [C, C, X, F], CO: [R, B, X, C], BTN: [F], SB: [F], BB: [C, X, C, X, B]},
+    {EP: [F], MP: [F], CO: [F], BTN: [F], SB: [C, X, X, X], BB: [X, X, X, X]},
+]
+
+
+def _probe(state):
+    probe = [state.actor_index, state.street_index]
+    if state.actor_index is not None:
+        probe += [state.can_fold(), float(state.checking_or_calling_amount), state.can_complete_bet_or_raise_to()]
+        if state.can_complete_bet_or_raise_to():
+            probe.append(float(state.min_completion_betting_or_raising_to_amount))
+    return probe
+
+
+def _run_engine(backend, player_count, attempts):
+    """Apply (position, action) attempts until one fails; the moves and the error, if any."""
+    game = OmahaEngine(player_count, backend=backend)
+    error = None
+    for position, action in attempts:
+        try:
+            game.process_action(position, action)
+        except OmahaEngineException as e:
+            error = (type(e), str(e))
+            break
+        except KeyError:
+            # Pokerkit and the native state both report a finished hand by having no actor
+            error = (KeyError, None)
+            break
+    return game.get_moves_by_street(), error
+
+
+class TestBettingOrderState(unittest.TestCase):
+
+    def setUp(self):
+        logger.disable("table_detector.domain.omaha_engine")
+        self.addCleanup(logger.enable, "table_detector.domain.omaha_engine")
+
+    def test_matches_pokerkit_state_on_random_hands(self):
+        for seed in range(150):
+            rnd = random.Random(seed)
+            player_count = rnd.randint(2, 6)
+            stacks = [rnd.choice([0.5, 1, 1.5, 2, 3, 5, 8, 100]) for _ in range(player_count)]
+            expected = PotLimitOmahaHoldem.create_state(OmahaEngine.AUTOMATIONS, True, 0, (0.5, 1), 1, stacks,
+                                                        player_count)
+            actual = BettingOrderState((0.5, 1), 1, stacks, player_count)
+
+            while True:
+                with self.subTest(seed=seed):
+                    self.assertEqual(_probe(actual), _probe(expected))
+                if expected.actor_index is None:
+                    break
+                choices = ['call'] + (['fold'] if expected.can_fold() else []) + \
+                    (['raise'] if expected.can_complete_bet_or_raise_to() else [])
+                choice = rnd.choice(choices)
+                for state in (expected, actual):
+                    if choice == 'call':
+                        state.check_or_call()
+                    elif choice == 'fold':
+                        state.fold()
+                    else:
+                        state.complete_bet_or_raise_to(state.min_completion_betting_or_raising_to_amount)
+
+    def test_engine_backends_agree_on_random_action_sequences(self):
+        for seed in range(150):
+            rnd = random.Random(seed)
+            player_count = rnd.randint(2, 6)
+            positions = OmahaEngine.POSITION_ORDERS[player_count]
+            attempts = []
+            game = OmahaEngine(player_count, backend=OmahaEngine.NATIVE_BACKEND)
+            for _ in range(25):
+                # Mostly the right actor, sometimes a wrong one to hit the sequence errors
+                position = rnd.choice(positions) if rnd.random() < 0.1 or game.poker_state.actor_index is None \
+                    else game.get_current_position()
+                attempts.append((position, rnd.choice(ACTIONS)))
+                try:
+                    game.process_action(*attempts[-1])
+                except (OmahaEngineException, KeyError):
+                    break
+
+            with self.subTest(seed=seed):
+                self.assertEqual(_run_engine(OmahaEngine.NATIVE_BACKEND, player_count, attempts),
+                                 _run_engine(OmahaEngine.POKERKIT_BACKEND, player_count, attempts))
+
+    def test_benchmark_backends(self):
+        rounds = 50
+        timings = {}
+        for backend in (OmahaEngine.POKERKIT_BACKEND, OmahaEngine.NATIVE_BACKEND):
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                for hand in BENCHMARK_HANDS:
+                    game = OmahaEngine(len(hand), backend=backend)
+                    game.simulate_all_moves({position: list(moves) for position, moves in hand.items()})
+            timings[backend] = (time.perf_counter() - start_time) * 1e6 / (rounds * len(BENCHMARK_HANDS))
+
+        print(f"OmahaEngine per hand: pokerkit {timings['pokerkit']:.0f}us, native {timings['native']:.0f}us")
+        self.assertLess(timings['native'], timings['pokerkit'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+
+from shared.domain.hand_evaluator import (
+    CATEGORY_SHIFT, HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH,
+    best_omaha_scores, encode_card, encode_cards, evaluate_5
+)
+
+# Number of 5-card hands of each category among all C(52, 5)
+CATEGORY_COUNTS = {
+    HIGH_CARD: 1302540, PAIR: 1098240, TWO_PAIR: 123552, TRIPS: 54912, STRAIGHT: 10200,
+    FLUSH: 5108, FULL_HOUSE: 3744, QUADS: 624, STRAIGHT_FLUSH: 40
+}
+
+
+def _score(*names):
+    return int(evaluate_5(np.array(encode_cards(names))))
+
+
+class TestHandEvaluator(unittest.TestCase):
+
+    def test_every_hand_gets_its_category(self):
+        scores = evaluate_5(np.array(list(combinations(range(52), 5)), dtype=np.int8))
+
+        self.assertEqual(Counter((scores >> CATEGORY_SHIFT).tolist()), CATEGORY_COUNTS)
+        # Distinct hand values of 5-card poker
+        self.assertEqual(len(np.unique(scores)), 7462)
+
+    def test_hand_order(self):
+        ordered = [
+            ('AS', 'KD', 'QH', 'JC', '9S'),
+            ('2S', '2D', '3H', '4C', '5S'),
+            ('2S', '2D', 'AH', 'KC', 'QS'),
+            ('3S', '3D', '2H', '2C', '4S'),
+            ('KS', 'KD', '2H', '2C', '4S'),
+            ('AS', 'AD', '2H', '2C', '3S'),
+            ('2S', '2D', '2H', 'AC', 'KS'),
+            ('AS', '2D', '3H', '4C', '5S'),
+            ('6S', '2D', '3H', '4C', '5S'),
+            ('AS', 'KD', 'QH', 'JC', 'TS'),
+            ('2H', '3H', '4H', '5H', '7H'),
+            ('2S', '2D', '2H', 'AC', 'AS'),
+            ('3S', '3D', '3H', '2C', '2S'),
+            ('2S', '2D', '2H', '2C', 'AS'),
+            ('AH', '2H', '3H', '4H', '5H'),
+            ('AH', 'KH', 'QH', 'JH', 'TH'),
+        ]
+        scores = [_score(*hand) for hand in ordered]
+
+        self.assertEqual(scores, sorted(scores))
+        self.assertEqual(len(set(scores)), len(scores))
+        self.assertEqual(_score('AS', 'KD', 'QH', 'JC', '9S'), _score('AD', 'KS', 'QC', 'JH', '9D'))
+
+    def test_omaha_plays_two_hole_cards(self):
+        # Four hearts in hand and one on the board: no flush; one ace in hand makes no straight on KQJT
+        hole_cards = np.array(encode_cards(['AH', 'KH', '7H', '6H']))
+        board = np.array(encode_cards(['QS', 'JD', 'TC', '2H', '2S']))
+
+        score = int(best_omaha_scores(hole_cards, board))
+        self.assertEqual(score >> CATEGORY_SHIFT, STRAIGHT)
+        self.assertEqual(int(best_omaha_scores(np.array(encode_cards(['AH', '7H', '6C', '5D'])), board))
+                         >> CATEGORY_SHIFT, PAIR)
+
+    def test_best_omaha_scores_broadcast(self):
+        rng = np.random.default_rng(0)
+        cards = rng.permuted(np.tile(np.arange(52), (50, 1)), axis=1)
+        hole_cards = cards[:, :12].reshape(50, 3, 4)
+        boards = cards[:, 12:17]
+
+        batched = best_omaha_scores(hole_cards, boards[:, None, :])
+        for trial in range(50):
+            for player in range(3):
+                best = max(int(evaluate_5(np.array(pair + triple)))
+                           for pair in combinations(hole_cards[trial, player].tolist(), 2)
+                           for triple in combinations(boards[trial].tolist(), 3))
+                self.assertEqual(batched[trial, player], best)
+
+    def test_encode_card(self):
+        self.assertEqual(encode_card('2C'), 0)
+        self.assertEqual(encode_card('AS'), 51)
+        self.assertEqual(encode_card('Jh'), encode_card('JH'))
+        self.assertRaises(ValueError, encode_card, 'XS')
+
+
+if __name__ == '__main__':
+    unittest.main()
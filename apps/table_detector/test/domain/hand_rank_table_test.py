@@ -0,0 +1,61 @@
+import time
+import unittest
+
+import numpy as np
+
+from shared.domain.hand_evaluator import encode_cards, evaluate_5
+from table_detector.domain.hand_rank_table import (
+    HAND_CLASS_COUNT, HAND_COUNT, HandRankTable, all_hands, build_rank_table, hand_indices
+)
+
+
+class TestHandRankTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = HandRankTable.load()
+        cls.hands = all_hands()
+
+    def test_table_is_memory_mapped(self):
+        self.assertIsInstance(self.table.table, np.memmap)
+        self.assertEqual(self.table.table.shape, (HAND_COUNT,))
+
+    def test_shipped_table_matches_build(self):
+        self.assertTrue(np.array_equal(self.table.table, build_rank_table()))
+
+    def test_every_hand_ranks_like_evaluator(self):
+        # Card order must not matter: rank every hand with its cards shuffled
+        shuffled = np.random.default_rng(0).permuted(self.hands, axis=1)
+        _, expected = np.unique(evaluate_5(self.hands), return_inverse=True)
+
+        ranks = self.table.rank_many(shuffled)
+        self.assertTrue(np.array_equal(ranks, expected.ravel()))
+        self.assertEqual(int(ranks.max()), HAND_CLASS_COUNT - 1)
+
+    def test_indices_are_a_perfect_hash(self):
+        indices = hand_indices(self.hands)
+
+        self.assertTrue(np.array_equal(np.sort(indices), np.arange(HAND_COUNT)))
+
+    def test_rank_many_keeps_leading_shape(self):
+        hands = np.array([[encode_cards(['AH', 'KH', 'QH', 'JH', 'TH']), encode_cards(['7S', '5D', '4C', '3H', '2S'])]])
+
+        ranks = self.table.rank_many(hands)
+        self.assertEqual(ranks.shape, (1, 2))
+        self.assertEqual(ranks.tolist(), [[HAND_CLASS_COUNT - 1, 0]])
+
+    def test_benchmark_throughput(self):
+        hands = np.random.default_rng(1).permuted(np.tile(np.arange(52), (200000, 1)), axis=1)[:, :5]
+
+        timings = {}
+        for name, rank_hands in (('table', self.table.rank_many), ('evaluator', evaluate_5)):
+            start_time = time.perf_counter()
+            for _ in range(5):
+                rank_hands(hands)
+            timings[name] = 5 * len(hands) / (time.perf_counter() - start_time) / 1e6
+
+        print(f"5-card ranking: table {timings['table']:.1f}M hands/s, evaluator {timings['evaluator']:.1f}M hands/s")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,15 +1,21 @@
+import os
 import unittest
+from unittest import mock
 
 from shared.domain.moves import MoveType
-from table_detector.domain.omaha_engine import OmahaEngine, InvalidPositionSequenceError
+from table_detector.domain.omaha_engine import OmahaEngine, InvalidPositionSequenceError, WrongPlayerAmount
 from shared.domain.position import Position
 from shared.domain.street import Street
 
 
 class TestOmahaEngine(unittest.TestCase):
+    BACKEND = OmahaEngine.POKERKIT_BACKEND
     
     def setUp(self):
         """Set up test fixtures before each test method."""
+        backend_patch = mock.patch.dict(os.environ, {'OMAHA_ENGINE_BACKEND': self.BACKEND})
+        backend_patch.start()
+        self.addCleanup(backend_patch.stop)
         self.default_positions = [
             Position.SMALL_BLIND,
             Position.BIG_BLIND,
@@ -24,7 +30,7 @@ class TestOmahaEngine(unittest.TestCase):
     
     def test_constructor_single_player_raises_error(self):
         """Test that game initialization fails with only one player"""
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaises(WrongPlayerAmount) as context:
             OmahaEngine(1)
         
         self.assertIn("Need at least 2 players", str(context.exception))
@@ -566,3 +572,7 @@ class TestOmahaEngine(unittest.TestCase):
         actual_moves = game.get_moves_by_street()
         self.assertEqual(actual_moves, expected_moves)
 
+
+class TestOmahaEngineNativeBackend(TestOmahaEngine):
+    """The same suite against the native betting-order backend."""
+    BACKEND = OmahaEngine.NATIVE_BACKEND
@@ -0,0 +1,76 @@
+import unittest
+
+from shared.domain.moves import MoveType
+from shared.domain.position import Position
+from shared.domain.street import Street
+from table_detector.domain.omaha_engine import OmahaEngine, InvalidPositionSequenceError
+from table_detector.domain.omaha_session import OmahaSession
+
+EP, MP, CO, BTN, SB, BB = (Position.EARLY_POSITION, Position.MIDDLE_POSITION, Position.CUTOFF,
+                           Position.BUTTON, Position.SMALL_BLIND, Position.BIG_BLIND)
+F, C, R, X, B = MoveType.FOLD, MoveType.CALL, MoveType.RAISE, MoveType.CHECK, MoveType.BET
+
+# The actions detected on successive cycles of one hand
+HAND_CYCLES = [
+    {EP: [F], MP: [F], CO: [R], BTN: [], SB: [], BB: []},
+    {EP: [F], MP: [F], CO: [R], BTN: [F], SB: [F], BB: [C]},
+    {EP: [F], MP: [F], CO: [R, B], BTN: [F], SB: [F], BB: [C, X, C]},
+    {EP: [F], MP: [F], CO: [R, B, X], BTN: [F], SB: [F], BB: [C, X, C, X]},
+]
+
+
+def _replay(position_actions):
+    game = OmahaEngine(len(position_actions))
+    game.simulate_all_moves({position: list(moves) for position, moves in position_actions.items()})
+    return game.get_moves_by_street()
+
+
+class TestOmahaSession(unittest.TestCase):
+
+    def test_growing_actions_match_full_replay(self):
+        session = OmahaSession()
+
+        for actions in HAND_CYCLES:
+            self.assertEqual(session.simulate(actions, hand='hand-1'), _replay(actions))
+
+        self.assertEqual((session.replays, session.extensions), (1, 3))
+        self.assertEqual(HAND_CYCLES[0][CO], [R])
+
+    def test_returned_moves_are_not_changed_by_later_cycles(self):
+        session = OmahaSession()
+        first = session.simulate(HAND_CYCLES[0])
+        session.simulate(HAND_CYCLES[2])
+
+        self.assertEqual(first[Street.PREFLOP], [(EP, F), (MP, F), (CO, R)])
+        self.assertEqual(first[Street.FLOP], [])
+
+    def test_unchanged_actions_reuse_result(self):
+        session = OmahaSession()
+        session.simulate(HAND_CYCLES[1])
+
+        self.assertEqual(session.simulate(HAND_CYCLES[1]), _replay(HAND_CYCLES[1]))
+        self.assertEqual((session.replays, session.reuses), (1, 1))
+
+    def test_new_hand_or_flicker_replays_from_scratch(self):
+        session = OmahaSession()
+        session.simulate(HAND_CYCLES[2], hand='hand-1')
+        # An action that was detected before is gone: not an extension
+        self.assertEqual(session.simulate(HAND_CYCLES[1], hand='hand-1'), _replay(HAND_CYCLES[1]))
+        self.assertEqual(session.simulate(HAND_CYCLES[2], hand='hand-2'), _replay(HAND_CYCLES[2]))
+
+        self.assertEqual((session.replays, session.extensions), (3, 0))
+
+    def test_failed_delta_raises_like_full_replay_and_recovers(self):
+        session = OmahaSession()
+        session.simulate(HAND_CYCLES[0])
+        # SB acted while BTN, who is first to act, has no move
+        broken = {EP: [F], MP: [F], CO: [R], BTN: [], SB: [F], BB: []}
+
+        for _ in range(2):
+            with self.assertRaises(InvalidPositionSequenceError):
+                session.simulate(broken)
+        self.assertEqual(session.simulate(HAND_CYCLES[1]), _replay(HAND_CYCLES[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
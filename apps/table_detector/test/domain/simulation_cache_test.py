@@ -0,0 +1,85 @@
+import unittest
+
+from shared.domain.moves import MoveType
+from shared.domain.position import Position
+from table_detector.domain.omaha_engine import OmahaEngine, InvalidActionError, InvalidPositionSequenceError
+from table_detector.domain.omaha_session import OmahaSession
+from table_detector.domain.simulation_cache import SimulationCache
+
+EP, MP, CO, BTN, SB, BB = (Position.EARLY_POSITION, Position.MIDDLE_POSITION, Position.CUTOFF,
+                           Position.BUTTON, Position.SMALL_BLIND, Position.BIG_BLIND)
+F, C, R, X, B = MoveType.FOLD, MoveType.CALL, MoveType.RAISE, MoveType.CHECK, MoveType.BET
+
+HAND = {EP: [F], MP: [F], CO: [R, B], BTN: [F], SB: [F], BB: [C, X, C]}
+# BB can't fold to a limp: checking is free
+INVALID_ACTION = {EP: [F], MP: [F], CO: [C], BTN: [F], SB: [F], BB: [F]}
+# BTN acts before EP ever did
+WRONG_ORDER = {EP: [], MP: [], CO: [], BTN: [F], SB: [], BB: []}
+
+
+def _replay(position_actions):
+    game = OmahaEngine(len(position_actions))
+    game.simulate_all_moves({position: list(moves) for position, moves in position_actions.items()})
+    return game.get_moves_by_street()
+
+
+class TestSimulationCache(unittest.TestCase):
+
+    def test_hit_returns_same_moves_as_fresh_engine(self):
+        cache = SimulationCache()
+
+        first = cache.simulate(HAND)
+        second = cache.simulate(dict(reversed(list(HAND.items()))))
+
+        self.assertEqual(first, _replay(HAND))
+        self.assertEqual(second, first)
+        self.assertEqual(HAND[CO], [R, B])
+        stats = cache.get_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_returned_moves_are_copies(self):
+        cache = SimulationCache()
+        cache.simulate(HAND)[next(iter(_replay(HAND)))].clear()
+
+        self.assertEqual(cache.simulate(HAND), _replay(HAND))
+
+    def test_cached_failure_raises_same_error(self):
+        cache = SimulationCache()
+        with self.assertRaises(InvalidActionError) as fresh:
+            cache.simulate(INVALID_ACTION)
+        with self.assertRaises(InvalidActionError) as cached:
+            cache.simulate(INVALID_ACTION)
+
+        self.assertIsNot(cached.exception, fresh.exception)
+        self.assertEqual(str(cached.exception), str(fresh.exception))
+        self.assertEqual((cached.exception.position, cached.exception.action), (BB, F))
+        self.assertRaises(InvalidPositionSequenceError, cache.simulate, WRONG_ORDER)
+        self.assertEqual(cache.get_stats().failure_hits, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = SimulationCache(max_entries=2)
+        cache.simulate(HAND)
+        cache.simulate({EP: [F], MP: [F], CO: [F], BTN: [F], SB: [F], BB: []})
+        cache.simulate(HAND)
+        cache.simulate({EP: [R], MP: [], CO: [], BTN: [], SB: [], BB: []})
+
+        self.assertEqual(cache.get(HAND)[0], True)
+        self.assertEqual(cache.get({EP: [F], MP: [F], CO: [F], BTN: [F], SB: [F], BB: []})[0], False)
+        self.assertEqual(cache.get_stats().evictions, 1)
+
+    def test_sessions_share_results(self):
+        cache = SimulationCache()
+        OmahaSession(cache).simulate(HAND, hand='table-1')
+        session = OmahaSession(cache)
+
+        self.assertEqual(session.simulate(HAND, hand='table-2'), _replay(HAND))
+        self.assertEqual(session.replays, 0)
+        # No engine behind a cached result: growing actions replay the hand
+        grown = {**HAND, CO: [R, B, X], BB: [C, X, C, X]}
+        self.assertEqual(session.simulate(grown, hand='table-2'), _replay(grown))
+        self.assertEqual(session.replays, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
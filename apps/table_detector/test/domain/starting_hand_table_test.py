@@ -0,0 +1,58 @@
+import time
+import unittest
+
+import numpy as np
+
+from table_detector.domain.starting_hand_table import (
+    CANONICAL_CLASS_COUNT, STARTING_HAND_COUNT, StartingHandTable, build_classes
+)
+
+
+class TestStartingHandTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = StartingHandTable.load()
+
+    def test_classes_match_build(self):
+        hand_classes, representatives = build_classes()
+
+        self.assertEqual(len(representatives), CANONICAL_CLASS_COUNT)
+        self.assertTrue(np.array_equal(self.table.hand_classes, hand_classes))
+        self.assertEqual(int(self.table.combos.sum()), STARTING_HAND_COUNT)
+
+    def test_suit_renamings_share_a_class(self):
+        double_suited = self.table.lookup(['AS', 'AH', 'KS', 'KH'])
+
+        self.assertEqual(self.table.lookup(['Kd', 'AC', 'KC', 'AD']).class_id, double_suited.class_id)
+        self.assertNotEqual(self.table.lookup(['AS', 'AH', 'KH', 'KS']).class_id,
+                            self.table.lookup(['AS', 'AH', 'KD', 'KC']).class_id)
+        self.assertEqual(double_suited.combos, 6)
+
+    def test_strength_order(self):
+        aces_kings = self.table.lookup(['AS', 'AH', 'KS', 'KH'])
+        connected = self.table.lookup(['JS', 'TH', '9S', '8H'])
+        trash = self.table.lookup(['2S', '2H', '2D', '7C'])
+
+        self.assertGreater(aces_kings.equity, connected.equity)
+        self.assertGreater(connected.equity, trash.equity)
+        self.assertLess(aces_kings.top_share, 0.01)
+        self.assertGreater(trash.top_share, 0.9)
+
+    def test_invalid_hands(self):
+        self.assertIsNone(self.table.lookup(['AS', 'AH', 'KS']))
+        self.assertIsNone(self.table.lookup(['AS', 'AS', 'KS', 'KH']))
+        self.assertIsNone(self.table.lookup(['AS', 'AH', 'KS', 'XX']))
+
+    def test_lookup_speed(self):
+        start_time = time.perf_counter()
+        for _ in range(1000):
+            self.table.lookup(['AS', 'AH', 'KS', 'KH'])
+        per_lookup_us = (time.perf_counter() - start_time) * 1000
+
+        print(f"Starting hand lookup: {per_lookup_us:.1f}us")
+        self.assertLess(per_lookup_us, 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import cv2
+import numpy as np
+
+from table_detector.services.artifact_writer import ArtifactWriter, DROP_NEWEST, DROP_OLDEST
+from table_detector.services.capture_backend import InMemoryCaptureBackend
+from table_detector.services.window_capture_service import capture_and_save_windows
+from table_detector.test.service.test_utils import load_image
+
+TABLE_TITLE = "Table 1 - 2.50/5 Pot Limit Omaha"
+
+
+class BlockedArtifactWriter(ArtifactWriter):
+    """Writer whose worker waits on an event, so the queue can be saturated deterministically."""
+
+    def __init__(self, *args, **kwargs):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _write(self, image, filepath):
+        self.started.set()
+        self.release.wait(5)
+        return super()._write(image, filepath)
+
+
+class TestArtifactWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.image = load_image("2.png")
+
+    def path(self, name):
+        return os.path.join(self.folder, "window", name)
+
+    def test_writes_lossless_png_in_background(self):
+        writer = ArtifactWriter(max_queue_size=4, compression=0)
+
+        self.assertTrue(writer.submit(self.image, self.path("a.png")))
+        self.assertTrue(writer.flush(5))
+        writer.close()
+
+        np.testing.assert_array_equal(cv2.imread(self.path("a.png")), self.image)
+        stats = writer.get_stats()
+        self.assertEqual((stats.submitted, stats.written, stats.dropped, stats.backlog), (1, 1, 0, 0))
+        self.assertGreater(stats.bytes_written, 0)
+
+    def test_drop_newest_when_saturated(self):
+        writer = BlockedArtifactWriter(max_queue_size=1, drop_policy=DROP_NEWEST)
+
+        writer.submit(self.image, self.path("in_flight.png"))
+        writer.started.wait(5)
+        self.assertTrue(writer.submit(self.image, self.path("queued.png")))
+        self.assertFalse(writer.submit(self.image, self.path("dropped.png")))
+
+        writer.release.set()
+        self.assertTrue(writer.flush(5))
+        writer.close()
+
+        self.assertEqual(sorted(os.listdir(os.path.join(self.folder, "window"))), ["in_flight.png", "queued.png"])
+        self.assertEqual(writer.get_stats().dropped, 1)
+        self.assertEqual(writer.get_stats().max_backlog, 1)
+
+    def test_drop_oldest_when_saturated(self):
+        writer = BlockedArtifactWriter(max_queue_size=1, drop_policy=DROP_OLDEST)
+
+        writer.submit(self.image, self.path("in_flight.png"))
+        writer.started.wait(5)
+        writer.submit(self.image, self.path("evicted.png"))
+        self.assertTrue(writer.submit(self.image, self.path("latest.png")))
+
+        writer.release.set()
+        self.assertTrue(writer.flush(5))
+        writer.close()
+
+        self.assertEqual(sorted(os.listdir(os.path.join(self.folder, "window"))), ["in_flight.png", "latest.png"])
+        self.assertEqual(writer.get_stats().dropped, 1)
+
+    def test_flush_waits_for_items_written_before_submit_returns(self):
+        writer = ArtifactWriter(max_queue_size=4)
+        tiny_image = np.zeros((2, 2, 3), dtype=np.uint8)
+        for index in range(100):
+            writer.submit(tiny_image, self.path(f"{index}.png"))
+            self.assertGreaterEqual(writer._pending, 0)
+            self.assertTrue(writer.flush(5))
+            self.assertEqual(writer.get_stats().written, index + 1)
+        writer.close()
+
+        self.assertEqual(writer._pending, 0)
+
+    def test_capture_and_save_windows_queues_screenshots(self):
+        backend = InMemoryCaptureBackend({TABLE_TITLE: self.image})
+        backend.fullscreen = self.image
+        writer = ArtifactWriter()
+
+        captured = capture_and_save_windows(self.folder, save_windows=True, backend=backend, writer=writer)
+        writer.close()
+
+        self.assertEqual(writer.get_stats().written, 2)
+        self.assertTrue(os.path.exists(os.path.join(self.folder, "full_screen.png")))
+        self.assertTrue(os.path.exists(os.path.join(self.folder, captured[0].window_name, captured[0].filename)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from shared.domain.detected_bid import DetectedBid
+from table_detector.services import bid_detection_service
+from table_detector.services.bid_cache import BidCache
+from table_detector.services.bid_detection_service import detect_bids
+from table_detector.services.bid_digit_recognizer import BidDigitRecognizer
+from table_detector.services.bid_ocr_engine import BidOcrEngine, set_bid_ocr_engine
+
+BIDS_FOLDER = os.path.join(os.path.dirname(__file__), '..', 'resources', 'detection', 'bids')
+
+
+class CountingOcrEngine(BidOcrEngine):
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def read_words(self, image: np.ndarray):
+        self.calls += 1
+        return []
+
+
+def _bid(position: int, amount: str) -> DetectedBid:
+    return DetectedBid(position, amount, (0, 0, 10, 10), (5, 5))
+
+
+class TestBidCache(unittest.TestCase):
+
+    def tearDown(self):
+        set_bid_ocr_engine(None)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = BidCache(max_entries=2)
+        cache.put(1, b'a', _bid(1, '0.5'))
+        cache.put(2, b'b', None)
+        cache.get(1, b'a')
+        cache.put(3, b'c', _bid(3, '1.0'))
+
+        self.assertEqual(cache.get(2, b'b'), (False, None))
+        self.assertEqual(cache.get(1, b'a')[1].amount_text, '0.5')
+        stats = cache.get_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.entries), (2, 1, 1, 2))
+
+    def test_empty_seats_are_cached(self):
+        cache = BidCache()
+        cache.put(4, b'empty', None)
+
+        self.assertEqual(cache.get(4, b'empty'), (True, None))
+
+    def test_hand_change_invalidates(self):
+        cache = BidCache()
+        self.assertTrue(cache.update_hand(('As', 'Kd', 'Qh', 'Jc')))
+        cache.put(1, b'a', _bid(1, '0.5'))
+
+        self.assertFalse(cache.update_hand(('As', 'Kd', 'Qh', 'Jc')))
+        self.assertTrue(cache.get(1, b'a')[0])
+        self.assertTrue(cache.update_hand(('2s', '3d', '4h', '5c')))
+        self.assertFalse(cache.get(1, b'a')[0])
+
+    def test_cached_seats_are_not_read_again(self):
+        engine = CountingOcrEngine()
+        set_bid_ocr_engine(engine)
+        image = cv2.imread(os.path.join(BIDS_FOLDER, "4_move.png"))
+        cache = BidCache()
+
+        # The shipped templates lack some digits; read the fixture's 0, 1, 3 and 5 with them anyway
+        with mock.patch.object(bid_detection_service, 'get_bid_digit_recognizer',
+                               return_value=BidDigitRecognizer.load(allow_partial=True)):
+            first = detect_bids(image, recognizer='template', cache=cache)
+            second = detect_bids(image, recognizer='template', cache=cache)
+
+        self.assertEqual({p: b.amount_text for p, b in first.items()}, {1: '1.0', 4: '3.5', 6: '0.5'})
+        self.assertEqual({p: b.amount_text for p, b in second.items()}, {1: '1.0', 4: '3.5', 6: '0.5'})
+        self.assertEqual(cache.get_stats().hits, 6)
+
+        # OCR results are cached the same way
+        cache.invalidate()
+        detect_bids(image, batched=True, recognizer='ocr', cache=cache)
+        detect_bids(image, batched=True, recognizer='ocr', cache=cache)
+        self.assertEqual(engine.calls, 1)
+
+    def test_failed_per_seat_ocr_is_not_cached(self):
+        image = cv2.imread(os.path.join(BIDS_FOLDER, "4_move.png"))
+        cache = BidCache()
+
+        with mock.patch.object(bid_detection_service.pytesseract, 'image_to_data',
+                               side_effect=RuntimeError("tesseract crashed")):
+            bids = detect_bids(image, batched=False, recognizer='ocr', cache=cache)
+
+        self.assertEqual(bids, {})
+        self.assertEqual(cache.get_stats().entries, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
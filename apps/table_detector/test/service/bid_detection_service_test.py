@@ -0,0 +1,112 @@
+import os
+import shutil
+import time
+import unittest
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from table_detector.services import bid_detection_service
+from table_detector.services.bid_detection_service import PLAYER_BID_POSITIONS, TILE_MARGIN, \
+    _compose_bid_tiles, _preprocess_bid_region, detect_bids
+from table_detector.services.bid_ocr_engine import BidOcrEngine, set_bid_ocr_engine
+
+BIDS_FOLDER = os.path.join(os.path.dirname(__file__), '..', 'resources', 'detection', 'bids')
+
+
+class ScriptedOcrEngine(BidOcrEngine):
+    """Answers with words placed on the tiles of the given positions."""
+
+    name = "scripted"
+
+    def __init__(self, texts: Dict[int, List[str]]):
+        self.texts = texts
+        self.calls = 0
+
+    def read_words(self, image: np.ndarray) -> List[Dict]:
+        self.calls += 1
+        regions = {position: _preprocess_bid_region(np.zeros((h, w, 3), dtype=np.uint8))
+                   for position, (x, y, w, h) in PLAYER_BID_POSITIONS.items()}
+        _, tile_rows = _compose_bid_tiles(regions)
+
+        words = []
+        for position, texts in self.texts.items():
+            top = tile_rows[position][0] + TILE_MARGIN // 2 + 10
+            left = TILE_MARGIN
+            for text in texts:
+                words.append({'text': text, 'conf': 90, 'left': left, 'top': top, 'width': 50, 'height': 90})
+                left += 60
+        words.append({'text': '', 'conf': -1, 'left': 0, 'top': 0, 'width': image.shape[1], 'height': 10})
+        return words
+
+
+class TestBatchedBidDetection(unittest.TestCase):
+
+    def tearDown(self):
+        set_bid_ocr_engine(None)
+
+    def test_one_ocr_call_maps_words_back_to_seats(self):
+        engine = ScriptedOcrEngine({2: ['0.5'], 4: ['3.5'], 6: ['1.0']})
+        set_bid_ocr_engine(engine)
+        image = np.zeros((584, 784, 3), dtype=np.uint8)
+
+        bids = detect_bids(image, batched=True, recognizer='ocr')
+
+        self.assertEqual(engine.calls, 1)
+        self.assertEqual({position: bid.amount_text for position, bid in bids.items()}, {2: '0.5', 4: '3.5', 6: '1.0'})
+        self.assertEqual(bids[2].bounding_rect, PLAYER_BID_POSITIONS[2])
+        self.assertEqual(bids[2].center, (220, 317))
+
+    def test_tiles_do_not_overlap(self):
+        regions = {position: np.zeros((h * 8, w * 8), dtype=np.uint8)
+                   for position, (x, y, w, h) in PLAYER_BID_POSITIONS.items()}
+
+        composite, tile_rows = _compose_bid_tiles(regions)
+
+        rows = sorted(tile_rows.values())
+        for (_, bottom), (top, _) in zip(rows, rows[1:]):
+            self.assertLessEqual(bottom, top)
+        self.assertEqual(composite.shape[1], 45 * 8 + 2 * TILE_MARGIN)
+        # Seat pixels land inside their own tile
+        self.assertEqual(composite[TILE_MARGIN, TILE_MARGIN], 0)
+        self.assertEqual(composite[0, 0], 255)
+
+    def test_ocr_failure_detects_no_bids(self):
+        class FailingEngine(BidOcrEngine):
+            def read_words(self, image):
+                raise RuntimeError("tesseract is not installed")
+
+        self.assertEqual(bid_detection_service._extract_bid_texts_batched(
+            {1: np.zeros((120, 320), dtype=np.uint8)}, FailingEngine()), {})
+
+
+def bid_summary(bids):
+    return {position: (bid.amount_text, bid.bounding_rect, bid.center) for position, bid in bids.items()}
+
+
+@unittest.skipIf(shutil.which('tesseract') is None, "tesseract is not installed")
+class TestBatchedBidFixtures(unittest.TestCase):
+
+    def test_batched_matches_per_seat_ocr(self):
+        mismatches = []
+        for filename in sorted(os.listdir(BIDS_FOLDER)):
+            image = cv2.imread(os.path.join(BIDS_FOLDER, filename))
+
+            start_time = time.perf_counter()
+            per_seat = detect_bids(image, batched=False, recognizer='ocr')
+            per_seat_ms = (time.perf_counter() - start_time) * 1000
+
+            start_time = time.perf_counter()
+            batched = detect_bids(image, batched=True, recognizer='ocr')
+            batched_ms = (time.perf_counter() - start_time) * 1000
+
+            print(f"{filename}: per seat {per_seat_ms:.1f}ms, batched {batched_ms:.1f}ms")
+            if bid_summary(batched) != bid_summary(per_seat):
+                mismatches.append((filename, bid_summary(per_seat), bid_summary(batched)))
+
+        self.assertEqual(mismatches, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
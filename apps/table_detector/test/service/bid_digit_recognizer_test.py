@@ -0,0 +1,126 @@
+import os
+import shutil
+import time
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from table_detector.services import bid_detection_service
+from table_detector.services.bid_detection_service import PLAYER_BID_POSITIONS, detect_bids
+from table_detector.services.bid_digit_recognizer import BidDigitRecognizer
+
+RESOURCES_FOLDER = os.path.join(os.path.dirname(__file__), '..', 'resources')
+BIDS_FOLDER = os.path.join(RESOURCES_FOLDER, 'detection', 'bids')
+
+# Bid text per fixture and seat, read off the screenshots; seats not listed show no bid
+EXPECTED_BIDS = {
+    '1_move': {1: '0.5', 2: '1.0'},
+    '2_move': {},
+    '3_move': {4: '0.5', 5: '1.0'},
+    '4_move': {1: '1.0', 4: '3.5', 6: '0.5'},
+    '5_move': {1: '1.0', 3: '3.5', 5: '3.5', 6: '0.5'},
+    '6_move': {3: '0.5', 4: '1.0'},
+    '7_bid': {5: '0.5', 6: '1.0'},
+    '8_bid': {5: '0.5', 6: '1.0'},
+    '9_bid': {2: '5.0'},
+}
+
+
+class TestBidDigitRecognizer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recognizer = BidDigitRecognizer.load()
+        # Classifies with the templates that exist, to measure them on the fixtures
+        cls.partial_recognizer = BidDigitRecognizer.load(allow_partial=True)
+        cls.tables = {name: cv2.imread(os.path.join(BIDS_FOLDER, f"{name}.png")) for name in EXPECTED_BIDS}
+
+    def test_reads_every_fixture_seat(self):
+        misread = []
+        start_time = time.perf_counter()
+        for name, image in self.tables.items():
+            for position, (x, y, w, h) in PLAYER_BID_POSITIONS.items():
+                text = self.partial_recognizer.read(image[y:y + h, x:x + w])
+                if text != EXPECTED_BIDS[name].get(position, ""):
+                    misread.append((name, position, text))
+        per_table_ms = (time.perf_counter() - start_time) * 1000 / len(self.tables)
+
+        print(f"Template bid reading: {per_table_ms:.2f}ms per table")
+        self.assertEqual(misread, [])
+        self.assertLess(per_table_ms, 20)
+
+    def test_detect_bids_sends_only_seats_showing_a_bid_to_ocr(self):
+        for name, image in self.tables.items():
+            ocr_positions = []
+
+            def fake_ocr(processed_regions, batched=None):
+                ocr_positions.extend(processed_regions)
+                return {position: EXPECTED_BIDS[name].get(position, "") for position in processed_regions}
+
+            with mock.patch.object(bid_detection_service, '_extract_bid_texts', side_effect=fake_ocr):
+                bids = detect_bids(image, batched=True, recognizer='template')
+
+            self.assertEqual({position: bid.amount_text for position, bid in bids.items()}, EXPECTED_BIDS[name])
+            self.assertEqual(sorted(ocr_positions), sorted(EXPECTED_BIDS[name]))
+
+    def test_detect_bids_defaults_to_ocr_for_every_seat(self):
+        image = self.tables['9_bid']
+        ocr_positions = []
+
+        def fake_ocr(processed_regions, batched=None):
+            ocr_positions.extend(processed_regions)
+            return {position: EXPECTED_BIDS['9_bid'].get(position, "") for position in processed_regions}
+
+        environment = {key: value for key, value in os.environ.items() if key != 'BID_RECOGNIZER'}
+        with mock.patch.dict(os.environ, environment, clear=True), \
+                mock.patch.object(bid_detection_service, '_extract_bid_texts', side_effect=fake_ocr):
+            bids = detect_bids(image)
+
+        self.assertEqual({position: bid.amount_text for position, bid in bids.items()}, {2: '5.0'})
+        self.assertEqual(sorted(ocr_positions), sorted(PLAYER_BID_POSITIONS))
+
+    def test_digit_without_template_is_left_unread(self):
+        x, y, w, h = PLAYER_BID_POSITIONS[2]
+        region = self.tables['9_bid'][y:y + h, x:x + w].copy()
+        # Close the lower-left loop of the 5 in "5.0": a 6, which has no template
+        region[9:11, 3] = 232
+        self.assertIsNone(self.recognizer.read(region))
+
+        # Real captures of digits without templates: 4.0, 7.0 and 18.1
+        for path, position in (("tables/_20250610_025342/04_unknown__2_50__5_Pot_Limit_Omaha.png", 5),
+                               ("detection/action/6.png", 3),
+                               ("tables/move_test.png", 3)):
+            image = cv2.imread(os.path.join(RESOURCES_FOLDER, path))
+            x, y, w, h = PLAYER_BID_POSITIONS[position]
+            self.assertIsNone(self.recognizer.read(image[y:y + h, x:x + w]), path)
+
+    @unittest.skipIf(shutil.which('tesseract') is None, "tesseract is not installed")
+    def test_templates_against_ocr(self):
+        timings = {}
+        for recognizer in ('template', 'ocr'):
+            start_time = time.perf_counter()
+            for image in self.tables.values():
+                detect_bids(image, recognizer=recognizer)
+            timings[recognizer] = (time.perf_counter() - start_time) * 1000 / len(self.tables)
+
+        print(f"Bid reading per table: templates {timings['template']:.1f}ms, OCR {timings['ocr']:.1f}ms")
+        self.assertLess(timings['template'], timings['ocr'])
+
+    def test_glyph_without_template_is_left_unread(self):
+        region = np.full((15, 40, 3), 60, dtype=np.uint8)
+        # A filled block: nothing like a digit of the bid font
+        region[4:12, 5:11] = 255
+
+        self.assertIsNone(self.partial_recognizer.read(region))
+
+    def test_chip_edge_at_border_is_ignored(self):
+        region = np.full((15, 40, 3), 60, dtype=np.uint8)
+        region[5:8, 0:2] = 255
+
+        self.assertEqual(self.recognizer.read(region), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
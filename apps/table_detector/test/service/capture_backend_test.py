@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from table_detector.domain.captured_window import CapturedWindow
+from table_detector.services.capture_backend import InMemoryCaptureBackend
+from table_detector.services.image_capture_service import ImageCaptureService
+from table_detector.services.poker_game_processor import PokerGameProcessor
+from table_detector.services.screenshot_archive import ScreenshotArchive
+from table_detector.services.window_capture_service import capture_and_save_windows
+from table_detector.test.service.test_utils import load_image
+
+TABLE_TITLE = "Table 1 - 2.50/5 Pot Limit Omaha"
+
+
+def to_bgrx(image: np.ndarray) -> np.ndarray:
+    return cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+
+
+class TestCapturedWindowFrame(unittest.TestCase):
+
+    def test_cv2_image_is_view_of_bgrx_buffer(self):
+        buffer = to_bgrx(load_image("2.png"))
+
+        window = CapturedWindow.from_frame(buffer, "t.png", "t")
+        cv2_image = window.get_cv2_image()
+
+        self.assertTrue(np.shares_memory(cv2_image, buffer))
+        self.assertFalse(cv2_image.flags.writeable)
+        self.assertEqual(window.get_size(), (784, 584))
+        np.testing.assert_array_equal(cv2_image, load_image("2.png"))
+
+    def test_save_writes_bgr_png(self):
+        image = load_image("2.png")
+        window = CapturedWindow.from_frame(to_bgrx(image), "t.png", "t")
+
+        filepath = os.path.join(tempfile.mkdtemp(), "t.png")
+        self.assertTrue(window.save(filepath))
+
+        np.testing.assert_array_equal(cv2.imread(filepath, cv2.IMREAD_UNCHANGED), image)
+
+    def test_frame_and_pil_windows_give_same_snapshot(self):
+        image = load_image("2.png")
+        frame_window = CapturedWindow.from_frame(to_bgrx(image), "t.png", "t")
+        pil_window = CapturedWindow(frame_window.image, "t.png", "t")
+
+        frame_snapshot = PokerGameProcessor.create_game_snapshot(frame_window.get_cv2_image())
+        pil_snapshot = PokerGameProcessor.create_game_snapshot(pil_window.get_cv2_image())
+
+        self.assertEqual([d.name for d in frame_snapshot.player_cards], [d.name for d in pil_snapshot.player_cards])
+        self.assertEqual(frame_snapshot.moves, pil_snapshot.moves)
+
+    def test_hash_changes_with_single_pixel(self):
+        buffer = to_bgrx(load_image("2.png"))
+        original_hash = CapturedWindow.from_frame(buffer.copy(), "t.png", "t").calculate_hash()
+
+        # Off the 5-row/7-column grid a strided sample would read
+        buffer[201, 303, 1] ^= 0xFF
+        changed_hash = CapturedWindow.from_frame(buffer, "t.png", "t").calculate_hash()
+
+        self.assertNotEqual(changed_hash, original_hash)
+        self.assertEqual(len(changed_hash), 16)
+
+
+class TestInMemoryCaptureBackend(unittest.TestCase):
+
+    def test_capture_and_save_windows(self):
+        image = load_image("2.png")
+        backend = InMemoryCaptureBackend({TABLE_TITLE: to_bgrx(image), "Lobby": to_bgrx(image)})
+        backend.fullscreen = image
+        folder = tempfile.mkdtemp()
+
+        captured = capture_and_save_windows(folder, save_windows=True, backend=backend)
+
+        self.assertEqual(len(captured), 1)
+        self.assertTrue(captured[0].has_frame)
+        self.assertTrue(os.path.exists(os.path.join(folder, "full_screen.png")))
+        self.assertTrue(os.path.exists(os.path.join(folder, captured[0].window_name, captured[0].filename)))
+
+    def test_image_capture_service_tracks_changes(self):
+        image = load_image("2.png")
+        backend = InMemoryCaptureBackend({TABLE_TITLE: to_bgrx(image)})
+        service = ImageCaptureService(capture_backend=backend)
+        service.debug_mode = False
+        folder = tempfile.mkdtemp()
+        service.archive = ScreenshotArchive(folder)
+
+        first = service.get_changed_images(folder)
+        unchanged = service.get_changed_images(folder)
+        backend.set_frame(TABLE_TITLE, to_bgrx(load_image("6.png")))
+        changed = service.get_changed_images(folder)
+        backend.remove_window(TABLE_TITLE)
+        removed = service.get_changed_images(folder)
+        service.close()
+
+        self.assertEqual(len(first.changed_images), 1)
+        self.assertEqual(unchanged.changed_images, [])
+        self.assertEqual(len(changed.changed_images), 1)
+        self.assertEqual(removed.removed_windows, [first.changed_images[0].window_name])
+
+    def test_filtered_windows_are_not_captured_or_removed(self):
+        image = load_image("2.png")
+        backend = InMemoryCaptureBackend({TABLE_TITLE: to_bgrx(image)})
+        service = ImageCaptureService(capture_backend=backend)
+        service.debug_mode = False
+        service.save_windows = False
+        folder = tempfile.mkdtemp()
+
+        first = service.get_changed_images(folder)
+        backend.set_frame(TABLE_TITLE, to_bgrx(load_image("6.png")))
+        skipped = service.get_changed_images(folder, window_filter=lambda name: False)
+        captured = service.get_changed_images(folder, window_filter=lambda name: True)
+        service.close()
+
+        self.assertEqual(len(first.changed_images), 1)
+        self.assertEqual((skipped.changed_images, skipped.removed_windows), ([], []))
+        self.assertEqual(len(captured.changed_images), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 
 from table_detector.test.service.test_utils import load_image
-from table_detector.utils.detect_utils import DetectUtils
+from table_detector.services.template_matcher_service import TemplateMatchService
+from table_detector.utils.detect_utils import DetectUtils, TABLE_CARD_SLOTS
 
 
 class TestDetectUtils(unittest.TestCase):
@@ -26,4 +27,16 @@ class TestDetectUtils(unittest.TestCase):
 
         detections = DetectUtils.get_player_actions_detection(cv2_image)[1]
 
-        print(detections)
\ No newline at end of file
+        print(detections)
+
+    def test_detect_table_cards_in_slots_matches_full_search(self):
+        for image_name in ("1.png", "6.png", "8.png", "2.png"):
+            cv2_image = load_image(image_name)
+
+            full_search = TemplateMatchService.find_table_cards(cv2_image)
+            in_slots = TemplateMatchService.find_table_cards_in_slots(cv2_image, TABLE_CARD_SLOTS)
+
+            self.assertEqual(
+                [(d.name, tuple(d.bounding_rect)) for d in full_search],
+                [(d.name, tuple(d.bounding_rect)) for d in in_slots]
+            )
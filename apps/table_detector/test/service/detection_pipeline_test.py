@@ -0,0 +1,200 @@
+import threading
+import time
+import unittest
+
+from table_detector.services.detection_pipeline import DetectionPipeline, LatestFrameQueue
+
+
+class TestLatestFrameQueue(unittest.TestCase):
+
+    def test_newer_item_replaces_waiting_item_of_same_key(self):
+        discarded = []
+        queue = LatestFrameQueue(4, on_discard=discarded.append)
+
+        queue.put("table_1", "frame_1")
+        queue.put("table_2", "frame_a")
+        queue.put("table_1", "frame_2")
+
+        self.assertEqual(queue.get(0)[:2], ("table_1", "frame_2"))
+        self.assertEqual(queue.get(0)[:2], ("table_2", "frame_a"))
+        self.assertEqual(discarded, ["frame_1"])
+        self.assertEqual(queue.superseded, 1)
+
+    def test_full_queue_drops_oldest_key(self):
+        discarded = []
+        queue = LatestFrameQueue(2, on_discard=discarded.append)
+
+        for i in range(3):
+            queue.put(f"table_{i}", f"frame_{i}")
+
+        self.assertEqual(discarded, ["frame_0"])
+        self.assertEqual(queue.dropped, 1)
+        self.assertEqual(len(queue), 2)
+
+    def test_full_queue_never_drops_removal(self):
+        discarded = []
+        queue = LatestFrameQueue(2, on_discard=discarded.append, never_drop=lambda item: item == "removed")
+
+        queue.put("table_0", "removed")
+        queue.put("table_1", "frame_1")
+        queue.put("table_2", "removed")
+        queue.put("table_3", "removed")
+
+        self.assertEqual(discarded, ["frame_1"])
+        self.assertEqual([queue.get(0)[:2] for _ in range(3)],
+                         [("table_0", "removed"), ("table_2", "removed"), ("table_3", "removed")])
+
+    def test_key_in_flight_is_not_handed_out_twice(self):
+        queue = LatestFrameQueue(4)
+        queue.put("table_1", "frame_1")
+        key, _, _ = queue.get(0)
+        queue.put("table_1", "frame_2")
+        queue.put("table_2", "frame_a")
+
+        self.assertEqual(queue.get(0)[:2], ("table_2", "frame_a"))
+        self.assertIsNone(queue.get(0.01))
+
+        queue.task_done(key)
+        self.assertEqual(queue.get(0)[:2], ("table_1", "frame_2"))
+
+
+class TestDetectionPipeline(unittest.TestCase):
+
+    def test_slow_send_keeps_only_latest_update_per_table(self):
+        release = threading.Event()
+        sent = []
+
+        def send(key, message):
+            release.wait(5)
+            sent.append((key, message))
+
+        pipeline = DetectionPipeline(
+            change_filter=lambda key, frame: frame if frame % 2 == 0 else None,
+            detect=lambda key, frame: f"snapshot {frame}",
+            serialize=lambda key, snapshot: f"update {snapshot}",
+            send=send,
+            detect_workers=2,
+            send_workers=1
+        )
+        pipeline.start()
+
+        pipeline.submit_frame("table_1", 0)
+        for frame in range(1, 9):
+            pipeline.wait_idle(0.05)
+            pipeline.submit_frame("table_1", frame)
+        release.set()
+        self.assertTrue(pipeline.wait_idle(5))
+        pipeline.stop()
+
+        # The first update was in flight; later ones replaced each other while the server was slow
+        self.assertEqual(sent[0], ("table_1", "update snapshot 0"))
+        self.assertEqual(sent[-1], ("table_1", "update snapshot 8"))
+        self.assertLess(len(sent), 5)
+
+        stats = {stage.name: stage for stage in pipeline.get_stats()}
+        self.assertEqual(stats['filter'].processed, 9)
+        self.assertGreater(stats['send'].superseded, 0)
+
+    def test_removal_replaces_pending_update(self):
+        release = threading.Event()
+        serialized = []
+
+        def serialize(key, payload):
+            release.wait(5)
+            serialized.append(payload)
+
+        pipeline = DetectionPipeline(
+            change_filter=lambda key, frame: frame,
+            detect=lambda key, frame: frame if frame == "removed" else f"snapshot {frame}",
+            serialize=serialize,
+            send=lambda key, message: None,
+            detect_workers=1
+        )
+        pipeline.start()
+
+        pipeline.submit_frame("table_2", "busy")
+        pipeline.submit_frame("table_1", "frame")
+        # table_2 blocks the serializer while the update of table_1 waits behind it
+        while len(pipeline.serialize_stage.queue) < 1:
+            time.sleep(0.001)
+        pipeline.submit_removal("table_1", "removed")
+        release.set()
+        self.assertTrue(pipeline.wait_idle(5))
+        pipeline.stop()
+
+        self.assertIn("removed", serialized)
+        self.assertNotIn("snapshot frame", serialized)
+
+    def test_removal_waits_for_in_flight_frame_of_same_table(self):
+        release = threading.Event()
+        events = []
+
+        def detect(key, item):
+            if item == "removed":
+                events.append("forgotten")
+                return item
+            events.append("detecting")
+            release.wait(5)
+            events.append("detected")
+            return f"snapshot {item}"
+
+        pipeline = DetectionPipeline(
+            change_filter=lambda key, frame: frame,
+            detect=detect,
+            serialize=lambda key, payload: payload,
+            send=lambda key, message: None,
+            detect_workers=2
+        )
+        pipeline.start()
+
+        pipeline.submit_frame("table_1", "frame")
+        while events != ["detecting"]:
+            time.sleep(0.001)
+        pipeline.submit_removal("table_1", "removed")
+        # The second detect worker is idle but must not take the removal while the frame is in flight
+        time.sleep(0.05)
+        self.assertEqual(events, ["detecting"])
+        release.set()
+        self.assertTrue(pipeline.wait_idle(5))
+        pipeline.stop()
+
+        self.assertEqual(events, ["detecting", "detected", "forgotten"])
+
+    def test_removals_of_more_tables_than_queue_slots_all_reach_send(self):
+        release = threading.Event()
+        detecting = threading.Event()
+        sent = []
+
+        def detect(key, item):
+            if item == "busy":
+                detecting.set()
+                release.wait(5)
+            return item
+
+        pipeline = DetectionPipeline(
+            change_filter=lambda key, frame: frame,
+            detect=detect,
+            serialize=lambda key, payload: payload,
+            send=lambda key, message: sent.append((key, message)),
+            detect_workers=1,
+            queue_size=2,
+            is_removal=lambda item: item == "removed"
+        )
+        pipeline.start()
+
+        pipeline.submit_frame("table_0", "busy")
+        detecting.wait(5)
+        # The only detect worker is blocked, so every removal waits in the two-slot detect queue
+        for i in range(1, 6):
+            pipeline.submit_removal(f"table_{i}", "removed")
+        self.assertEqual(pipeline.detect_stage.get_stats().dropped, 0)
+        release.set()
+        self.assertTrue(pipeline.wait_idle(5))
+        pipeline.stop()
+
+        self.assertEqual(sorted(key for key, message in sent if message == "removed"),
+                         [f"table_{i}" for i in range(1, 6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
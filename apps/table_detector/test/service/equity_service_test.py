@@ -0,0 +1,48 @@
+import unittest
+
+from table_detector.services.equity_service import EquityService
+
+
+class TestEquityService(unittest.TestCase):
+
+    def test_nuts_on_the_river_always_win(self):
+        service = EquityService(max_trials=500, time_budget_ms=1000, seed=1)
+        result = service.calculate(['AH', 'KH', '2C', '3D'], ['QH', 'JH', 'TH', '4S', '5S'], opponents=3)
+
+        self.assertEqual((result.equity, result.win, result.tie), (1.0, 1.0, 0.0))
+        self.assertEqual(result.trials, 500)
+
+    def test_board_flush_needs_two_hole_cards(self):
+        # A royal flush on the board plays for nobody; without a heart the hero can't even make a flush
+        service = EquityService(max_trials=500, time_budget_ms=1000, seed=1)
+        result = service.calculate(['2C', '3D', '4S', '6C'], ['AH', 'KH', 'QH', 'JH', 'TH'], opponents=1)
+
+        self.assertLess(result.equity, 0.2)
+
+    def test_aces_preflop_against_one_hand(self):
+        service = EquityService(max_trials=4000, time_budget_ms=10000, seed=7)
+        result = service.calculate(['AS', 'AH', 'KD', 'QD'], [], opponents=1)
+
+        # Aces with suited kings win about two thirds of the time heads-up
+        self.assertAlmostEqual(result.equity, 0.65, delta=0.04)
+        self.assertAlmostEqual(result.equity, result.win + result.tie / 2, delta=0.01)
+
+    def test_time_budget_stops_early(self):
+        service = EquityService(max_trials=10 ** 7, time_budget_ms=30, seed=1)
+        result = service.calculate(['AS', 'AH', 'KD', 'QD'], ['2C', '7D', 'KH'], opponents=5)
+
+        print(f"Equity vs 5 opponents: {result.trials} trials in {result.elapsed_ms:.1f}ms")
+        self.assertLess(result.trials, 10 ** 7)
+        self.assertLess(result.elapsed_ms, 1000)
+
+    def test_invalid_cards(self):
+        service = EquityService(seed=1)
+
+        self.assertRaises(ValueError, service.calculate, ['AS', 'AH', 'KD'], [], 1)
+        self.assertRaises(ValueError, service.calculate, ['AS', 'AH', 'KD', 'QD'], ['AS', '2C', '3C'], 1)
+        self.assertRaises(ValueError, service.calculate, ['AS', 'AH', 'KD', 'QD'], ['2C'], 1)
+        self.assertRaises(ValueError, service.calculate, ['AS', 'AH', 'KD', 'QD'], [], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
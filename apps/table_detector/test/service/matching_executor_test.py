@@ -0,0 +1,53 @@
+import threading
+import unittest
+
+from table_detector.services.matching_executor import MatchingExecutor
+
+
+class TestMatchingExecutor(unittest.TestCase):
+
+    def tearDown(self):
+        MatchingExecutor.shutdown()
+
+    def test_get_returns_shared_pool(self):
+        self.assertIs(MatchingExecutor.get(), MatchingExecutor.get())
+
+    def test_counts_tasks_and_keeps_order(self):
+        executor = MatchingExecutor.configure(2)
+
+        results = executor.map(lambda x: x * x, range(10))
+
+        stats = executor.get_stats()
+        self.assertEqual(results, [x * x for x in range(10)])
+        self.assertEqual((stats.submitted, stats.completed, stats.queue_depth, stats.active_workers), (10, 10, 0, 0))
+        self.assertGreaterEqual(stats.utilization, 0.0)
+
+    def test_reports_queue_depth_while_workers_are_busy(self):
+        executor = MatchingExecutor.configure(1)
+        release = threading.Event()
+
+        futures = [executor.submit(release.wait) for _ in range(3)]
+        stats = executor.get_stats()
+        release.set()
+        [future.result() for future in futures]
+
+        self.assertEqual(stats.submitted, 3)
+        self.assertGreaterEqual(stats.queue_depth, 2)
+
+    def test_nested_submit_runs_inline(self):
+        executor = MatchingExecutor.configure(1)
+
+        outer = executor.submit(lambda: executor.submit(lambda: "inner").result(timeout=1))
+
+        self.assertEqual(outer.result(timeout=5), "inner")
+
+    def test_shutdown_starts_fresh_pool_on_next_get(self):
+        executor = MatchingExecutor.get()
+
+        MatchingExecutor.shutdown()
+
+        self.assertIsNot(MatchingExecutor.get(), executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
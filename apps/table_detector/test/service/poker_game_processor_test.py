@@ -0,0 +1,47 @@
+import os
+import unittest
+from unittest import mock
+
+from shared.domain.detection import Detection
+from shared.domain.game_snapshot import GameSnapshot
+from table_detector.services.poker_game_processor import PokerGameProcessor
+
+
+def _positions(names):
+    return {player_id: Detection(name, (0, 0), (0, 0, 10, 10), 0.9) for player_id, name in names.items()}
+
+
+class TestCountOpponents(unittest.TestCase):
+
+    def setUp(self):
+        env_patch = mock.patch.dict(os.environ, {'EQUITY_OPPONENTS': '0'})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+
+    def test_folded_seats_are_not_opponents(self):
+        snapshot = GameSnapshot(positions=_positions({
+            1: 'BB',
+            2: 'BTN_fold_red',
+            3: 'folds',
+            4: 'SB_fold',
+            5: 'NO',
+            6: 'CO',
+        }))
+
+        self.assertEqual(PokerGameProcessor.count_opponents(snapshot), 1)
+
+    def test_live_positions_and_action_text_are_opponents(self):
+        snapshot = GameSnapshot(positions=_positions({
+            1: 'BTN',
+            2: 'SB',
+            3: 'BB_low',
+            4: 'calls',
+            5: 'EP_now',
+            6: 'unknown_marker',
+        }))
+
+        self.assertEqual(PokerGameProcessor.count_opponents(snapshot), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
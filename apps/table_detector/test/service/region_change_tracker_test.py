@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+from table_detector.services.poker_game_processor import PokerGameProcessor
+from table_detector.services.region_change_tracker import (
+    RegionChangeTracker,
+    WindowRegionState,
+    DETECTION_REGIONS,
+    action_region,
+    position_region
+)
+from table_detector.test.service.test_utils import load_image
+from table_detector.utils.detect_utils import DetectUtils, ACTION_POSITIONS, PLAYER_POSITIONS
+
+
+class TestRegionChangeTracker(unittest.TestCase):
+
+    def test_only_touched_region_changes(self):
+        image = load_image("2.png")
+        state = WindowRegionState()
+        state.fingerprints = RegionChangeTracker.fingerprint_regions(image)
+
+        changed_image = image.copy()
+        x, y, w, h = ACTION_POSITIONS[3]
+        changed_image[y + 5:y + 10, x + 5:x + 50] = 255
+
+        self.assertEqual(state.changed_regions(RegionChangeTracker.fingerprint_regions(image)), set())
+        self.assertEqual(state.changed_regions(RegionChangeTracker.fingerprint_regions(changed_image)),
+                         {action_region(3)})
+
+    def test_new_window_changes_every_region(self):
+        fingerprints = RegionChangeTracker.fingerprint_regions(load_image("2.png"))
+
+        self.assertEqual(WindowRegionState().changed_regions(fingerprints), set(DETECTION_REGIONS))
+
+    def test_snapshot_reuses_unchanged_regions(self):
+        image = load_image("2.png")
+        state = WindowRegionState()
+        full_snapshot = PokerGameProcessor.create_game_snapshot(image)
+        PokerGameProcessor.create_game_snapshot(image, state)
+
+        # Something outside every detector region changes, e.g. a timer
+        changed_image = image.copy()
+        changed_image[0:20, 0:20] = 255
+
+        with patch.object(DetectUtils, 'detect_player_cards') as detect_player_cards, \
+                patch.object(DetectUtils, 'get_player_actions_detection') as detect_actions:
+            snapshot = PokerGameProcessor.create_game_snapshot(changed_image, state)
+
+        detect_player_cards.assert_not_called()
+        detect_actions.assert_not_called()
+        self.assertEqual([d.name for d in snapshot.player_cards], [d.name for d in full_snapshot.player_cards])
+        self.assertEqual(snapshot.moves, full_snapshot.moves)
+
+    def test_failed_position_detection_drops_stale_seat(self):
+        image = load_image("2.png")
+        state = WindowRegionState()
+        PokerGameProcessor.create_game_snapshot(image, state)
+        seat = next(iter(state.positions))
+        detected_seats = set(state.positions)
+
+        changed_image = image.copy()
+        coords = PLAYER_POSITIONS[seat]
+        changed_image[coords['y']:coords['y'] + 5, coords['x']:coords['x'] + 5] = 255
+
+        with patch.object(DetectUtils, 'detect_positions', return_value={}):
+            PokerGameProcessor._detect_changed_regions(changed_image, state)
+
+        self.assertEqual(set(state.positions), detected_seats - {seat})
+        # The failed seat is retried on the next frame
+        self.assertIn(position_region(seat), state.changed_regions(RegionChangeTracker.fingerprint_regions(changed_image)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2
+
+from table_detector.services.image_capture_service import ImageCaptureService
+from table_detector.services.replay_capture_backend import ReplayCaptureBackend
+from table_detector.test.service.test_utils import load_image
+
+TITLE = "unknown (2.50/5) Pot Limit Omaha"
+
+
+def write_session(root: Path, frames) -> Path:
+    """Lay out frames like capture_and_save_windows: <date>/<time>/windows.txt + <window>/<window>.png"""
+    session = root / "results" / "2025_06_10"
+    for time_folder, image_name in frames:
+        cycle = session / time_folder
+        window = "01_unknown__2_50__5__Pot_Limit_Omaha"
+        (cycle / window).mkdir(parents=True)
+        cv2.imwrite(str(cycle / window / f"{window}.png"), load_image(image_name))
+        cv2.imwrite(str(cycle / "full_screen.png"), load_image(image_name)[:10, :10])
+        (cycle / "windows.txt").write_text(f"Window 1:\n  Title: {TITLE}\n  Process: client.exe\n")
+    return session
+
+
+class TestReplayCaptureBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.session = write_session(self.root, [("120006", "6.png"), ("120000", "2.png"), ("120003", "2.png")])
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_frames_in_recorded_order_with_titles(self):
+        backend = ReplayCaptureBackend(str(self.session), speed=0)
+
+        self.assertEqual([Path(f.name).name for f in backend.frames], ["120000", "120003", "120006"])
+        self.assertTrue(backend.next_frame())
+        windows = backend.list_windows()
+        self.assertEqual([w['title'] for w in windows], [TITLE])
+        self.assertEqual(backend.get_stats().frames_decoded, 0)
+
+        frame = backend.capture_window(windows[0])
+
+        self.assertEqual(frame.shape, (584, 784, 3))
+        self.assertEqual(backend.get_stats().recorded_fps, 2 / 6)
+
+    def test_reads_zipped_recording(self):
+        archive = shutil.make_archive(str(self.root / "recording"), "zip", self.session)
+        backend = ReplayCaptureBackend(archive, speed=0)
+
+        played = []
+        while backend.next_frame():
+            played.append(backend.capture_window(backend.list_windows()[0]).shape)
+        backend.close()
+
+        self.assertEqual(played, [(584, 784, 3)] * 3)
+
+    def test_accelerated_replay_keeps_recorded_pacing(self):
+        backend = ReplayCaptureBackend(str(self.session), speed=60)
+
+        while backend.next_frame():
+            pass
+
+        # 6 recorded seconds at 60x take ~0.1s
+        self.assertGreaterEqual(backend.get_stats().elapsed_seconds, 0.09)
+
+    def test_capture_service_sees_recorded_changes(self):
+        backend = ReplayCaptureBackend(str(self.session), speed=0)
+        service = ImageCaptureService(capture_backend=backend)
+        service.debug_mode = False
+        service.save_windows = False
+
+        changed = []
+        while backend.next_frame():
+            changed.append(len(service.get_changed_images(str(self.root / "out")).changed_images))
+
+        stats = backend.get_stats()
+        # 2.png is repeated in the second frame, so only the first and third count as changed
+        self.assertEqual(changed, [1, 0, 1])
+        self.assertEqual((stats.frames_played, stats.frames_decoded), (3, 3))
+        self.assertGreater(stats.achieved_fps, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from table_detector.services.bid_detection_service import PLAYER_BID_POSITIONS
+from table_detector.services.capture_backend import InMemoryCaptureBackend
+from table_detector.services.poker_game_processor import PokerGameProcessor
+from table_detector.services.screenshot_archive import ArchivePolicy, ScreenshotArchive
+from table_detector.services.window_capture_service import capture_and_save_windows
+from table_detector.test.service.test_utils import load_image
+
+TABLE_TITLE = "Table 1 - 2.50/5 Pot Limit Omaha"
+BIDS_FOLDER = os.path.join(os.path.dirname(__file__), '..', 'resources', 'detection', 'bids')
+
+
+def make_cycle(root: Path, date: str, time: str, size: int) -> Path:
+    folder = root / date / time / "window"
+    folder.mkdir(parents=True)
+    (folder / "01_window.png").write_bytes(b"\0" * size)
+    return folder.parent
+
+
+class TestScreenshotArchivePruning(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+
+    def test_removes_folders_older_than_max_age(self):
+        old = make_cycle(self.root, "2025_06_01", "120000", 10)
+        recent = make_cycle(self.root, "2025_06_10", "120000", 10)
+        archive = ScreenshotArchive(self.root, ArchivePolicy(budget_mb=0, max_age_days=7))
+
+        removed = archive.prune(now=datetime(2025, 6, 12))
+
+        self.assertEqual(removed, (1, 10))
+        self.assertFalse(old.exists())
+        self.assertFalse((self.root / "2025_06_01").exists())
+        self.assertTrue(recent.exists())
+
+    def test_removes_oldest_folders_over_budget_but_keeps_current(self):
+        first = make_cycle(self.root, "2025_06_10", "120000", 600 * 1024)
+        second = make_cycle(self.root, "2025_06_10", "120003", 600 * 1024)
+        current = make_cycle(self.root, "2025_06_10", "120006", 600 * 1024)
+        archive = ScreenshotArchive(self.root, ArchivePolicy(budget_mb=1, max_age_days=0))
+
+        archive.prune(current_folder=current, now=datetime(2025, 6, 10, 12, 1))
+
+        self.assertFalse(first.exists())
+        self.assertFalse(second.exists())
+        self.assertTrue(current.exists())
+        self.assertEqual(archive.get_stats().archive_bytes, 600 * 1024)
+
+
+class TestScreenshotArchiveCapture(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.image = load_image("2.png")
+        self.backend = InMemoryCaptureBackend({TABLE_TITLE: self.image})
+        self.backend.fullscreen = self.image
+
+    def capture(self, archive, time):
+        folder = self.root / "2025_06_10" / time
+        return folder, capture_and_save_windows(str(folder), save_windows=True, backend=self.backend,
+                                                archive=archive)
+
+    def test_samples_full_screen_and_writes_index(self):
+        archive = ScreenshotArchive(self.root, ArchivePolicy(max_age_days=0, fullscreen_every=2, image_format="bmp"),
+                                    session_id="test")
+
+        folders = [self.capture(archive, time)[0] for time in ("120000", "120003", "120006")]
+        archive.close()
+
+        self.assertEqual([(folder / "full_screen.bmp").exists() for folder in folders], [True, False, True])
+        entries = [json.loads(line) for line in archive.index_path.read_text().splitlines()]
+        self.assertEqual(len(entries), 5)
+        for entry in entries:
+            self.assertTrue((self.root / entry['path']).exists())
+        self.assertEqual(entries[0]['cycle'], "2025_06_10/120000")
+
+    def test_roi_only_screenshot_replays_to_same_snapshot(self):
+        archive = ScreenshotArchive(self.root, ArchivePolicy(max_age_days=0, fullscreen_every=0, roi_only=True))
+
+        folder, captured = self.capture(archive, "120000")
+        archive.close()
+
+        saved = cv2.imread(os.path.join(folder, captured[0].window_name, captured[0].filename))
+        self.assertLess(np.count_nonzero(saved), np.count_nonzero(self.image) // 2)
+        original = PokerGameProcessor.create_game_snapshot(self.image)
+        replayed = PokerGameProcessor.create_game_snapshot(saved)
+        self.assertEqual([d.name for d in replayed.player_cards], [d.name for d in original.player_cards])
+        self.assertEqual([d.name for d in replayed.table_cards], [d.name for d in original.table_cards])
+        self.assertEqual(replayed.moves, original.moves)
+
+    def test_roi_only_mask_keeps_bid_seats(self):
+        archive = ScreenshotArchive(self.root, ArchivePolicy(max_age_days=0, fullscreen_every=0, roi_only=True))
+        image = cv2.imread(os.path.join(BIDS_FOLDER, "9_bid.png"))
+
+        masked = archive.mask_regions(image)
+        archive.close()
+
+        for x, y, w, h in PLAYER_BID_POSITIONS.values():
+            np.testing.assert_array_equal(masked[y:y + h, x:x + w], image[y:y + h, x:x + w])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from shared.domain.detection import Detection
+from shared.domain.game_snapshot import GameSnapshot
+from table_detector.services.table_scheduler import TableScheduler, HOT, ACTIVE, IDLE
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def detection(name):
+    return Detection(name=name, center=(0, 0), bounding_rect=(0, 0, 1, 1), match_score=1.0)
+
+
+def snapshot(hero_cards=True, hero_acted=False, table_cards=()):
+    return GameSnapshot(
+        player_cards=[detection("Ah"), detection("Kd")] if hero_cards else [],
+        table_cards=[detection(card) for card in table_cards],
+        actions={1: [detection("call")] if hero_acted else [], 2: [detection("raise")]}
+    )
+
+
+class TestTableScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = TableScheduler(min_interval=0.5, active_interval=1.0, max_interval=4.0, backoff=2.0,
+                                        cpu_budget=0.5, latency_budget=0.5, clock=self.clock)
+
+    def state(self, name):
+        return self.scheduler._tables[name]
+
+    def test_new_windows_are_always_captured(self):
+        self.scheduler.begin_cycle()
+        self.assertTrue(self.scheduler.should_capture("01_table"))
+
+    def test_hero_to_act_is_polled_at_min_interval(self):
+        self.scheduler.record("01_table", 0.05, snapshot())
+
+        self.assertEqual(self.state("01_table").state, HOT)
+        self.assertEqual(self.state("01_table").interval, 0.5)
+
+        self.clock.advance(0.5)
+        self.assertEqual(self.scheduler.begin_cycle(), {"01_table"})
+
+    def test_changing_table_is_active_then_backs_off_when_idle(self):
+        self.scheduler.record("01_table", 0.05, snapshot(hero_acted=True))
+        self.assertEqual(self.state("01_table").state, ACTIVE)
+        self.assertEqual(self.state("01_table").interval, 1.0)
+
+        for expected in (2.0, 4.0, 4.0):
+            self.scheduler.record("01_table", 0.05)
+            self.assertEqual(self.state("01_table").state, IDLE)
+            self.assertEqual(self.state("01_table").interval, expected)
+
+        self.scheduler.record("01_table", 0.05, snapshot(hero_acted=True, table_cards=("2c", "3d", "4h")))
+        self.assertEqual(self.state("01_table").interval, 1.0)
+
+    def test_folded_table_backs_off_even_when_it_changes(self):
+        self.scheduler.record("01_table", 0.05, snapshot(hero_cards=False))
+        self.scheduler.record("01_table", 0.05, snapshot(hero_cards=False, table_cards=("2c", "3d", "4h")))
+
+        self.assertEqual(self.state("01_table").state, IDLE)
+        self.assertEqual(self.state("01_table").interval, 4.0)
+
+    def test_not_due_tables_are_skipped(self):
+        self.scheduler.record("01_table", 0.05, snapshot(hero_acted=True))
+
+        self.clock.advance(0.5)
+        self.assertEqual(self.scheduler.begin_cycle(), set())
+        self.assertFalse(self.scheduler.should_capture("01_table"))
+        self.assertAlmostEqual(self.scheduler.next_delay(), 0.5)
+
+    def test_cpu_budget_defers_idle_tables_before_hot_ones(self):
+        self.scheduler.record("01_hot", 0.3, snapshot())
+        for name in ("02_idle", "03_idle"):
+            self.scheduler.record(name, 0.3, snapshot(hero_cards=False))
+
+        self.clock.advance(10)
+        admitted = self.scheduler.begin_cycle()
+
+        self.assertEqual(admitted, {"01_hot"})
+        self.assertEqual(self.scheduler.get_stats().deferred, 2)
+        self.assertFalse(self.scheduler.should_capture("02_idle"))
+
+    def test_forget_drops_table(self):
+        self.scheduler.record("01_table", 0.05, snapshot())
+        self.scheduler.forget("01_table")
+
+        self.assertEqual(self.scheduler.get_stats().tables, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
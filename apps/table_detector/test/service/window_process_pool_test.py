@@ -0,0 +1,80 @@
+import tempfile
+import threading
+import unittest
+
+from table_detector.domain.captured_window import CapturedWindow
+from table_detector.services.poker_game_processor import PokerGameProcessor
+from table_detector.services.window_process_pool import WindowProcessPool
+from table_detector.test.service.test_utils import load_image
+
+
+def snapshot_summary(snapshot):
+    return (
+        [card.name for card in snapshot.player_cards],
+        [card.name for card in snapshot.table_cards],
+        {seat: position.name for seat, position in snapshot.positions.items()},
+        {street: list(moves) for street, moves in snapshot.moves.items()}
+    )
+
+
+class TestWindowProcessPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = WindowProcessPool(workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_snapshots_match_in_process_detection(self):
+        folder = tempfile.mkdtemp()
+        windows = {f"0{i}_table": load_image(name) for i, name in enumerate(("2.png", "6.png"), 1)}
+
+        futures = {
+            name: self.pool.submit(CapturedWindow.from_frame(image, f"{name}.png", name), folder)
+            for name, image in windows.items()
+        }
+
+        for name, image in windows.items():
+            result = futures[name].result(timeout=120)
+            expected = PokerGameProcessor.create_game_snapshot(image)
+            self.assertEqual(result.window_name, name)
+            self.assertEqual(snapshot_summary(result.snapshot), snapshot_summary(expected))
+
+        stats = self.pool.get_stats()
+        self.assertEqual((stats.windows, stats.submitted), (2, 2))
+
+    def test_window_keeps_its_worker_and_segment(self):
+        folder = tempfile.mkdtemp()
+        image = load_image("2.png")
+
+        self.pool.submit(CapturedWindow.from_frame(image, "t.png", "03_table"), folder).result(timeout=120)
+        segment = self.pool._segments["03_table"]
+        worker = self.pool._assignments["03_table"]
+        self.pool.submit(CapturedWindow.from_frame(image, "t.png", "03_table"), folder).result(timeout=120)
+
+        self.assertIs(self.pool._segments["03_table"], segment)
+        self.assertEqual(self.pool._assignments["03_table"], worker)
+
+        self.pool.forget_window("03_table")
+        self.assertNotIn("03_table", self.pool._segments)
+
+    def test_window_forgotten_after_in_flight_frame(self):
+        folder = tempfile.mkdtemp()
+        image = load_image("2.png")
+
+        future = self.pool.submit(CapturedWindow.from_frame(image, "t.png", "04_table"), folder)
+        forgetting = threading.Thread(target=self.pool.forget_window, args=("04_table",))
+        forgetting.start()
+        result = future.result(timeout=120)
+        forgetting.join(120)
+
+        self.assertEqual(snapshot_summary(result.snapshot),
+                         snapshot_summary(PokerGameProcessor.create_game_snapshot(image)))
+        self.assertNotIn("04_table", self.pool._segments)
+        self.assertNotIn("04_table", self.pool._assignments)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from table_detector.services.capture_backend import Win32CaptureBackend
+from table_detector.services.window_registry import InMemoryWindowProvider, WindowRegistry
+from table_detector.utils.capture_utils import get_poker_window_info
+
+TABLE_TITLE = "Table 1 - 2.50/5 Pot Limit Omaha"
+
+
+class TestWindowRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = InMemoryWindowProvider()
+        self.provider.add_window(10, TABLE_TITLE, (0, 0, 784, 584), pid=100, process="poker.exe")
+        self.provider.add_window(11, "Table 2 - 1/2 Pot Limit Omaha", (800, 0, 1584, 584), pid=100,
+                                 process="poker.exe")
+        self.provider.add_window(12, "Editor", (0, 0, 1000, 800), pid=200, process="editor.exe")
+        self.registry = WindowRegistry(self.provider)
+
+    def test_lists_windows_in_get_window_info_format(self):
+        windows = self.registry.list_windows()
+
+        self.assertEqual(windows[0], {'hwnd': 10, 'title': TABLE_TITLE, 'rect': (0, 0, 784, 584),
+                                      'process': "poker.exe", 'width': 784, 'height': 584})
+        self.assertEqual([w['process'] for w in windows], ["poker.exe", "poker.exe", "editor.exe"])
+
+    def test_process_is_looked_up_once_per_process(self):
+        for _ in range(5):
+            self.registry.list_windows()
+
+        self.assertEqual(self.provider.process_lookups, 2)
+        self.assertEqual(self.registry.get_stats().refreshes, 5)
+
+    def test_refresh_picks_up_new_removed_and_moved_windows(self):
+        self.registry.list_windows()
+
+        self.provider.remove_window(11)
+        self.provider.update_window(10, rect=(100, 50, 884, 634), title="Table 1 - 5/10 Pot Limit Omaha")
+        self.provider.add_window(13, "Table 3 - 1/2 Pot Limit Omaha", (0, 600, 784, 1184), pid=300,
+                                 process="other.exe")
+        windows = {w['hwnd']: w for w in self.registry.list_windows()}
+
+        self.assertEqual(sorted(windows), [10, 12, 13])
+        self.assertEqual(windows[10]['rect'], (100, 50, 884, 634))
+        self.assertEqual(windows[10]['title'], "Table 1 - 5/10 Pot Limit Omaha")
+        self.assertEqual(windows[13]['process'], "other.exe")
+        stats = self.registry.get_stats()
+        self.assertEqual((stats.windows, stats.added, stats.removed), (3, 4, 1))
+
+    def test_skips_hidden_untitled_and_tiny_windows(self):
+        self.provider.add_window(20, "Hidden", (0, 0, 500, 500), shown=False)
+        self.provider.add_window(21, "", (0, 0, 500, 500))
+        self.provider.add_window(22, "Tooltip", (0, 0, 40, 20))
+
+        self.assertEqual([w['hwnd'] for w in self.registry.list_windows()], [10, 11, 12])
+
+    def test_title_filter_avoids_process_lookups_of_other_windows(self):
+        windows = self.registry.list_windows("Pot Limit Omaha")
+
+        self.assertEqual([w['hwnd'] for w in windows], [10, 11])
+        self.assertEqual(self.provider.process_lookups, 1)
+
+    def test_win32_backend_lists_through_registry(self):
+        backend = Win32CaptureBackend(registry=self.registry)
+
+        self.assertEqual(len(backend.list_windows()), 3)
+
+    def test_poker_window_listing_reads_rects_of_tables_only(self):
+        backend = Win32CaptureBackend(registry=self.registry)
+
+        windows = get_poker_window_info("Pot Limit Omaha", backend)
+
+        self.assertEqual([w['hwnd'] for w in windows], [10, 11])
+        self.assertEqual(self.provider.rect_reads, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import time
+import unittest
+from pathlib import Path
+
+import cv2
+from loguru import logger
+
+from table_detector.services.template_matcher_service import TemplateMatchService
+from table_detector.utils.detect_utils import TABLE_CARD_SLOTS, PLAYER_CARD_SLOTS
+
+RESOURCES_DIR = Path(__file__).parent.parent / "resources"
+
+# The 6S table card template is a copy of 6C, glyph recognition reports the club it shows
+MISLABELED_TABLE_TEMPLATES = {"6S"}
+
+
+def load_fixtures():
+    fixtures = []
+    for path in sorted(RESOURCES_DIR.rglob("*.png")):
+        image = cv2.imread(str(path))
+        if image is not None and image.shape[:2] == (584, 784):
+            fixtures.append((path.name, image))
+    return fixtures
+
+
+class TestCardGlyphRecognition(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures = load_fixtures()
+
+    def test_glyphs_agree_with_card_templates(self):
+        for image_name, image in self.fixtures:
+            with self.subTest(image=image_name):
+                reference = TemplateMatchService.find_player_cards(image)
+                by_glyphs = TemplateMatchService.find_cards_by_glyphs(image, PLAYER_CARD_SLOTS, 'player_cards')
+                # Glyphs also read dimmed cards the 52-template search misses, so compare on its hits
+                self.assertTrue({d.name for d in reference} <= {d.name for d in by_glyphs})
+
+                reference = TemplateMatchService.find_table_cards_in_slots(image, TABLE_CARD_SLOTS)
+                by_glyphs = TemplateMatchService.find_cards_by_glyphs(image, TABLE_CARD_SLOTS, 'table_cards')
+                expected = [d.name for d in reference if d.name not in MISLABELED_TABLE_TEMPLATES]
+                self.assertTrue(set(expected) <= {d.name for d in by_glyphs})
+
+    def test_benchmark_glyphs_vs_card_templates(self):
+        timings = {}
+        for label, detect in (
+                ("player templates", lambda img: TemplateMatchService.find_player_cards(img)),
+                ("player glyphs", lambda img: TemplateMatchService.find_cards_by_glyphs(img, PLAYER_CARD_SLOTS, 'player_cards')),
+                ("table templates", lambda img: TemplateMatchService.find_table_cards_in_slots(img, TABLE_CARD_SLOTS)),
+                ("table glyphs", lambda img: TemplateMatchService.find_cards_by_glyphs(img, TABLE_CARD_SLOTS, 'table_cards')),
+        ):
+            detect(self.fixtures[0][1])  # warm up template and glyph stacks
+            start_time = time.perf_counter()
+            for _, image in self.fixtures:
+                detect(image)
+            timings[label] = (time.perf_counter() - start_time) / len(self.fixtures) * 1000
+
+        for label, ms in timings.items():
+            logger.info(f"⏱️  {label}: {ms:.2f} ms per frame over {len(self.fixtures)} frames")
+
+        self.assertLess(timings["player glyphs"], timings["player templates"])
+
+
+if __name__ == '__main__':
+    unittest.main()
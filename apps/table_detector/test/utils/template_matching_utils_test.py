@@ -0,0 +1,118 @@
+import time
+import unittest
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from table_detector.services.template_matcher_service import TemplateMatchService, MatchConfig
+from table_detector.test.service.test_utils import load_image
+from table_detector.utils.opencv_utils import find_score_peaks
+from table_detector.utils.template_matching_utils import (
+    match_template_stack,
+    extract_search_region,
+    non_max_suppression,
+    overlaps_with_existing
+)
+
+
+class TestTemplateStackMatching(unittest.TestCase):
+
+    def test_stack_scores_match_opencv(self):
+        image = load_image("1.png")
+        search_image, _ = extract_search_region(image, (0.2, 0.5, 0.8, 0.95))
+        stack = TemplateMatchService.TEMPLATE_REGISTRY.player_template_stacks[0]
+
+        scores = match_template_stack(search_image, stack)
+
+        for index in range(len(stack)):
+            template = stack.templates[index].astype(np.uint8)
+            expected = cv2.matchTemplate(search_image, template, cv2.TM_CCORR_NORMED)
+            np.testing.assert_allclose(scores[index], expected, atol=1e-4)
+
+    def test_stack_skips_templates_larger_than_region(self):
+        image = load_image("1.png")
+        stack = TemplateMatchService.TEMPLATE_REGISTRY.table_template_stacks[0]
+
+        scores = match_template_stack(image[:10, :10], stack)
+
+        self.assertEqual(scores.size, 0)
+
+
+class TestScaledTemplateCache(unittest.TestCase):
+
+    def test_scaled_template_is_resized_once(self):
+        registry = TemplateMatchService.TEMPLATE_REGISTRY
+        template = registry.player_templates["AS"]
+
+        scaled = registry.get_scaled_template("AS", template, 0.9)
+
+        self.assertIs(scaled, registry.get_scaled_template("AS", template, 0.9))
+        self.assertEqual(scaled.image.shape[:2], (scaled.height, scaled.width))
+        self.assertEqual((scaled.width, scaled.height), (int(template.shape[1] * 0.9), int(template.shape[0] * 0.9)))
+        self.assertIs(registry.get_scaled_template("AS", template, 1.0).image, template)
+
+    def test_multi_scale_stack_matches_template_path(self):
+        image = load_image("1.png")
+        registry = TemplateMatchService.TEMPLATE_REGISTRY
+        config = MatchConfig(search_region=(0.2, 0.5, 0.8, 0.95), scale_factors=[1.0, 0.95, 1.05])
+
+        by_template = TemplateMatchService.find_matches(image, registry.player_templates, config)
+        by_stack = TemplateMatchService.find_stack_matches(image, registry.player_template_stacks, config)
+
+        self.assertEqual([(d.name, d.scale) for d in by_template], [(d.name, d.scale) for d in by_stack])
+
+
+class TestPeaksAndSuppression(unittest.TestCase):
+
+    @staticmethod
+    def legacy_filter(scores, stack, threshold=0.955, overlap_threshold=0.3):
+        # Every above-threshold pixel as a dict, then the pairwise IoU loop
+        detections = []
+        for template_index, y, x in zip(*np.nonzero(scores >= threshold)):
+            detections.append({
+                'template_name': stack.names[template_index],
+                'match_score': float(scores[template_index, y, x]),
+                'bounding_rect': (int(x), int(y), stack.width, stack.height),
+            })
+        detections.sort(key=lambda d: d['match_score'], reverse=True)
+        accepted = []
+        for detection in detections:
+            if not overlaps_with_existing(detection, accepted, overlap_threshold):
+                accepted.append(detection)
+        return [(d['template_name'], d['bounding_rect']) for d in accepted]
+
+    @staticmethod
+    def vectorized_filter(scores, stack, threshold=0.955, overlap_threshold=0.3):
+        template_indices, ys, xs = find_score_peaks(scores, threshold)
+        boxes = np.stack([xs, ys, np.full_like(xs, stack.width), np.full_like(xs, stack.height)], axis=1)
+        keep = non_max_suppression(boxes, scores[template_indices, ys, xs], overlap_threshold)
+        return [(stack.names[template_indices[i]], tuple(int(v) for v in boxes[i])) for i in keep]
+
+    def test_peaks_and_nms_match_legacy_filter(self):
+        score_maps = []
+        for image_name in ("1.png", "2.png", "6.png", "9.png"):
+            image = load_image(image_name)
+            for stack in TemplateMatchService.TEMPLATE_REGISTRY.table_template_stacks:
+                score_maps.append((match_template_stack(image, stack), stack))
+
+        timings = {}
+        results = {}
+        for label, apply_filter in (("legacy", self.legacy_filter), ("vectorized", self.vectorized_filter)):
+            start_time = time.perf_counter()
+            results[label] = [apply_filter(scores, stack) for scores, stack in score_maps]
+            timings[label] = (time.perf_counter() - start_time) * 1000
+
+        logger.info(f"⏱️  Peak extraction + NMS: legacy {timings['legacy']:.1f} ms, "
+                    f"vectorized {timings['vectorized']:.1f} ms")
+        self.assertEqual(results["legacy"], results["vectorized"])
+
+    def test_score_peaks_keep_local_maxima_only(self):
+        scores = np.zeros((1, 5, 5), dtype=np.float32)
+        scores[0, 1:4, 1:4] = 0.96
+        scores[0, 2, 2] = 0.99
+        scores[0, 0, 4] = 0.97
+
+        template_indices, ys, xs = find_score_peaks(scores, 0.955)
+
+        self.assertEqual(list(zip(ys.tolist(), xs.tolist())), [(0, 4), (2, 2)])
@@ -1,14 +1,15 @@
 import os
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 
-from PIL import Image, ImageGrab
+import cv2
 from loguru import logger
 
 from table_detector.domain.captured_window import CapturedWindow
+from table_detector.services.artifact_writer import ArtifactWriter
 from table_detector.utils.fs_utils import get_image_names
-from table_detector.utils.windows_utils import get_window_info, careful_capture_window, capture_screen_region
 
-def _capture_windows(windows) -> List[CapturedWindow]:
+def _capture_windows(windows, backend, window_filter: Optional[Callable[[str], bool]] = None
+                     ) -> List[CapturedWindow]:
     windows.sort(key=lambda w: w['hwnd'])
 
     logger.info(f"Found {len(windows)} windows to capture")
@@ -16,28 +17,24 @@ def _capture_windows(windows) -> List[CapturedWindow]:
     captured_images = []
 
     for i, window in enumerate(windows, 1):
-        hwnd = window['hwnd']
         title = window['title']
         process = window['process']
-        rect = window['rect']
-        width = window['width']
-        height = window['height']
-
-        logger.info(f"Capturing window {i}/{len(windows)}: {title} ({process})")
 
         safe_title = "".join([c if c.isalnum() else "_" for c in title])[:50]
         safe_title = f"{i:02d}_{safe_title}"
         filename = f"{safe_title}.png"
 
-        img = careful_capture_window(hwnd, width, height)
+        # Names are numbered over all listed windows so skipping some keeps the others' names stable
+        if window_filter is not None and not window_filter(safe_title):
+            continue
+
+        logger.info(f"Capturing window {i}/{len(windows)}: {title} ({process})")
 
-        if img is None:
-            logger.info("  Using fallback method: screen region capture")
-            img = capture_screen_region(rect)
+        frame = backend.capture_window(window)
 
-        if img:
-            captured_image = CapturedWindow(
-                image=img,
+        if frame is not None:
+            captured_image = CapturedWindow.from_frame(
+                frame,
                 filename=filename,
                 window_name=safe_title,
                 description=f"{safe_title}"
@@ -50,17 +47,28 @@ def _capture_windows(windows) -> List[CapturedWindow]:
     return captured_images
 
 
-def get_poker_window_info(poker_window_name):
-    original_windows_info = get_window_info()
-    windows = [w for w in original_windows_info if poker_window_name in w['title']]
-    return windows
+def get_poker_window_info(poker_window_name, backend):
+    return backend.list_windows(poker_window_name)
 
 
 def save_images_to_window_folders(
         captured_images: List[CapturedWindow],
         base_folder: str,
-        window_folder_mapping: Dict[str, str]
+        window_folder_mapping: Dict[str, str],
+        writer: Optional[ArtifactWriter] = None
 ):
+    if writer is not None:
+        queued = 0
+        for captured_image in captured_images:
+            window_folder = window_folder_mapping.get(captured_image.window_name, base_folder)
+            filepath = os.path.join(window_folder, captured_image.filename)
+            if writer.submit(captured_image.get_cv2_image(), filepath):
+                queued += 1
+        stats = writer.get_stats()
+        logger.info(f"💾 Queued {queued}/{len(captured_images)} images for saving "
+                    f"(backlog {stats.backlog}, dropped {stats.dropped}, avg write {stats.avg_write_ms:.1f}ms)")
+        return
+
     logger.info(f"\nSaving {len(captured_images)} captured images to window-specific folders...")
     successes = 0
 
@@ -101,15 +109,15 @@ def load_images_from_folder(timestamp_folder: str) -> List[CapturedWindow]:
     for filename in sorted(image_files):
         try:
             filepath = os.path.join(timestamp_folder, filename)
-            # Load image and create a copy to avoid file handle leaks
-            with Image.open(filepath) as source_image:
-                # Create a copy so we can close the original file handle
-                image = source_image.copy()
+            # Decode straight into a BGR frame, no PIL image in between
+            frame = cv2.imread(filepath, cv2.IMREAD_COLOR)
+            if frame is None:
+                raise IOError(f"cannot decode {filepath}")
 
-            window_name = filename.replace('.png', '')
+            window_name = os.path.splitext(filename)[0]
 
-            captured_image = CapturedWindow(
-                image=image,
+            captured_image = CapturedWindow.from_frame(
+                frame,
                 filename=filename,
                 window_name=window_name,
                 description="Loaded from debug folder"
@@ -123,11 +131,14 @@ def load_images_from_folder(timestamp_folder: str) -> List[CapturedWindow]:
     return captured_images
 
 
-def capture_fullscreen():
-    try:
-        with ImageGrab.grab() as full_screen_source:
-            # Create a copy to avoid keeping the original reference
-            full_screen = full_screen_source.copy()
-    except Exception as e:
-        logger.error(f"Error capturing full screen: {e}")
-    return full_screen
+def capture_fullscreen(backend) -> Optional[CapturedWindow]:
+    frame = backend.capture_fullscreen()
+    if frame is None:
+        return None
+
+    return CapturedWindow.from_frame(
+        frame,
+        filename="full_screen.png",
+        window_name='full_screen',
+        description="Full screen"
+    )
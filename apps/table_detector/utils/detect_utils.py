@@ -1,10 +1,12 @@
-from typing import List, Dict
+import os
+from typing import List, Dict, Iterable, Optional
 
 import numpy as np
 from loguru import logger
 
 from shared.domain.detection import Detection
 from table_detector.utils.opencv_utils import coords_to_search_region
+from table_detector.services.matching_executor import MatchingExecutor
 from table_detector.services.template_matcher_service import TemplateMatchService
 
 ACTION_POSITIONS = {
@@ -26,23 +28,56 @@ PLAYER_POSITIONS = {
     6: {'x': 565, 'y': 332, 'w': 40, 'h': 40}
 }
 
+# Board card slots (slot_id: (x, y, width, height)), left to right
+TABLE_CARD_SLOTS = {
+    1: (253, 234, 46, 60),
+    2: (310, 234, 46, 60),
+    3: (367, 234, 46, 60),
+    4: (425, 234, 46, 60),
+    5: (482, 234, 46, 60),
+}
+
+# Hero card slots (slot_id: (x, y, width, height)), left to right
+PLAYER_CARD_SLOTS = {
+    1: (343, 353, 21, 37),
+    2: (369, 353, 21, 37),
+    3: (394, 353, 21, 37),
+    4: (419, 353, 21, 37),
+}
+
 POSITION_MARGIN = 10
 
+# Classify board cards per fixed slot instead of searching the whole window
+BOARD_SLOT_MODE = os.getenv('BOARD_SLOT_MODE', 'true').lower() == 'true'
+
+# Recognize cards from 13 rank + 4 suit glyphs per slot instead of 52 card templates
+FACTORIZED_CARD_MODE = os.getenv('FACTORIZED_CARD_MODE', 'false').lower() == 'true'
+
 IMAGE_WIDTH = 784
 IMAGE_HEIGHT = 584
 
 
 class DetectUtils:
     @staticmethod
-    def detect_positions(cv2_image) -> Dict[int, Detection]:
+    def detect_positions(cv2_image, seats: Optional[Iterable[int]] = None) -> Dict[int, Detection]:
         try:
             player_positions = {}
 
-            for player_num, coords in PLAYER_POSITIONS.items():
-                search_region = coords_to_search_region(coords['x'], coords['y'], coords['w'], coords['h'])
-
+            # Seats are matched concurrently on the shared matching pool
+            executor = MatchingExecutor.get()
+            futures = {
+                player_num: executor.submit(
+                    TemplateMatchService.find_positions,
+                    cv2_image,
+                    coords_to_search_region(coords['x'], coords['y'], coords['w'], coords['h'])
+                )
+                for player_num, coords in PLAYER_POSITIONS.items()
+                if seats is None or player_num in seats
+            }
+
+            for player_num, future in futures.items():
                 try:
-                    detected_positions = TemplateMatchService.find_positions(cv2_image, search_region)
+                    detected_positions = future.result()
 
                     if detected_positions:
                         best_position = detected_positions[0]
@@ -65,17 +100,28 @@ class DetectUtils:
 
     @staticmethod
     def detect_player_cards(cv2_image) -> List[Detection]:
+        if FACTORIZED_CARD_MODE:
+            return TemplateMatchService.find_cards_by_glyphs(cv2_image, PLAYER_CARD_SLOTS, 'player_cards')
         return TemplateMatchService.find_player_cards(cv2_image)
 
     @staticmethod
     def detect_table_cards(cv2_image) -> List[Detection]:
+        if FACTORIZED_CARD_MODE:
+            return TemplateMatchService.find_cards_by_glyphs(cv2_image, TABLE_CARD_SLOTS, 'table_cards')
+        if BOARD_SLOT_MODE:
+            return TemplateMatchService.find_table_cards_in_slots(cv2_image, TABLE_CARD_SLOTS)
         return TemplateMatchService.find_table_cards(cv2_image)
 
     @staticmethod
-    def get_player_actions_detection(image: np.ndarray) -> Dict[int, List[Detection]]:
-        player_actions = {}
+    def get_player_actions_detection(image: np.ndarray, seats: Optional[Iterable[int]] = None
+                                     ) -> Dict[int, List[Detection]]:
+        executor = MatchingExecutor.get()
+        futures = {}
 
         for player_id, region in ACTION_POSITIONS.items():
+            if seats is not None and player_id not in seats:
+                continue
+
             search_region = coords_to_search_region(
                 x=region[0],
                 y=region[1],
@@ -83,7 +129,6 @@ class DetectUtils:
                 h=region[3],
             )
 
-            actions = TemplateMatchService.find_jurojin_actions(image, search_region=search_region)
-            player_actions[player_id] = actions
+            futures[player_id] = executor.submit(TemplateMatchService.find_jurojin_actions, image, search_region)
 
-        return player_actions
+        return {player_id: future.result() for player_id, future in futures.items()}
@@ -5,6 +5,12 @@ from pathlib import Path
 from loguru import logger
 
 DEBUG_FOLDER = "test/resources/default_debug"
+# Lossless formats window screenshots may be archived in
+SCREENSHOT_EXTENSIONS = ('.png', '.bmp')
+
+
+def get_results_folder() -> Path:
+    return Path.cwd() / "resources" / "results"
 
 
 def create_timestamp_folder(debug_mode=False) -> Path:
@@ -23,17 +29,16 @@ def create_timestamp_folder(debug_mode=False) -> Path:
         timestamp_folder = Path.cwd() / DEBUG_FOLDER
     else:
         # Live mode - create new folder 
-        timestamp_folder = Path.cwd() / "resources" / "results" / date_folder / time_folder
+        timestamp_folder = get_results_folder() / date_folder / time_folder
 
     return timestamp_folder
 
 
 def get_image_names(timestamp_folder):
     # Get all image files in the folder
-    image_extensions = ('.png')
     image_files = [f for f in os.listdir(timestamp_folder)
-                   if f.lower().endswith(image_extensions) and not f.lower().endswith('_result.png')
-                   and not f.lower() == 'full_screen.png']
+                   if f.lower().endswith(SCREENSHOT_EXTENSIONS) and not f.lower().endswith('_result.png')
+                   and not os.path.splitext(f.lower())[0] == 'full_screen']
     return image_files
 
 
@@ -1,5 +1,5 @@
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 
 import cv2
 import numpy as np
@@ -7,6 +7,7 @@ from PIL import Image
 from loguru import logger
 
 from shared.domain.detected_bid import DetectedBid
+from table_detector.domain.scaled_template import ScaledTemplate
 
 
 def pil_to_cv2(pil_image: Image.Image) -> np.ndarray:
@@ -80,7 +81,8 @@ def match_template_at_scale(
         template_h: int,
         offset: Tuple[int, int],
         match_threshold: float = 0.955,
-        min_card_size: int = 5
+        min_card_size: int = 5,
+        scaled_template: Optional[ScaledTemplate] = None
 ) -> List[Dict]:
     """
     Perform template matching at a specific scale
@@ -95,26 +97,35 @@ def match_template_at_scale(
         offset: (x, y) offset of search region
         match_threshold: Minimum match score to consider
         min_card_size: Minimum card size in pixels
+        scaled_template: Pre-resized template (see TemplateRegistry.get_scaled_template)
 
     Returns:
         List of detection dictionaries
     """
-    scaled_w = int(template_w * scale)
-    scaled_h = int(template_h * scale)
+    if scaled_template is not None:
+        scaled_w, scaled_h = scaled_template.width, scaled_template.height
+    else:
+        scaled_w = int(template_w * scale)
+        scaled_h = int(template_h * scale)
 
     # # Skip if template becomes too small or too large
     # if (scaled_w < min_card_size or scaled_h < min_card_size or
     #         scaled_w > search_image.shape[1] or scaled_h > search_image.shape[0]):
     #     return []
 
-    # Resize template
-    scaled_template = cv2.resize(template, (scaled_w, scaled_h))
+    # Resize template unless a cached one was passed in
+    if scaled_template is not None:
+        template_image = scaled_template.image
+    elif (scaled_w, scaled_h) == (template_w, template_h):
+        template_image = template
+    else:
+        template_image = cv2.resize(template, (scaled_w, scaled_h))
 
     # Perform template matching
-    result = cv2.matchTemplate(search_image, scaled_template, cv2.TM_CCORR_NORMED)
+    result = cv2.matchTemplate(search_image, template_image, cv2.TM_CCORR_NORMED)
 
-    # Find all locations where match is above threshold
-    locations = np.where(result >= match_threshold)
+    # Find the local maxima above threshold, not every pixel around each one
+    locations = find_score_peaks(result, match_threshold)
     detections = []
 
     for y, x in zip(*locations):
@@ -133,4 +144,42 @@ def match_template_at_scale(
         }
         detections.append(detection)
 
-    return detections
\ No newline at end of file
+    return detections
+
+
+def find_score_peaks(scores: np.ndarray, threshold: float) -> Tuple[np.ndarray, ...]:
+    """
+    Indices of the local maxima of a score map that pass the threshold
+
+    A candidate is kept when no pixel of its 3x3 neighbourhood scores higher, so
+    the dozens of adjacent above-threshold pixels around one card collapse into a
+    single peak before any Python objects are built. Works on (H, W) maps and on
+    stacked (n, H, W) maps (neighbourhoods never cross maps).
+
+    Args:
+        scores: Score map(s), spatial axes last
+        threshold: Minimum score to consider
+
+    Returns:
+        Index arrays like np.nonzero, in row-major order
+    """
+    # flatnonzero + unravel_index is several times faster than nonzero on large n-d masks
+    candidates = np.unravel_index(np.flatnonzero(scores.reshape(-1) >= threshold), scores.shape)
+    if candidates[0].size == 0:
+        return candidates
+
+    height, width = scores.shape[-2:]
+    *leading, ys, xs = candidates
+    values = scores[candidates]
+    is_peak = np.ones(len(ys), dtype=bool)
+
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            if dy == 0 and dx == 0:
+                continue
+            # Clipping maps out-of-range neighbours onto the candidate or its edge, never higher
+            neighbour_ys = np.clip(ys + dy, 0, height - 1)
+            neighbour_xs = np.clip(xs + dx, 0, width - 1)
+            is_peak &= values >= scores[(*leading, neighbour_ys, neighbour_xs)]
+
+    return tuple(axis[is_peak] for axis in candidates)
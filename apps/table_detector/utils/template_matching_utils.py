@@ -1,10 +1,12 @@
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 
+import cv2
 import numpy as np
 from loguru import logger
 
-from table_detector.utils.opencv_utils import match_template_at_scale
+from table_detector.domain.template_stack import TemplateStack
+from table_detector.services.matching_executor import MatchingExecutor
+from table_detector.utils.opencv_utils import match_template_at_scale, find_score_peaks
 
 
 def find_template_matches_parallel(
@@ -14,7 +16,8 @@ def find_template_matches_parallel(
         scale_factors: List[float] = None,
         match_threshold: float = 0.955,
         min_card_size: int = 20,
-        max_workers: int = 4
+        max_workers: int = 4,
+        template_cache=None
 ) -> List[Dict]:
     """
     Find matches for all templates in the image using parallel execution
@@ -26,7 +29,8 @@ def find_template_matches_parallel(
         scale_factors: List of scale factors to try
         match_threshold: Minimum match score to consider
         min_card_size: Minimum card size in pixels
-        max_workers: Maximum number of parallel workers
+        max_workers: Unused, the shared MatchingExecutor is sized by MATCHING_WORKERS
+        template_cache: Optional TemplateRegistry serving pre-resized templates
 
     Returns:
         List of detection dictionaries
@@ -36,21 +40,21 @@ def find_template_matches_parallel(
 
     all_detections = []
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all template matching tasks in parallel
-        futures = []
-        for template_name, template in templates.items():
-            future = executor.submit(
-                find_single_template_matches,
-                image, template, template_name,
-                search_region, scale_factors, match_threshold, min_card_size
-            )
-            futures.append(future)
+    # Submit all template matching tasks to the shared matching pool
+    executor = MatchingExecutor.get()
+    futures = []
+    for template_name, template in templates.items():
+        future = executor.submit(
+            find_single_template_matches,
+            image, template, template_name,
+            search_region, scale_factors, match_threshold, min_card_size, template_cache
+        )
+        futures.append(future)
 
-        # Collect results
-        for future in futures:
-            detections = future.result()
-            all_detections.extend(detections)
+    # Collect results
+    for future in futures:
+        detections = future.result()
+        all_detections.extend(detections)
 
     return all_detections
 
@@ -62,7 +66,8 @@ def find_single_template_matches(
         search_region: Tuple[float, float, float, float] = None,
         scale_factors: List[float] = None,
         match_threshold: float = 0.955,
-        min_card_size: int = 20
+        min_card_size: int = 20,
+        template_cache=None
 ) -> List[Dict]:
     if scale_factors is None:
         scale_factors = [1.0]
@@ -73,9 +78,13 @@ def find_single_template_matches(
         template_h, template_w = template.shape[:2]
 
         for scale in scale_factors:
+            scaled_template = None
+            if template_cache is not None:
+                scaled_template = template_cache.get_scaled_template(template_name, template, scale)
+
             scale_detections = match_template_at_scale(
                 search_image, template, template_name, scale,
-                template_w, template_h, offset, match_threshold, min_card_size
+                template_w, template_h, offset, match_threshold, min_card_size, scaled_template
             )
             detections.extend(scale_detections)
 
@@ -86,6 +95,129 @@ def find_single_template_matches(
     return detections
 
 
+def match_template_stack(
+        search_image: np.ndarray,
+        stack: TemplateStack,
+        grayscale: bool = False
+) -> np.ndarray:
+    """
+    Score a search image against every template of a stack at once
+
+    The cross-correlation of all templates is computed in the frequency domain,
+    reusing a single transform of the search image and the template spectra
+    cached on the stack. The result is normalized exactly like
+    cv2.TM_CCORR_NORMED.
+
+    Args:
+        search_image: Image region to search in (BGR)
+        stack: Same-size templates to score
+        grayscale: Match the grayscale variants instead of color
+
+    Returns:
+        Score maps of shape (templates, H - h + 1, W - w + 1), empty if the
+        templates do not fit into the search image
+    """
+    height, width = search_image.shape[:2]
+    template_h, template_w = stack.height, stack.width
+    if template_h > height or template_w > width:
+        return np.empty((len(stack), 0, 0), dtype=np.float32)
+
+    if grayscale:
+        region = cv2.cvtColor(search_image, cv2.COLOR_BGR2GRAY).astype(np.float32)[..., None]
+    else:
+        region = search_image.astype(np.float32)
+
+    fft_shape = (cv2.getOptimalDFTSize(height), cv2.getOptimalDFTSize(width))
+    template_spectra = stack.get_spectra(fft_shape, grayscale)
+    image_spectra = np.moveaxis(np.fft.rfft2(region, s=fft_shape, axes=(0, 1)), -1, 0)
+
+    product = template_spectra[0] * image_spectra[0]
+    for channel in range(1, len(image_spectra)):
+        product += template_spectra[channel] * image_spectra[channel]
+
+    correlation = np.fft.irfft2(product, s=fft_shape, axes=(1, 2))
+    correlation = correlation[:, template_h - 1:height, template_w - 1:width]
+
+    # Sum of squares under every window via an integral image
+    squares = cv2.integral(np.square(region, dtype=np.float64).sum(axis=-1))
+    window_energy = (squares[template_h:, template_w:] - squares[:-template_h, template_w:]
+                     - squares[template_h:, :-template_w] + squares[:-template_h, :-template_w])
+    denominator = np.sqrt(np.maximum(window_energy, 0))[None] * stack.get_norms(grayscale)[:, None, None]
+
+    scores = np.zeros(correlation.shape, dtype=np.float32)
+    np.divide(correlation, denominator, out=scores, where=denominator > 0)
+    return scores
+
+
+def find_template_stack_matches(
+        image: np.ndarray,
+        stack: TemplateStack,
+        search_region: Tuple[float, float, float, float] = None,
+        match_threshold: float = 0.955,
+        grayscale: bool = False
+) -> List[Dict]:
+    template_indices, boxes, scores = find_template_stack_peaks(
+        image, stack, search_region, match_threshold, grayscale
+    )
+    return [
+        stack_peak_to_detection(stack, template_index, box, score)
+        for template_index, box, score in zip(template_indices.tolist(), boxes.tolist(), scores.tolist())
+    ]
+
+
+def find_template_stack_peaks(
+        image: np.ndarray,
+        stack: TemplateStack,
+        search_region: Tuple[float, float, float, float] = None,
+        match_threshold: float = 0.955,
+        grayscale: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Local score maxima of a whole stack as arrays
+
+    Args:
+        image: Input image
+        stack: Templates to match
+        search_region: (left, top, right, bottom) as ratios of image size
+        match_threshold: Minimum match score to consider
+        grayscale: Match on grayscale instead of color
+
+    Returns:
+        (template_indices, boxes, scores) with boxes as (x, y, w, h) rows in image coordinates
+    """
+    search_image, offset = extract_search_region(image, search_region)
+    scores = match_template_stack(search_image, stack, grayscale)
+    if scores.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty((0, 4), dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    template_indices, ys, xs = find_score_peaks(scores, match_threshold)
+    template_w, template_h = stack.size
+    boxes = np.empty((len(xs), 4), dtype=np.int64)
+    boxes[:, 0] = xs + offset[0]
+    boxes[:, 1] = ys + offset[1]
+    boxes[:, 2] = template_w
+    boxes[:, 3] = template_h
+    return template_indices, boxes, scores[template_indices, ys, xs]
+
+
+def stack_peak_to_detection(
+        stack: TemplateStack,
+        template_index: int,
+        box: Tuple[int, int, int, int],
+        score: float
+) -> Dict:
+    left, top, template_w, template_h = (int(v) for v in box)
+    return {
+        'template_name': stack.names[template_index],
+        'match_score': float(score),
+        'bounding_rect': (left, top, template_w, template_h),
+        'center': (left + template_w // 2, top + template_h // 2),
+        'scale': stack.scale,
+        'template_size': stack.template_size,
+        'scaled_size': (template_w, template_h)
+    }
+
+
 def extract_search_region(
         image: np.ndarray,
         search_region: Tuple[float, float, float, float] = None
@@ -120,15 +252,59 @@ def filter_overlapping_detections(
     if not detections:
         return []
 
-    # Sort by match score (highest first)
-    detections.sort(key=lambda x: x['match_score'], reverse=True)
-    filtered = []
+    boxes = np.array([d['bounding_rect'] for d in detections], dtype=np.int64)
+    scores = np.array([d['match_score'] for d in detections], dtype=np.float64)
+    keep = non_max_suppression(boxes, scores, overlap_threshold)
+
+    return [detections[i] for i in keep]
+
+
+def non_max_suppression(
+        boxes: np.ndarray,
+        scores: np.ndarray,
+        overlap_threshold: float = 0.3
+) -> List[int]:
+    """
+    Greedy non-maximum suppression on box arrays
+
+    Same result as accepting detections by descending score and dropping any that
+    overlap an accepted one by more than ``overlap_threshold`` (IoU), but each
+    accepted box is compared with all remaining boxes in one vectorized step.
+
+    Args:
+        boxes: (N, 4) array of (x, y, width, height)
+        scores: (N,) match scores
+        overlap_threshold: Maximum allowed overlap ratio
+
+    Returns:
+        Indices of the kept boxes, highest score first
+    """
+    if len(boxes) == 0:
+        return []
+
+    boxes = np.asarray(boxes, dtype=np.float64)
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    x2, y2 = x1 + boxes[:, 2], y1 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+
+    # Stable so equal scores keep their input order, like list.sort
+    order = np.argsort(-np.asarray(scores), kind='stable')
+    keep = []
 
-    for detection in detections:
-        if not overlaps_with_existing(detection, filtered, overlap_threshold):
-            filtered.append(detection)
+    while order.size > 0:
+        current = order[0]
+        keep.append(int(current))
+        rest = order[1:]
 
-    return filtered
+        x_overlap = np.maximum(0.0, np.minimum(x2[current], x2[rest]) - np.maximum(x1[current], x1[rest]))
+        y_overlap = np.maximum(0.0, np.minimum(y2[current], y2[rest]) - np.maximum(y1[current], y1[rest]))
+        intersection = x_overlap * y_overlap
+        union = areas[current] + areas[rest] - intersection
+        overlap = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+        order = rest[overlap <= overlap_threshold]
+
+    return keep
 
 
 def overlaps_with_existing(
@@ -208,4 +384,219 @@ def sort_detections_by_position(
     elif sort_by == 'y':
         return sorted(detections, key=lambda d: d['center'][1])
     else:
-        raise ValueError(f"Invalid sort_by value: {sort_by}")
\ No newline at end of file
+        raise ValueError(f"Invalid sort_by value: {sort_by}")
+
+
+def is_card_slot_occupied(
+        image: np.ndarray,
+        slot: Tuple[int, int, int, int],
+        brightness_threshold: int = 200,
+        min_bright_ratio: float = 0.05
+) -> bool:
+    """
+    Cheap occupancy check for a fixed card slot
+
+    Card faces are mostly white while the empty felt is dark green, so the share
+    of bright pixels inside the slot separates the two cases without matching.
+
+    Args:
+        image: Full table image
+        slot: (x, y, width, height) of the card slot
+        brightness_threshold: Grayscale value above which a pixel counts as bright
+        min_bright_ratio: Minimum share of bright pixels for an occupied slot
+
+    Returns:
+        True if a card is likely present in the slot
+    """
+    x, y, w, h = slot
+    region = image[y:y + h, x:x + w]
+    if region.size == 0:
+        return False
+
+    gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY) if region.ndim == 3 else region
+    return np.count_nonzero(gray > brightness_threshold) >= min_bright_ratio * gray.size
+
+
+def classify_card_slot(
+        image: np.ndarray,
+        stacks: List[TemplateStack],
+        slot: Tuple[int, int, int, int],
+        margin: int = 3,
+        match_threshold: float = 0.955
+) -> Optional[Dict]:
+    """
+    Classify the card in a fixed slot against all templates at once
+
+    Every template-sized window inside the slot (expanded by ``margin`` to absorb
+    a pixel or two of jitter) is scored against every template of a stack in one
+    matrix product. The score is the same normalized cross-correlation that
+    cv2.TM_CCORR_NORMED computes.
+
+    Args:
+        image: Full table image
+        stacks: Template stacks of the card category
+        slot: (x, y, width, height) of the card slot
+        margin: Extra pixels searched around the slot on every side
+        match_threshold: Minimum match score to consider
+
+    Returns:
+        Detection dictionary for the best match, or None if nothing passes the threshold
+    """
+    x, y, w, h = slot
+    region, x1, y1 = _crop_with_margin(image, (x, y, w, h), margin)
+
+    best = None
+    for stack in stacks:
+        match = best_stack_window_match(region, stack)
+        if match is None:
+            continue
+
+        match_score, template_index, match_x, match_y = match
+        if match_score < match_threshold or (best is not None and match_score <= best['match_score']):
+            continue
+
+        template_w, template_h = stack.size
+        left, top = x1 + match_x, y1 + match_y
+        best = {
+            'template_name': stack.names[template_index],
+            'match_score': match_score,
+            'bounding_rect': (left, top, template_w, template_h),
+            'center': (left + template_w // 2, top + template_h // 2),
+            'scale': 1.0,
+            'template_size': (template_w, template_h),
+            'scaled_size': (template_w, template_h)
+        }
+
+    return best
+
+
+def best_stack_window_match(
+        region: np.ndarray,
+        stack: TemplateStack
+) -> Optional[Tuple[float, int, int, int]]:
+    """
+    Best TM_CCORR_NORMED match of a whole stack over a small region
+
+    Every template-sized window of the region is scored against every template
+    of the stack in one matrix product, which beats FFT matching for regions only
+    a few pixels larger than the templates.
+
+    Args:
+        region: Search region with the same channel count as the stack
+        stack: Templates to score
+
+    Returns:
+        (match_score, template_index, x, y) of the best window, or None if the
+        templates do not fit into the region
+    """
+    template_w, template_h = stack.size
+    if template_h > region.shape[0] or template_w > region.shape[1]:
+        return None
+
+    region = region.astype(np.float32)
+    if region.ndim == 2:
+        region = region[..., None]
+
+    windows = np.lib.stride_tricks.sliding_window_view(region, (template_h, template_w), axis=(0, 1))
+    rows, cols = windows.shape[:2]
+    # sliding_window_view puts the window axes last: (rows, cols, C, h, w) -> (rows, cols, h, w, C)
+    windows = np.moveaxis(windows, 2, -1).reshape(rows * cols, -1)
+    window_norms = np.linalg.norm(windows, axis=1)
+
+    denominator = np.outer(window_norms, stack.norms)
+    correlation = windows @ stack.templates.reshape(len(stack), -1).T
+    scores = np.divide(correlation, denominator, out=np.zeros_like(denominator), where=denominator > 0)
+
+    window_index, template_index = np.unravel_index(np.argmax(scores), scores.shape)
+    match_y, match_x = divmod(int(window_index), cols)
+    return float(scores[window_index, template_index]), int(template_index), match_x, match_y
+
+
+def recognize_card_glyphs(
+        image: np.ndarray,
+        slot: Tuple[int, int, int, int],
+        rank_stacks: List[TemplateStack],
+        suit_stacks: List[TemplateStack],
+        rank_box: Tuple[int, int, int, int],
+        suit_box: Tuple[int, int, int, int],
+        margin: int = 2,
+        rank_threshold: float = 0.9,
+        suit_threshold: float = 0.96
+) -> Optional[Dict]:
+    """
+    Recognize the card in a fixed slot from its rank and suit glyphs
+
+    Instead of scoring all 52 card templates, the rank glyph is matched against
+    13 rank templates on the channel minimum (so the four-color deck does not
+    matter) and the suit glyph against 4 color suit templates. Both scores must
+    pass their thresholds, which doubles as the occupancy check.
+
+    Args:
+        image: Full table image
+        slot: (x, y, width, height) of the card slot
+        rank_stacks: Single-channel rank glyph stacks
+        suit_stacks: Color suit glyph stacks
+        rank_box: (x, y, width, height) of the rank glyph inside the card
+        suit_box: (x, y, width, height) of the suit glyph inside the card
+        margin: Extra pixels searched around each glyph box on every side
+        rank_threshold: Minimum rank glyph score
+        suit_threshold: Minimum suit glyph score
+
+    Returns:
+        Detection dictionary named rank + suit (e.g. 'TH'), or None for an empty slot
+    """
+    x, y, w, h = slot
+
+    rank_region, rank_x1, rank_y1 = _crop_with_margin(
+        image, (x + rank_box[0], y + rank_box[1], rank_box[2], rank_box[3]), margin)
+    if rank_region.size == 0:
+        return None
+    rank = _best_glyph(rank_region.min(axis=2) if rank_region.ndim == 3 else rank_region, rank_stacks)
+    if rank is None or rank[0] < rank_threshold:
+        return None
+
+    suit_region, _, _ = _crop_with_margin(
+        image, (x + suit_box[0], y + suit_box[1], suit_box[2], suit_box[3]), margin)
+    if suit_region.size == 0:
+        return None
+    suit = _best_glyph(suit_region, suit_stacks)
+    if suit is None or suit[0] < suit_threshold:
+        return None
+
+    rank_score, rank_name, rank_x, rank_y = rank
+    suit_score, suit_name, _, _ = suit
+
+    # Align the card rectangle with where the rank glyph was actually found
+    left = rank_x1 + rank_x - rank_box[0]
+    top = rank_y1 + rank_y - rank_box[1]
+    return {
+        'template_name': rank_name + suit_name,
+        'match_score': min(rank_score, suit_score),
+        'bounding_rect': (left, top, w, h),
+        'center': (left + w // 2, top + h // 2),
+        'scale': 1.0,
+        'template_size': (w, h),
+        'scaled_size': (w, h)
+    }
+
+
+def _best_glyph(region: np.ndarray, stacks: List[TemplateStack]) -> Optional[Tuple[float, str, int, int]]:
+    best = None
+    for stack in stacks:
+        match = best_stack_window_match(region, stack)
+        if match is not None and (best is None or match[0] > best[0]):
+            match_score, template_index, match_x, match_y = match
+            best = (match_score, stack.names[template_index], match_x, match_y)
+    return best
+
+
+def _crop_with_margin(
+        image: np.ndarray,
+        rect: Tuple[int, int, int, int],
+        margin: int
+) -> Tuple[np.ndarray, int, int]:
+    x, y, w, h = rect
+    image_h, image_w = image.shape[:2]
+    x1, y1 = max(0, x - margin), max(0, y - margin)
+    x2, y2 = min(image_w, x + w + margin), min(image_h, y + h + margin)
+    return image[y1:y2, x1:x2], x1, y1
@@ -2,18 +2,39 @@ import ctypes
 import os
 import sys
 from datetime import datetime
+from typing import Optional, Tuple
 
+import numpy as np
 from PIL import Image, ImageGrab
 from loguru import logger
 
 
 def careful_capture_window(hwnd, width, height):
+    """Carefully capture a window using PrintWindow API with proper resource handling"""
+    captured = _print_window_bits(hwnd, width, height)
+    if captured is None:
+        return None
+
+    bmpstr, bmp_width, bmp_height = captured
+    return Image.frombuffer('RGB', (bmp_width, bmp_height), bmpstr, 'raw', 'BGRX', 0, 1)
+
+
+def capture_window_frame(hwnd, width, height) -> Optional[np.ndarray]:
+    """Capture a window as a read-only BGRX NumPy view over the PrintWindow bitmap bits (no copies)"""
+    captured = _print_window_bits(hwnd, width, height)
+    if captured is None:
+        return None
+
+    bmpstr, bmp_width, bmp_height = captured
+    return np.frombuffer(bmpstr, dtype=np.uint8).reshape(bmp_height, bmp_width, 4)
+
+
+def _print_window_bits(hwnd, width, height) -> Optional[Tuple[bytes, int, int]]:
     import win32gui
     import win32process
     import win32con
     import win32ui
 
-    """Carefully capture a window using PrintWindow API with proper resource handling"""
     try:
         # Make sure dimensions are valid
         if width <= 0 or height <= 0:
@@ -58,17 +79,11 @@ def careful_capture_window(hwnd, width, height):
             if result == 0:
                 return None
 
-            # 10. Get bitmap info and bits
+            # 10. Get bitmap info and bits (32-bit BGRX rows, top-down)
             bmpinfo = saveBitMap.GetInfo()
             bmpstr = saveBitMap.GetBitmapBits(True)
 
-            # 11. Create PIL Image
-            img = Image.frombuffer(
-                'RGB',
-                (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                bmpstr, 'raw', 'BGRX', 0, 1)
-
-            return img
+            return bmpstr, bmpinfo['bmWidth'], bmpinfo['bmHeight']
 
         finally:
             # 12. Clean up resources in reverse order
@@ -115,6 +130,7 @@ def capture_screen_region(rect):
 
 def get_window_info():
     import win32gui
+    import win32process
 
     """Get info about all visible, non-minimized windows"""
     window_info = []